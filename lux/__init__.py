@@ -22,6 +22,7 @@ from ._version import __version__, version_info
 from lux._config import config
 from lux._config.config import warning_format
 from lux.utils.debug_utils import debug_info, check_luxwidget_enabled
+from lux.utils.parquet_utils import read_parquet
 
 from lux._config import Config
 
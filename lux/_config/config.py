@@ -7,6 +7,8 @@ from typing import Any, Callable, Dict, Iterable, List, Optional, Union
 import lux
 import warnings
 from lux.utils.tracing_utils import LuxTracer
+from lux.utils.invalidation_utils import InvalidationCounter
+from lux.utils.metadata_cache import MetadataCache
 import os
 from lux._config.template import postgres_template, mysql_template
 
@@ -39,6 +41,8 @@ class Config:
         self.heatmap_bin_size = 40
         self.tracer_relevant_lines = []
         self.tracer = LuxTracer()
+        # counts invalidations of cached metadata and recommendations, by cause
+        self.invalidations = InvalidationCounter()
         self.query_templates = {}
         self.handle_quotes = True
         #####################################
@@ -56,6 +60,15 @@ class Config:
         self.early_pruning_sample_start = self.early_pruning_sample_cap * 1.5
         self.streaming = False
         self.render_widget = True
+        self._sketch_metadata = False
+        self._unique_values_threshold = 10000
+        self._heavy_hitters_cap = 100
+        self._value_counts = False
+        self._metadata_workers = 1
+        self._metadata_cache_dir = None
+        self._metadata_cache_size = 256 * 1024 * 1024
+        self._metadata_cache = None
+        self._predicate_cache_size = 64 * 1024 * 1024
 
     @property
     def number_of_bars(self):
@@ -267,6 +280,232 @@ class Config:
                 stacklevel=2,
             )
 
+    @property
+    def sketch_metadata(self):
+        """
+        Parameters
+        ----------
+        sketch_flag : bool
+            Whether or not high-cardinality columns keep only an estimated cardinality and a capped
+            list of their most frequent values instead of the full list of unique values.
+        """
+        return self._sketch_metadata
+
+    @sketch_metadata.setter
+    def sketch_metadata(self, sketch_flag: bool) -> None:
+        """
+        Parameters
+        ----------
+        sketch_flag : bool
+            Whether or not high-cardinality columns keep only an estimated cardinality and a capped
+            list of their most frequent values instead of the full list of unique values.
+        """
+        if type(sketch_flag) == bool:
+            self._sketch_metadata = sketch_flag
+        else:
+            warnings.warn(
+                "The flag for sketching metadata must be a boolean.",
+                stacklevel=2,
+            )
+
+    @property
+    def unique_values_threshold(self):
+        """
+        Parameters
+        ----------
+        threshold : int
+            Largest cardinality for which the exact list of unique values is kept when sketch_metadata is enabled
+        """
+        return self._unique_values_threshold
+
+    @unique_values_threshold.setter
+    def unique_values_threshold(self, threshold: int) -> None:
+        """
+        Parameters
+        ----------
+        threshold : int
+            Largest cardinality for which the exact list of unique values is kept when sketch_metadata is enabled
+        """
+        if type(threshold) == int and threshold > 0:
+            self._unique_values_threshold = threshold
+        else:
+            warnings.warn(
+                "The unique values threshold must be a positive integer.",
+                stacklevel=2,
+            )
+
+    @property
+    def heavy_hitters_cap(self):
+        """
+        Parameters
+        ----------
+        k : int
+            Number of most frequent values kept for columns above the unique values threshold
+        """
+        return self._heavy_hitters_cap
+
+    @heavy_hitters_cap.setter
+    def heavy_hitters_cap(self, k: int) -> None:
+        """
+        Parameters
+        ----------
+        k : int
+            Number of most frequent values kept for columns above the unique values threshold
+        """
+        if type(k) == int and k > 0:
+            self._heavy_hitters_cap = k
+        else:
+            warnings.warn(
+                "The cap on the number of most frequent values must be a positive integer.",
+                stacklevel=2,
+            )
+
+    @property
+    def value_counts(self):
+        """
+        Parameters
+        ----------
+        value_counts_flag : bool
+            Whether or not the metadata keeps the number of occurrences of each unique value, from which
+            bar charts of the number of records per value (e.g., in the Occurrence action) are served.
+        """
+        return self._value_counts
+
+    @value_counts.setter
+    def value_counts(self, value_counts_flag: bool) -> None:
+        """
+        Parameters
+        ----------
+        value_counts_flag : bool
+            Whether or not the metadata keeps the number of occurrences of each unique value, from which
+            bar charts of the number of records per value (e.g., in the Occurrence action) are served.
+        """
+        if type(value_counts_flag) == bool:
+            self._value_counts = value_counts_flag
+        else:
+            warnings.warn(
+                "The flag for keeping value counts must be a boolean.",
+                stacklevel=2,
+            )
+
+    @property
+    def metadata_workers(self):
+        """
+        Parameters
+        ----------
+        workers : int
+            Number of threads used to compute metadata across columns (1 computes it serially)
+        """
+        return self._metadata_workers
+
+    @metadata_workers.setter
+    def metadata_workers(self, workers: int) -> None:
+        """
+        Parameters
+        ----------
+        workers : int
+            Number of threads used to compute metadata across columns (1 computes it serially)
+        """
+        if type(workers) == int and workers > 0:
+            self._metadata_workers = workers
+        else:
+            warnings.warn(
+                "The number of metadata workers must be a positive integer.",
+                stacklevel=2,
+            )
+
+    @property
+    def metadata_cache_dir(self):
+        """
+        Parameters
+        ----------
+        directory : str
+            Directory of the on-disk metadata cache shared across sessions (None disables the cache)
+        """
+        return self._metadata_cache_dir
+
+    @metadata_cache_dir.setter
+    def metadata_cache_dir(self, directory: str) -> None:
+        """
+        Parameters
+        ----------
+        directory : str
+            Directory of the on-disk metadata cache shared across sessions (None disables the cache)
+        """
+        if directory is None:
+            self._metadata_cache_dir = None
+            self._metadata_cache = None
+        elif isinstance(directory, (str, os.PathLike)):
+            self._metadata_cache_dir = os.fspath(directory)
+            self._metadata_cache = MetadataCache(self._metadata_cache_dir, self._metadata_cache_size)
+        else:
+            warnings.warn(
+                "The metadata cache directory must be a path or None.",
+                stacklevel=2,
+            )
+
+    @property
+    def metadata_cache_size(self):
+        """
+        Parameters
+        ----------
+        size : int
+            Maximum size in bytes of the on-disk metadata cache before least recently used entries are evicted
+        """
+        return self._metadata_cache_size
+
+    @metadata_cache_size.setter
+    def metadata_cache_size(self, size: int) -> None:
+        """
+        Parameters
+        ----------
+        size : int
+            Maximum size in bytes of the on-disk metadata cache before least recently used entries are evicted
+        """
+        if type(size) == int and size >= 0:
+            self._metadata_cache_size = size
+            if self._metadata_cache is not None:
+                self._metadata_cache.max_size = size
+                self._metadata_cache.evict()
+        else:
+            warnings.warn(
+                "The metadata cache size must be a non-negative integer.",
+                stacklevel=2,
+            )
+
+    @property
+    def predicate_cache_size(self):
+        """
+        Parameters
+        ----------
+        size : int
+            Maximum size in bytes of the filter masks cached on each dataframe before least recently used masks are evicted (0 disables the cache)
+        """
+        return self._predicate_cache_size
+
+    @predicate_cache_size.setter
+    def predicate_cache_size(self, size: int) -> None:
+        """
+        Parameters
+        ----------
+        size : int
+            Maximum size in bytes of the filter masks cached on each dataframe before least recently used masks are evicted (0 disables the cache)
+        """
+        if type(size) == int and size >= 0:
+            self._predicate_cache_size = size
+        else:
+            warnings.warn(
+                "The predicate cache size must be a non-negative integer.",
+                stacklevel=2,
+            )
+
+    @property
+    def metadata_cache(self):
+        """
+        The on-disk metadata cache (lux.utils.metadata_cache.MetadataCache), or None if disabled
+        """
+        return self._metadata_cache
+
     @property
     def heatmap(self):
         """
@@ -454,8 +693,18 @@ class Config:
 
             self.SQLconnection = ""
             self.executor = PandasExecutor()
+        elif exe == "Polars":
+            from lux.executor.PolarsExecutor import PolarsExecutor
+
+            self.SQLconnection = ""
+            self.executor = PolarsExecutor()
+        elif exe == "DuckDB":
+            from lux.executor.DuckDBExecutor import DuckDBExecutor
+
+            self.SQLconnection = ""
+            self.executor = DuckDBExecutor()
         else:
-            raise ValueError("Executor type must be either 'Pandas' or 'SQL'")
+            raise ValueError("Executor type must be either 'Pandas', 'Polars', 'DuckDB' or 'SQL'")
 
 
 def warning_format(message, category, filename, lineno, file=None, line=None):
@@ -17,6 +17,7 @@ from lux.interestingness.interestingness import interestingness
 from lux.processor.Compiler import Compiler
 from lux.core.frame import LuxDataFrame
 from lux.vis.VisList import VisList
+from lux.vis.Vis import Vis
 from lux.utils import utils
 
 
@@ -25,6 +26,9 @@ def correlation(ldf: LuxDataFrame, ignore_transpose: bool = True):
     """
     Generates bivariate visualizations that represent all pairwise relationships in the data.
 
+    With the PandasExecutor, the pairs are ranked from a single correlation matrix of the measures,
+    and only the top-k pairs are materialized as visualizations.
+
     Parameters
     ----------
     ldf : LuxDataFrame
@@ -39,27 +43,21 @@ def correlation(ldf: LuxDataFrame, ignore_transpose: bool = True):
             object with a collection of visualizations that result from the Correlation action.
     """
 
-    import numpy as np
-
     filter_specs = utils.get_filter_specs(ldf._intent)
     intent = [
         lux.Clause("?", data_model="measure"),
         lux.Clause("?", data_model="measure"),
     ]
     intent.extend(filter_specs)
+    if lux.config.executor.name in utils.IN_MEMORY_EXECUTORS:
+        return correlation_from_matrix(ldf, intent, ignore_transpose)
     vlist = VisList(intent, ldf)
     examples = ""
     if len(vlist) > 1:
         measures = vlist[0].get_attr_by_data_model("measure")
         if len(measures) >= 2:
             examples = f" (e.g., {measures[0].attribute}, {measures[1].attribute})"
-    recommendation = {
-        "action": "Correlation",
-        "description": "Show relationships between two <p class='highlight-descriptor'>quantitative</p> attributes.",
-        "long_description": f"Correlation searches through all pairwise relationship between two quantitative attributes\
-            {examples}. The visualizations are ranked from most to least linearly correlated based on \
-                their Pearson’s correlation score.",
-    }
+    recommendation = correlation_recommendation(examples)
     ignore_rec_flag = False
     # Doesn't make sense to compute correlation if less than 4 data values
     if len(ldf) < 5:
@@ -90,6 +88,114 @@ def correlation(ldf: LuxDataFrame, ignore_transpose: bool = True):
     return recommendation
 
 
+def correlation_recommendation(examples: str) -> dict:
+    return {
+        "action": "Correlation",
+        "description": "Show relationships between two <p class='highlight-descriptor'>quantitative</p> attributes.",
+        "long_description": f"Correlation searches through all pairwise relationship between two quantitative attributes\
+            {examples}. The visualizations are ranked from most to least linearly correlated based on \
+                their Pearson’s correlation score.",
+    }
+
+
+def correlation_from_matrix(ldf: LuxDataFrame, intent: list, ignore_transpose: bool = True):
+    """
+    Correlation action computed from one correlation matrix of the measures of the (sampled and
+    filtered) data, instead of executing and scoring a scatterplot for every pair of measures.
+    Pairs are enumerated, scored and ranked as the scatterplots of the VisList of `intent` would be,
+    and only the top-k pairs are executed.
+
+    Parameters
+    ----------
+    ldf : LuxDataFrame
+            LuxDataFrame with underspecified intent.
+    intent : list
+            Two measure wildcards followed by the filters of the dataframe's intent
+    ignore_transpose: bool
+            Boolean flag to only keep one of the pairs {X,Y} and {Y,X}
+
+    Returns
+    -------
+    recommendations : Dict[str,obj]
+            object with a collection of visualizations that result from the Correlation action.
+    """
+    import copy
+    from lux.executor.PandasExecutor import PandasExecutor
+    from lux.interestingness.interestingness import correlation_matrix
+    from lux.processor.Parser import Parser
+    from lux.processor.Validator import Validator
+
+    ldf.maintain_metadata()
+    inferred_intent = Parser.parse(intent)
+    Validator.validate_intent(inferred_intent, ldf)
+    options = Compiler.populate_wildcard_options(inferred_intent, ldf)
+    x_options, y_options = options["attributes"]
+    # like `Compiler.remove_all_invalid`, scatterplots cannot be filtered on a temporal attribute,
+    # nor on one of their measures
+    filters = options["filters"] or [None]
+    filters = [row for row in filters if row is None or ldf.data_type.get(row.attribute) != "temporal"]
+    pairs = [(x, y) for x in x_options for y in y_options if x.attribute != y.attribute]
+
+    examples = ""
+    if len(pairs) > 1:
+        examples = f" (e.g., {pairs[0][0].attribute}, {pairs[0][1].attribute})"
+    recommendation = correlation_recommendation(examples)
+    # Doesn't make sense to compute correlation if less than 4 data values
+    if len(ldf) < 5 or len(pairs) == 0:
+        recommendation["collection"] = []
+        return recommendation
+
+    PandasExecutor.execute_sampling(ldf)
+    measures = list(dict.fromkeys(clause.attribute for clause in x_options + y_options))
+    position = {attr: i for i, attr in enumerate(measures)}
+    scores = []
+    for row in filters:
+        data = ldf._sampled
+        if row is not None:
+            data = PandasExecutor.apply_filter(data, row.attribute, row.filter_op, row.value)
+        if len(data) < 10:
+            # scatterplots of less than 10 points are not recommended
+            scores.append(None)
+        else:
+            scores.append(correlation_matrix(data, measures))
+
+    candidates = []
+    seen = set()
+    for x, y in pairs:
+        if ignore_transpose:
+            # {Y,X} is only scored if {X,Y} was not
+            if (y.attribute, x.attribute) in seen:
+                continue
+            seen.add((x.attribute, y.attribute))
+        for i, row in enumerate(filters):
+            if scores[i] is None or (row is not None and row.attribute in (x.attribute, y.attribute)):
+                continue
+            score = scores[i][position[x.attribute], position[y.attribute]]
+            if score != -1:
+                candidates.append((score, x, y, row))
+    if lux.config.sort == "ascending":
+        candidates.sort(key=lambda candidate: candidate[0])
+    elif lux.config.sort != "none":
+        candidates.sort(key=lambda candidate: candidate[0], reverse=True)
+    # like `VisList.showK`
+    k = lux.config.topk
+    if k != False and isinstance(k, int):
+        candidates = candidates[: abs(k)]
+
+    collection = []
+    for score, x, y, row in candidates:
+        vis_intent = [copy.deepcopy(clause) for clause in (x, y, row) if clause is not None]
+        for clause in vis_intent[:2]:
+            # the wildcard is resolved, so that the intent is not parsed back into a wildcard
+            clause.description = ""
+        collection.append(Vis(vis_intent))
+    vlist = VisList(collection, ldf)
+    for vis, candidate in zip(vlist, candidates):
+        vis.score = candidate[0]
+    recommendation["collection"] = vlist
+    return recommendation
+
+
 def check_transpose_not_computed(vlist: VisList, a: str, b: str):
     transpose_exist = list(
         filter(
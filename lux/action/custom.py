@@ -16,6 +16,7 @@ from lux.interestingness.interestingness import interestingness
 import lux
 from lux.executor.PandasExecutor import PandasExecutor
 from lux.executor.SQLExecutor import SQLExecutor
+from lux.utils.utils import IN_MEMORY_EXECUTORS
 import lux
 
 
@@ -50,7 +51,7 @@ def custom(ldf):
     return recommendation
 
 
-def custom_actions(ldf):
+def custom_actions(ldf, action_recs=None):
     """
     Generates user-defined vis based on globally defined actions.
 
@@ -58,23 +59,33 @@ def custom_actions(ldf):
     ----------
     ldf : lux.core.frame
         LuxDataFrame with underspecified intent.
+    action_recs : Dict[str,obj], optional
+        Recommendations from a previous run that are still valid, keyed by action name. These are
+        reused instead of running their action again. Updated in place with the newly generated ones.
 
     Returns
     -------
     recommendations : Dict[str,obj]
         object with a collection of visualizations that were previously registered.
     """
-    if len(lux.config.actions) > 0 and (len(ldf) > 0 or lux.config.executor.name != "PandasExecutor"):
+    if len(lux.config.actions) > 0 and (
+        len(ldf) > 0 or lux.config.executor.name not in IN_MEMORY_EXECUTORS
+    ):
         recommendations = []
         for action_name in lux.config.actions.keys():
             display_condition = lux.config.actions[action_name].display_condition
             if display_condition is None or (display_condition is not None and display_condition(ldf)):
+                if action_recs is not None and action_name in action_recs:
+                    recommendations.append(action_recs[action_name])
+                    continue
                 args = lux.config.actions[action_name].args
                 if args:
                     recommendation = lux.config.actions[action_name].action(ldf, args)
                 else:
                     recommendation = lux.config.actions[action_name].action(ldf)
                 recommendations.append(recommendation)
+                if action_recs is not None:
+                    action_recs[action_name] = recommendation
         return recommendations
     else:
         return []
@@ -133,9 +133,16 @@ def add_filter(ldf):
         arr = ldf[last.attribute].unique().tolist()
         output.append(lux.Clause(last.attribute, last.attribute, arr))
     vlist = lux.vis.VisList.VisList(output, ldf)
-    vlist_copy = lux.vis.VisList.VisList(output, ldf)
-    for i in range(len(vlist_copy)):
-        vlist[i].score = interestingness(vlist_copy[i], ldf)
+    # the unfiltered vis and the filter sizes are the same for every candidate filter
+    overall_cache = {}
+    if recommendation["action"] == "Similarity":
+        # scoring similarity normalizes the vis data, so score a copy of the vis
+        vlist_copy = lux.vis.VisList.VisList(output, ldf)
+        for i in range(len(vlist_copy)):
+            vlist[i].score = interestingness(vlist_copy[i], ldf, overall_cache)
+    else:
+        for vis in vlist:
+            vis.score = interestingness(vis, ldf, overall_cache)
     vlist.sort()
     vlist = vlist.showK()
     if recommendation["action"] == "Similarity":
@@ -86,7 +86,12 @@ def create_temporal_vis(ldf, col):
     vlist : [Vis]
             Collection of Vis objects.
     """
-    formatted_date = pd.to_datetime(ldf[col], format="%Y-%m-%d")
+    parsed_columns = getattr(ldf, "_parsed_columns", None)
+    if parsed_columns and col in parsed_columns:
+        # reuse the datetime conversion made while inferring the column's type
+        formatted_date = parsed_columns[col]
+    else:
+        formatted_date = pd.to_datetime(ldf[col], format="%Y-%m-%d")
 
     overall_vis = Vis([lux.Clause(col, data_type="temporal")], source=ldf, score=5)
 
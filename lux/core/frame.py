@@ -18,17 +18,58 @@ from lux.vis.Clause import Clause
 from lux.vis.Vis import Vis
 from lux.vis.VisList import VisList
 from lux.history.history import History
+from lux.history.lineage import Lineage
 from lux.utils.date_utils import is_datetime_series
 from lux.utils.message import Message
-from lux.utils.utils import check_import_lux_widget
+from lux.utils.metadata_cache import MetadataCache, metadata_fingerprint
+from lux.utils.metadata_snapshot import MetadataSnapshot
+from lux.utils.utils import check_import_lux_widget, IN_MEMORY_EXECUTORS
 from typing import Dict, Union, List, Callable
 
 # from lux.executor.Executor import *
 import warnings
 import traceback
+import weakref
+import re
 import lux
 
 
+def _pandas_version() -> tuple:
+    return tuple(int(part) for part in re.findall(r"\d+", pd.__version__)[:2])
+
+
+# Writes are tracked by overriding private pandas internals: the loc/iloc indexer classes,
+# `NDFrame._maybe_cache_changed` and `DataFrame._set_value`, whose signatures are only relied on
+# for pandas 1.3 to 1.5 (`_maybe_cache_changed` is gone in pandas 2). With other versions, in-place
+# writes are detected by hashing the values when the metadata is maintained (see `_data_replaced`).
+PANDAS_WRITE_TRACKING = (1, 3) <= _pandas_version() < (2, 0)
+
+if PANDAS_WRITE_TRACKING:
+    from pandas.core.indexing import _iLocIndexer, _LocIndexer
+
+    class _LuxLocIndexer(_LocIndexer):
+        def __getitem__(self, key):
+            result = super().__getitem__(key)
+            if isinstance(result, LuxDataFrameMixin):
+                self.obj._derive_metadata(result)
+            return result
+
+        def __setitem__(self, key, value):
+            super().__setitem__(key, value)
+            self.obj._invalidate("indexer write")
+
+    class _LuxiLocIndexer(_iLocIndexer):
+        def __getitem__(self, key):
+            result = super().__getitem__(key)
+            if isinstance(result, LuxDataFrameMixin):
+                self.obj._derive_metadata(result)
+            return result
+
+        def __setitem__(self, key, value):
+            super().__setitem__(key, value)
+            self.obj._invalidate("indexer write")
+
+
 class LuxDataFrameMixin:
     """
     A subclass of pd.DataFrame that supports all dataframe operations while housing other variables and functions for generating visual recommendations.
@@ -43,6 +84,8 @@ class LuxDataFrameMixin:
         "cardinality",
         "_rec_info",
         "_min_max",
+        "_null_count",
+        "_evenly_spaced",
         "_current_vis",
         "_widget",
         "_recommendation",
@@ -57,6 +100,29 @@ class LuxDataFrameMixin:
         "_type_override",
     ]
 
+    # Metadata dictionaries with one entry per column
+    _column_metadata = [
+        "_data_type",
+        "unique_values",
+        "cardinality",
+        "_min_max",
+        "_null_count",
+        "_evenly_spaced",
+        "_value_counts",
+        "_parsed_columns",
+    ]
+
+    # Metadata stored in the on-disk metadata cache
+    _cached_metadata_names = [
+        "_data_type",
+        "unique_values",
+        "cardinality",
+        "_min_max",
+        "_null_count",
+        "_evenly_spaced",
+        "_value_counts",
+    ]
+
     def __init__(self, *args, **kw):
         super().__init__(*args, **kw)
 
@@ -73,7 +139,9 @@ class LuxDataFrameMixin:
         if lux.config.SQLconnection == "":
             from lux.executor.PandasExecutor import PandasExecutor
 
-            lux.config.executor = PandasExecutor()
+            # keep the executor selected with lux.config.set_executor_type (e.g., PolarsExecutor)
+            if not isinstance(lux.config.executor, PandasExecutor):
+                lux.config.executor = PandasExecutor()
         else:
             from lux.executor.SQLExecutor import SQLExecutor
 
@@ -81,6 +149,30 @@ class LuxDataFrameMixin:
 
         self._sampled = None
         self._approx_sample = None
+        # Positions of the sampled rows (see lux.utils.sample_utils.RowSample)
+        self._row_sample = None
+        # Bin codes of the columns of the samples, by sample fingerprint (see PandasExecutor.execute_binning)
+        self._bin_codes = None
+        # Masks of the filters evaluated on the data, by predicate (see lux.utils.predicate_cache)
+        self._predicate_cache = None
+        # Polars frame sharing the columns, by fingerprint (see lux.executor.PolarsExecutor.to_polars)
+        self._polars_frame = None
+        self._parsed_columns = None
+        # Columns whose metadata is out of date (None when everything has to be recomputed),
+        # and the metadata entries of the other columns kept until the next recomputation
+        self._dirty_columns = None
+        self._retained_metadata = None
+        self._data_snapshot = None
+        # Cached fingerprint, and number of in-place modifications of the data (see fingerprint)
+        self._fingerprint = None
+        self._data_version = 0
+        # Columns changed since recommendations were last computed, mapped to their previous data type
+        self._stale_rec_columns = None
+        self._action_recs = None
+        # How the dataframe was derived from a parent whose metadata was computed (see Lineage)
+        self._lineage = None
+        # Statistics of the file the rows were read from (e.g., ParquetMetadata), see attach_file_metadata
+        self._file_metadata = None
         self._toggle_pandas_display = True
         self._message = Message()
         self._pandas_only = False
@@ -89,6 +181,9 @@ class LuxDataFrameMixin:
         self.unique_values = None
         self.cardinality = None
         self._min_max = None
+        self._null_count = None
+        self._evenly_spaced = None
+        self._value_counts = None
         self.pre_aggregated = None
         self._type_override = {}
         warnings.formatwarning = lux.warning_format
@@ -97,6 +192,10 @@ class LuxDataFrameMixin:
     def history(self):
         return self._history
 
+    @property
+    def lineage(self):
+        return getattr(self, "_lineage", None)
+
     @property
     def data_type(self):
         if not self._data_type:
@@ -108,17 +207,130 @@ class LuxDataFrameMixin:
         Compute dataset metadata and statistics
         """
         if len(self) > 0:
-            if lux.config.executor.name != "SQLExecutor":
-                lux.config.executor.compute_stats(self)
-            lux.config.executor.compute_dataset_metadata(self)
-            self._infer_structure()
-            self._metadata_fresh = True
+            executor = lux.config.executor
+            lineage = getattr(self, "_lineage", None)
+            if (
+                getattr(self, "_retained_metadata", None) is not None
+                and executor.name in IN_MEMORY_EXECUTORS
+            ):
+                # only some columns changed since the metadata was last computed
+                for name, entries in self._retained_metadata.items():
+                    setattr(self, name, entries)
+                self._retained_metadata = None
+                self._length = len(self)
+                dirty_columns = [attr for attr in self.columns if attr in self._dirty_columns]
+                if dirty_columns:
+                    executor.compute_stats(self, dirty_columns)
+                # types of changed columns, and of columns whose type depends on statistics that
+                # changed (e.g., after a concatenation), are inferred again
+                untyped_columns = [attr for attr in self.columns if attr not in self._data_type]
+                executor.compute_data_type(self, untyped_columns)
+                self._reorder_metadata()
+            elif lineage is not None and lineage.data_type and executor.name in IN_MEMORY_EXECUTORS:
+                # rows were selected from a dataframe whose data types are known: the statistics
+                # depend on the selected values, but the types that do not are kept
+                executor.compute_stats(self)
+                self._data_type = dict(lineage.data_type)
+                self._parsed_columns = {}
+                executor.compute_data_type(
+                    self, [attr for attr in self.columns if attr not in lineage.data_type]
+                )
+                self._reorder_metadata()
+            else:
+                if executor.name != "SQLExecutor":
+                    executor.compute_stats(self)
+                executor.compute_dataset_metadata(self)
+            self._mark_metadata_fresh()
+
+    def _mark_metadata_fresh(self):
+        self._infer_structure()
+        self._metadata_fresh = True
+        self._dirty_columns = set()
+        self._snapshot_data()
+
+    def _compute_or_load_metadata(self) -> None:
+        """
+        Restore the metadata from the on-disk metadata cache (see `lux.config.metadata_cache_dir`)
+        if a dataframe with the same content and schema was seen before, otherwise compute the
+        metadata and add it to the cache
+        """
+        cache = lux.config.metadata_cache
+        if (
+            cache is None
+            or len(self) == 0
+            or lux.config.executor.name not in IN_MEMORY_EXECUTORS
+            # recomputing only the changed columns is cheaper than a lookup
+            or getattr(self, "_retained_metadata", None) is not None
+        ):
+            self.compute_metadata()
+            return
+        key = metadata_fingerprint(self.to_pandas())
+        metadata = cache.get(key) if key is not None else None
+        if metadata is not None:
+            self._restore_metadata(metadata)
+            return
+        self.compute_metadata()
+        if key is not None:
+            cache.put(key, self._cached_metadata())
+
+    def _cached_metadata(self) -> Dict:
+        metadata = {name: getattr(self, name) for name in self._cached_metadata_names}
+        metadata["type_override"] = dict(self._type_override or {})
+        return metadata
+
+    def _restore_metadata(self, metadata: Dict) -> None:
+        from lux.executor.PandasExecutor import PandasExecutor
+
+        for name in self._cached_metadata_names:
+            setattr(self, name, metadata[name])
+        self._length = len(self)
+        self._parsed_columns = {}
+        # types cached under a different override of the user-specified types are inferred again
+        mismatched = [
+            attr
+            for attr in MetadataCache.mismatched_types(metadata, self._type_override or {})
+            if attr in self.columns
+        ]
+        for attr in mismatched:
+            if not pd.api.types.is_numeric_dtype(self.dtypes[attr]):
+                # min/max of non-numeric columns depend on the inferred type
+                self._min_max.pop(PandasExecutor._attribute_repr(attr), None)
+        if mismatched:
+            lux.config.executor.compute_data_type(self, mismatched)
+        self._mark_metadata_fresh()
+
+    def _reorder_metadata(self):
+        """
+        Order the per-column metadata entries by column position, as a full recomputation would
+        """
+        from lux.executor.PandasExecutor import PandasExecutor
+
+        for name in [
+            "unique_values",
+            "cardinality",
+            "_min_max",
+            "_null_count",
+            "_evenly_spaced",
+            "_value_counts",
+        ]:
+            entries = getattr(self, name) or {}
+            ordered = {}
+            for attr in self.columns:
+                attr_repr = PandasExecutor._attribute_repr(attr)
+                if attr_repr in entries:
+                    ordered[attr_repr] = entries[attr_repr]
+            # keep the entries of the index
+            ordered.update(entries)
+            setattr(self, name, ordered)
+        ordered = {attr: self._data_type[attr] for attr in self.columns if attr in self._data_type}
+        ordered.update(self._data_type)
+        self._data_type = ordered
 
     def maintain_metadata(self):
         """
         Maintain dataset metadata and statistics (Compute only if needed)
         """
-        is_sql_tbl = lux.config.executor.name != "PandasExecutor"
+        is_sql_tbl = lux.config.executor.name not in IN_MEMORY_EXECUTORS
 
         if lux.config.SQLconnection != "" and is_sql_tbl:
             from lux.executor.SQLExecutor import SQLExecutor
@@ -128,11 +340,17 @@ class LuxDataFrameMixin:
         # Check that metadata has not yet been computed
         if lux.config.lazy_maintain:
             # Check that metadata has not yet been computed
+            if (
+                hasattr(self, "_metadata_fresh")
+                and self._metadata_fresh
+                and self._data_replaced(compare_values=True)
+            ):
+                self._invalidate("block manager replaced")
             if not hasattr(self, "_metadata_fresh") or not self._metadata_fresh:
                 # only compute metadata information if the dataframe is non-empty
-                self.compute_metadata()
+                self._compute_or_load_metadata()
         else:
-            self.compute_metadata()
+            self._compute_or_load_metadata()
 
     def expire_recs(self) -> None:
         """
@@ -144,6 +362,12 @@ class LuxDataFrameMixin:
             self._widget = None
             self._rec_info = None
             self._sampled = None
+            self._approx_sample = None
+            self._bin_codes = None
+            self._predicate_cache = None
+            self._polars_frame = None
+            self._stale_rec_columns = None
+            self._action_recs = None
 
     def expire_metadata(self) -> None:
         """
@@ -155,38 +379,396 @@ class LuxDataFrameMixin:
             self.unique_values = None
             self.cardinality = None
             self._min_max = None
+            self._null_count = None
+            self._evenly_spaced = None
+            self._value_counts = None
+            self._parsed_columns = None
             self.pre_aggregated = None
+            self._dirty_columns = None
+            self._retained_metadata = None
+            self._file_metadata = None
+            self._lineage = None
+            self._fingerprint = None
+
+    def expire_columns(self, columns: List) -> None:
+        """
+        Expire the metadata and recommendations that depend on the given columns, after these
+        columns were assigned or dropped. Only the metadata entries of these columns are
+        recomputed the next time the data is required, and recommendations of actions that do
+        not involve these columns (nor their data types) are kept.
+
+        Parameters
+        ----------
+        columns : List
+            Columns whose values changed, were added or were removed
+        """
+        if not lux.config.lazy_maintain:
+            return
+        if getattr(self, "_stale_rec_columns", None) is None:
+            self.expire_recs()
+        else:
+            retained_metadata = getattr(self, "_retained_metadata", None) or {}
+            data_type = self._data_type or retained_metadata.get("_data_type") or {}
+            for attr in columns:
+                self._stale_rec_columns.setdefault(attr, data_type.get(attr))
+            self._recs_fresh = False
+            self._recommendation = {}
+            self._widget = None
+            self._sampled = None
+            self._approx_sample = None
+            self._bin_codes = None
+            self._predicate_cache = None
+            self._polars_frame = None
+
+        if getattr(self, "_dirty_columns", None) is None:
+            self.expire_metadata()
+            return
+        from lux.executor.PandasExecutor import PandasExecutor
+
+        metadata = self._retained_metadata
+        if metadata is None:
+            metadata = {name: getattr(self, name) for name in self._column_metadata}
+        dirty_columns = self._dirty_columns | set(columns)
+        file_metadata = getattr(self, "_file_metadata", None)
+        # reset the metadata as for a full expiry, so that frames derived from this one in the
+        # meantime do not pick up incomplete entries
+        self.expire_metadata()
+        self._dirty_columns = dirty_columns
+        if file_metadata is not None:
+            self._file_metadata = file_metadata.without(columns)
+        attr_reprs = set(columns) | {PandasExecutor._attribute_repr(attr) for attr in columns}
+        self._retained_metadata = {
+            name: {k: v for k, v in (entries or {}).items() if k not in attr_reprs}
+            for name, entries in metadata.items()
+        }
 
     #####################
     ## Override Pandas ##
     #####################
     def __getattr__(self, name):
-        ret_value = super().__getattr__(name)
-        self.expire_metadata()
-        self.expire_recs()
-        return ret_value
+        # Pandas only falls back to `__getattr__` for column lookups such as `df.col`, which are
+        # reads. Writes made through the returned series are caught by `_maybe_cache_changed` (or
+        # by `_data_replaced` without write tracking).
+        return super().__getattr__(name)
+
+    def __getitem__(self, key):
+        result = super().__getitem__(key)
+        # a boolean dataframe key masks values rather than selecting rows or columns
+        if isinstance(result, LuxDataFrameMixin) and not isinstance(key, pd.DataFrame):
+            self._derive_metadata(result)
+        return result
+
+    def __finalize__(self, other, method=None, **kwargs):
+        result = super().__finalize__(other, method=method, **kwargs)
+        # the sample of the other dataframe holds its own rows: a derived dataframe draws its sample,
+        # or reuses the rows of the other sample that it kept (see Lineage)
+        if (
+            getattr(other, "_sampled", None) is not None
+            and getattr(self, "_sampled", None) is other._sampled
+        ):
+            self._sampled = None
+        # rows of dataframes concatenated by pd.concat (or DataFrame.append)
+        if (
+            method == "concat"
+            and getattr(other, "_is_frame", False)
+            and getattr(other, "bm_axis", None) == 1
+        ):
+            self._merge_concat_metadata(other.objs)
+        return result
+
+    def drop(self, *args, **kwargs):
+        result = super().drop(*args, **kwargs)
+        if result is not None:
+            self._derive_metadata(result)
+        return result
 
     def _set_axis(self, axis, labels):
         super()._set_axis(axis, labels)
-        self.expire_metadata()
-        self.expire_recs()
-
-    def _update_inplace(self, *args, **kwargs):
-        super()._update_inplace(*args, **kwargs)
-        self.expire_metadata()
-        self.expire_recs()
+        self._invalidate("axis relabeled")
+
+    def _update_inplace(self, result, *args, **kwargs):
+        # in-place operations that only drop columns (e.g., drop(columns=..., inplace=True))
+        # leave the values of the remaining columns untouched
+        dropped_columns = None
+        if (
+            isinstance(result, pd.DataFrame)
+            and len(result.columns) < len(self.columns)
+            and result.index.equals(self.index)
+            and result.columns.isin(self.columns).all()
+        ):
+            dropped_columns = list(self.columns[~self.columns.isin(result.columns)])
+        super()._update_inplace(result, *args, **kwargs)
+        if dropped_columns is not None:
+            self._invalidate("columns dropped", dropped_columns)
+        else:
+            self._invalidate("in-place operation")
 
     def _set_item(self, key, value):
+        length = len(self)
         super()._set_item(key, value)
-        self.expire_metadata()
-        self.expire_recs()
+        if len(self) == length:
+            self._invalidate("column assigned", [key])
+        else:
+            # assigning a column to an empty dataframe also creates its rows
+            self._invalidate("rows created by column assignment")
+
+    def insert(self, loc, column, *args, **kwargs):
+        super().insert(loc, column, *args, **kwargs)
+        self._invalidate("column inserted", [column])
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._invalidate("column deleted", [key])
+
+    if PANDAS_WRITE_TRACKING:
+
+        def _maybe_cache_changed(self, item, value, inplace):
+            # a series obtained from this dataframe (e.g., `df.col` or `df["col"]`) was modified in place
+            super()._maybe_cache_changed(item, value, inplace)
+            self._invalidate("series write", [item])
+
+        def _set_value(self, index, col, value, takeable=False):
+            # scalar assignment through `df.at`, `df.iat` or `df.loc`
+            super()._set_value(index, col, value, takeable=takeable)
+            self._invalidate("value set", [self.columns[col] if takeable else col])
+
+        @property
+        def loc(self):
+            return _LuxLocIndexer("loc", self)
+
+        @property
+        def iloc(self):
+            return _LuxiLocIndexer("iloc", self)
+
+    def _invalidate(self, reason: str, columns: List = None) -> None:
+        """
+        Expire the metadata and recommendations after the data was modified, and record the
+        reason in `lux.config.invalidations`.
+
+        Parameters
+        ----------
+        reason : str
+            Operation that modified the data
+        columns : List, optional
+            Columns affected by the operation, if it did not affect the rows. By default, all
+            metadata and recommendations are expired.
+        """
+        self._fingerprint = None
+        self._data_version = getattr(self, "_data_version", 0) + 1
+        if not lux.config.lazy_maintain:
+            return
+        if getattr(self, "_metadata_fresh", False) or getattr(self, "_recs_fresh", False):
+            # only count operations that discard computed metadata or recommendations
+            lux.config.invalidations.record(reason)
+        if columns is None:
+            self.expire_metadata()
+            self.expire_recs()
+        else:
+            self.expire_columns(columns)
+
+    def _derive_metadata(self, result) -> None:
+        """
+        Record the lineage of `result`, a selection of the rows and/or columns of this dataframe
+        that leaves the selected values unchanged, so that it inherits the metadata that still holds.
+        A projection (all rows, in the same order) inherits the exact metadata of its columns. A row
+        subset inherits the data types of its datetime columns and of the columns whose type was
+        overridden, which no selection of rows can change, and recomputes the statistics.
+        """
+        from lux.executor.PandasExecutor import PandasExecutor
+
+        if (
+            result is self
+            or not getattr(self, "_metadata_fresh", False)
+            or self._data_replaced()
+            or lux.config.executor.name not in IN_MEMORY_EXECUTORS
+            or not self.columns.is_unique
+            or not result.columns.is_unique
+            or len(result) > len(self)
+            or not result.columns.isin(self.columns).all()
+        ):
+            return
+        parent_dtypes = self.dtypes
+        if not all(parent_dtypes[attr] == dtype for attr, dtype in result.dtypes.items()):
+            return
+        if len(result) == len(self) and (result.index is self.index or result.index.equals(self.index)):
+            attr_reprs = set(self.columns) | {
+                PandasExecutor._attribute_repr(attr) for attr in self.columns
+            }
+            kept_reprs = set(result.columns) | {
+                PandasExecutor._attribute_repr(attr) for attr in result.columns
+            }
+            # entries of the parent's other columns are dropped, while those of the index are kept
+            result._retained_metadata = {
+                name: {
+                    k: v
+                    for k, v in (getattr(self, name) or {}).items()
+                    if k in kept_reprs or k not in attr_reprs
+                }
+                for name in self._column_metadata
+            }
+            result._dirty_columns = set()
+            result._lineage = Lineage(Lineage.PROJECTION, self.shape, {})
+        else:
+            # the types of other columns depend on the selected values (e.g., their cardinality)
+            type_override = getattr(self, "_type_override", None) or {}
+            data_type = {
+                attr: self._data_type[attr]
+                for attr, dtype in result.dtypes.items()
+                if attr in self._data_type
+                and (attr in type_override or pd.api.types.is_datetime64_any_dtype(dtype))
+            }
+            # rows sampled by a fraction are reused by the subset (see PandasExecutor.execute_sampling)
+            row_sample = getattr(self, "_row_sample", None)
+            sample = None
+            if (
+                row_sample is not None
+                and row_sample.fraction is not None
+                and row_sample.num_rows == len(self)
+                and self.index.is_unique
+            ):
+                sample = (self.index, row_sample)
+            result._lineage = Lineage(Lineage.ROW_SUBSET, self.shape, data_type, sample)
+
+    def _merge_concat_metadata(self, parts: List) -> None:
+        """
+        Seed the metadata of this dataframe, the concatenation of the rows of `parts`, by merging the
+        metadata of the parts without reading their rows: unique values are merged as sets, min/max and
+        null counts are combined. Columns whose statistics cannot be merged (e.g., capped unique values,
+        or evenly-spaced checks) are recomputed, and the types of all but temporal and geographical
+        columns are inferred again from the merged statistics.
+        """
+        from lux.executor.PandasExecutor import PandasExecutor
+        from lux.utils.sketch_utils import merge_unique_values
+
+        parts = [part for part in parts if len(part) > 0]
+        if (
+            len(parts) < 2
+            or lux.config.executor.name not in IN_MEMORY_EXECUTORS
+            or not self.columns.is_unique
+            or not all(isinstance(part, LuxDataFrameMixin) for part in parts)
+        ):
+            return
+        dtypes = self.dtypes
+        for part in parts:
+            if (
+                not getattr(part, "_metadata_fresh", False)
+                or part._data_replaced()
+                or not part.columns.equals(self.columns)
+                or not part.dtypes.equals(dtypes)
+                or part._dirty_columns
+            ):
+                return
+        metadata = {name: {} for name in self._column_metadata}
+        dirty_columns = set()
+        for attr in self.columns:
+            attr_repr = PandasExecutor._attribute_repr(attr)
+            if any(attr_repr in (part._evenly_spaced or {}) for part in parts):
+                dirty_columns.add(attr)
+                continue
+            part_unique_values = [(part.unique_values or {}).get(attr_repr) for part in parts]
+            null_counts = [(part._null_count or {}).get(attr_repr) for part in parts]
+            # columns missing from the statistics of a part are recomputed
+            if any(values is None for values in part_unique_values + null_counts):
+                dirty_columns.add(attr)
+                continue
+            unique_values = merge_unique_values(part_unique_values)
+            if unique_values is None:
+                dirty_columns.add(attr)
+                continue
+            metadata["unique_values"][attr_repr] = unique_values
+            metadata["cardinality"][attr_repr] = len(unique_values)
+            metadata["_null_count"][attr_repr] = sum(null_counts)
+            min_maxes = [(part._min_max or {}).get(attr_repr) for part in parts]
+            if all(min_max is not None for min_max in min_maxes):
+                valued = [min_max for min_max in min_maxes if not pd.isna(min_max[0])] or min_maxes
+                metadata["_min_max"][attr_repr] = (
+                    min(min_max[0] for min_max in valued),
+                    max(min_max[1] for min_max in valued),
+                )
+            data_types = {part._data_type.get(attr) for part in parts}
+            if len(data_types) == 1 and data_types & {"temporal", "geographical"}:
+                metadata["_data_type"][attr] = data_types.pop()
+        self.unique_values = metadata["unique_values"]
+        self.cardinality = metadata["cardinality"]
+        lux.config.executor.compute_index_stats(self)
+        self._retained_metadata = metadata
+        self._dirty_columns = dirty_columns
+
+    def fingerprint(self) -> str:
+        """
+        Fingerprint of the dataframe's contents, usable as a cache key for anything derived from the
+        data (metadata, visualizations, rendered specifications, ...). It is computed in time
+        independent of the number of rows, from the schema, the identity of the underlying buffers
+        and a sample of the values, and cached until the data is modified.
+
+        Returns
+        -------
+        str
+            Hex digest, which changes whenever the data is modified through pandas
+        """
+        from lux.utils.fingerprint_utils import dataframe_fingerprint
+
+        cached = getattr(self, "_fingerprint", None)
+        if cached is not None:
+            fingerprint, mgr_ref, shape = cached
+            if mgr_ref() is self._mgr and shape == self.shape:
+                return fingerprint
+        fingerprint = dataframe_fingerprint(self, version=getattr(self, "_data_version", 0))
+        self._fingerprint = (fingerprint, weakref.ref(self._mgr), self.shape)
+        return fingerprint
+
+    def _share_metadata(self) -> MetadataSnapshot:
+        """
+        Snapshot of the metadata attributes, shared by the series derived from the dataframe. It is
+        only rebuilt once an attribute was reassigned.
+        """
+        snapshot = self.__dict__.get("_shared_metadata")
+        if snapshot is None or not snapshot.matches(self):
+            snapshot = MetadataSnapshot.of(self, self._metadata)
+            self.__dict__["_shared_metadata"] = snapshot
+        return snapshot
+
+    def _snapshot_data(self) -> None:
+        """
+        Remember (without keeping it alive) the block manager the metadata was computed on
+        """
+        digest = None if PANDAS_WRITE_TRACKING else self._data_digest()
+        self._data_snapshot = (weakref.ref(self._mgr), self.shape, digest)
+
+    def _data_replaced(self, compare_values=False) -> bool:
+        """
+        Whether the block manager was swapped or reshaped since the metadata was computed, which
+        catches modifications that bypass the pandas methods overridden above. Without write
+        tracking (see `PANDAS_WRITE_TRACKING`), in-place writes are only caught by comparing the
+        hash of the values, which scans the whole dataframe: only `maintain_metadata` does so
+        (`compare_values`), while derived dataframes assume the values are unchanged.
+        """
+        if getattr(self, "_data_snapshot", None) is None:
+            return False
+        mgr_ref, shape, digest = self._data_snapshot
+        if mgr_ref() is not self._mgr or shape != self.shape:
+            return True
+        if PANDAS_WRITE_TRACKING or not compare_values or digest is None:
+            # the digest is unknown when some values cannot be hashed: they are assumed unchanged
+            return False
+        return digest != self._data_digest()
+
+    def _data_digest(self):
+        """
+        Hash of the values and index of the dataframe, or None (unknown) if some values cannot be
+        hashed
+        """
+        try:
+            return int(pd.util.hash_pandas_object(self, index=True).to_numpy().sum())
+        except TypeError:
+            return None
 
     def _infer_structure(self):
         # If the dataframe is very small and the index column is not a range index, then it is likely that this is an aggregated data
         is_multi_index_flag = self.index.nlevels != 1
         not_int_index_flag = not pd.api.types.is_integer_dtype(self.index)
 
-        is_sql_tbl = lux.config.executor.name != "PandasExecutor"
+        is_sql_tbl = lux.config.executor.name not in IN_MEMORY_EXECUTORS
 
         small_df_flag = len(self) < 100 and is_sql_tbl
         if self.pre_aggregated == None:
@@ -268,6 +850,37 @@ class LuxDataFrameMixin:
         self._intent = vis._inferred_intent
         self._parse_validate_compile_intent()
 
+    def attach_file_metadata(self, file_metadata):
+        """
+        Seed the metadata of the dataframe with the column statistics of the file its rows were read
+        from, so that Lux only scans the columns for the statistics the file cannot supply.
+        The statistics are dropped as soon as the rows change, and per column when a column changes.
+
+        Parameters
+        ----------
+        file_metadata : str or lux.utils.parquet_utils.ParquetMetadata
+            Path of the Parquet file the dataframe was read from, or its already loaded statistics
+
+        Example
+        ----------
+        df = pd.read_parquet("cars.parquet")
+        df.attach_file_metadata("cars.parquet")
+        """
+        from lux.utils.parquet_utils import ParquetMetadata
+
+        if not isinstance(file_metadata, ParquetMetadata):
+            file_metadata = ParquetMetadata(file_metadata, columns=list(self.columns))
+        if file_metadata.num_rows != len(self):
+            warnings.warn(
+                f"\nThe file statistics describe {file_metadata.num_rows} rows, while the dataframe "
+                f"has {len(self)} rows. Lux ignores them and computes the metadata from the data.",
+                stacklevel=2,
+            )
+            return
+        self.expire_metadata()
+        self.expire_recs()
+        self._file_metadata = file_metadata
+
     def set_data_type(self, types: dict):
         """
         Set the data type for a particular attribute in the dataframe
@@ -352,10 +965,39 @@ class LuxDataFrameMixin:
                 vis._all_column = True
                 self.current_vis = VisList([vis])
 
+    def _reusable_action_recs(self) -> Dict:
+        """
+        Recommendations from the last run of each action that are still valid after the columns in
+        `_stale_rec_columns` changed, i.e., whose visualizations neither involve a changed column
+        nor a data type that a changed column had before or has now.
+        """
+        if not lux.config.lazy_maintain or not self._stale_rec_columns or not self._action_recs:
+            return {}
+        stale_types = set(self._stale_rec_columns.values())
+        stale_types.update((self._data_type or {}).get(attr) for attr in self._stale_rec_columns)
+        reusable = {}
+        for action_name, rec in self._action_recs.items():
+            # actions without results may produce some now
+            if rec["collection"] is None or len(rec["collection"]) == 0:
+                continue
+            clauses = [
+                clause
+                for vis in rec["collection"]
+                for clause in vis._inferred_intent
+                if clause.attribute != "Record"
+            ]
+            if not any(
+                clause.attribute in self._stale_rec_columns or clause.data_type in stale_types
+                for clause in clauses
+            ):
+                reusable[action_name] = rec
+        return reusable
+
     def maintain_recs(self, is_series="DataFrame"):
         # `rec_df` is the dataframe to generate the recommendations on
         # check to see if globally defined actions have been registered/removed
-        if lux.config.update_actions["flag"] == True:
+        actions_updated = lux.config.update_actions["flag"] == True
+        if actions_updated:
             self._recs_fresh = False
         show_prev = False  # flag indicating whether rec_df is showing previous df or current self
 
@@ -419,10 +1061,13 @@ class LuxDataFrameMixin:
             ):
                 from lux.action.custom import custom_actions
 
-                # generate vis from globally registered actions and append to dataframe
-                custom_action_collection = custom_actions(rec_df)
+                # generate vis from globally registered actions and append to dataframe,
+                # reusing those not affected by the columns changed since the last run
+                action_recs = {} if actions_updated else rec_df._reusable_action_recs()
+                custom_action_collection = custom_actions(rec_df, action_recs)
                 for rec in custom_action_collection:
                     rec_df._append_rec(rec_infolist, rec)
+                rec_df._action_recs = action_recs
                 lux.config.update_actions["flag"] = False
 
             # Store _rec_info into a more user-friendly dictionary form
@@ -433,6 +1078,7 @@ class LuxDataFrameMixin:
                 if len(vlist) > 0:
                     rec_df._recommendation[action_type] = vlist
             rec_df._rec_info = rec_infolist
+            rec_df._stale_rec_columns = {}
             rec_df.show_all_column_vis()
             if lux.config.render_widget:
                 self._widget = rec_df.render_widget()
@@ -870,8 +1516,8 @@ class LuxDataFrame(LuxDataFrameMixin, pd.DataFrame):
     def _constructor_sliced(self):
         def f(*args, **kwargs):
             s = LuxSeries(*args, **kwargs)
-            for attr in self._metadata:  # propagate metadata
-                s.__dict__[attr] = getattr(self, attr, None)
+            # propagate metadata
+            s.__dict__["_metadata_snapshot"] = self._share_metadata()
             return s
 
         return f
@@ -1,4 +1,6 @@
 import pandas as pd
+import lux
+from lux.utils.utils import IN_MEMORY_EXECUTORS
 
 
 class LuxGroupByMixin:
@@ -28,20 +30,83 @@ class LuxGroupByMixin:
         ret_val = super().aggregate(*args, **kwargs)
         for attr in self._metadata:
             ret_val.__dict__[attr] = getattr(self, attr, None)
+        self._set_aggregate_metadata(ret_val)
         return ret_val
 
     def _agg_general(self, *args, **kwargs):
         ret_val = super()._agg_general(*args, **kwargs)
         for attr in self._metadata:
             ret_val.__dict__[attr] = getattr(self, attr, None)
+        self._set_aggregate_metadata(ret_val)
         return ret_val
 
     def _cython_agg_general(self, *args, **kwargs):
         ret_val = super()._cython_agg_general(*args, **kwargs)
         for attr in self._metadata:
             ret_val.__dict__[attr] = getattr(self, attr, None)
+        self._set_aggregate_metadata(ret_val)
         return ret_val
 
+    def _set_aggregate_metadata(self, ret_val):
+        """
+        Seed the metadata of an aggregated dataframe from the grouping, instead of inferring it from
+        scratch: the index holds the groups, and the group keys, datetime columns and overridden
+        types keep their type. The other types depend on the aggregated values (e.g., on their
+        cardinality, relative to the number of groups), so they are inferred from the result, along
+        with the value statistics, when the metadata is next required.
+
+        Parameters
+        ----------
+        ret_val : LuxDataFrame
+            Result of the aggregation
+        """
+        from lux.core.frame import LuxDataFrameMixin
+
+        if (
+            not isinstance(ret_val, LuxDataFrameMixin)
+            or lux.config.executor.name not in IN_MEMORY_EXECUTORS
+            or isinstance(ret_val.columns, pd.MultiIndex)
+            or not ret_val.columns.is_unique
+        ):
+            return
+        parent_data_type = getattr(self, "_data_type", None) or {}
+        type_override = getattr(self, "_type_override", None) or {}
+        group_keys = [name for name in self.grouper.names if name is not None]
+        data_type = {}
+        for attr, dtype in ret_val.dtypes.items():
+            if attr in type_override:
+                data_type[attr] = type_override[attr]
+            elif attr in group_keys and attr in parent_data_type:
+                data_type[attr] = parent_data_type[attr]
+            elif pd.api.types.is_datetime64_any_dtype(dtype):
+                data_type[attr] = "temporal"
+        ret_val.__dict__.update(
+            {
+                name: {}
+                for name in [
+                    "unique_values",
+                    "cardinality",
+                    "_min_max",
+                    "_null_count",
+                    "_evenly_spaced",
+                    "_value_counts",
+                ]
+            }
+        )
+        # the groups are the index of the result, so its statistics do not need a scan of the values
+        lux.config.executor.compute_index_stats(ret_val)
+        ret_val._retained_metadata = {
+            "_data_type": data_type,
+            "unique_values": ret_val.unique_values,
+            "cardinality": ret_val.cardinality,
+            "_min_max": {},
+            "_null_count": {},
+            "_evenly_spaced": {},
+            "_value_counts": {},
+            "_parsed_columns": {},
+        }
+        ret_val._dirty_columns = set(ret_val.columns)
+
     def get_group(self, *args, **kwargs):
         ret_val = super().get_group(*args, **kwargs)
         for attr in self._metadata:
@@ -67,6 +132,7 @@ class LuxGroupByMixin:
         ret_val = super().size(*args, **kwargs)
         for attr in self._metadata:
             ret_val.__dict__[attr] = getattr(self, attr, None)
+        self._set_aggregate_metadata(ret_val)
         return ret_val
 
     def __getitem__(self, *args, **kwargs):
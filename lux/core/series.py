@@ -20,6 +20,8 @@ import traceback
 import numpy as np
 from lux.history.history import History
 from lux.utils.message import Message
+from lux.utils.metadata_snapshot import MetadataSnapshot
+from lux.utils.sketch_utils import is_exact_unique
 from lux.vis.VisList import VisList
 from typing import Dict, Union, List, Callable
 
@@ -66,13 +68,52 @@ class LuxSeriesMixin:
         "_message": Message,
     }
 
-    def __init__(self, *args, **kw):
-        super().__init__(*args, **kw)
-        for attr in self._metadata:
-            if attr in self._default_metadata:
-                self.__dict__[attr] = self._default_metadata[attr]()
+    # Lux attributes, resolved on first access (see __getattr__). `name` is managed by pandas.
+    _lux_metadata = frozenset(_metadata) - {"name"}
+
+    def __getattr__(self, name):
+        if name in LuxSeriesMixin._lux_metadata:
+            # the metadata is shared with the dataframe or series this series was derived from,
+            # and only copied into the series when accessed
+            snapshot = self.__dict__.get("_metadata_snapshot")
+            if snapshot is not None and name in snapshot:
+                value = snapshot.read(name)
+            elif name in self._default_metadata:
+                value = self._default_metadata[name]()
             else:
-                self.__dict__[attr] = None
+                value = None
+            self.__dict__[name] = value
+            return value
+        return super().__getattr__(name)
+
+    def _share_metadata(self) -> MetadataSnapshot:
+        """
+        Snapshot of the metadata of the series, for the objects derived from it
+        """
+        snapshot = self.__dict__.get("_metadata_snapshot")
+        if snapshot is not None and self._lux_metadata.isdisjoint(self.__dict__):
+            return snapshot
+        values = {attr: getattr(self, attr) for attr in self._lux_metadata}
+        return MetadataSnapshot(values)
+
+    def __finalize__(self, other, method=None, **kwargs):
+        from lux.core.frame import LuxDataFrameMixin
+
+        if isinstance(other, (LuxSeriesMixin, LuxDataFrameMixin)):
+            # same as pandas, but pointing to the shared metadata instead of copying each attribute
+            for key in other.attrs:
+                self.attrs[key] = other.attrs[key]
+            self.flags.allows_duplicate_labels = other.flags.allows_duplicate_labels
+            if isinstance(other, LuxSeriesMixin):
+                object.__setattr__(self, "name", other.name)
+            for attr in self._lux_metadata & self.__dict__.keys():
+                del self.__dict__[attr]
+            snapshot = self.__dict__.get("_metadata_snapshot")
+            # column access sets the snapshot of the dataframe just before finalizing
+            if snapshot is None or snapshot is not other.__dict__.get("_shared_metadata"):
+                self.__dict__["_metadata_snapshot"] = other._share_metadata()
+            return self
+        return super().__finalize__(other, method=method, **kwargs)
 
     def to_pandas(self) -> pd.Series:
         """
@@ -100,7 +141,11 @@ class LuxSeriesMixin:
         --------
         https://pandas.pydata.org/pandas-docs/stable/reference/api/pandas.Series.unique.html
         """
-        if self.unique_values and self.name in self.unique_values.keys():
+        if (
+            self.unique_values
+            and self.name in self.unique_values.keys()
+            and is_exact_unique(self.unique_values[self.name])
+        ):
             return np.array(self.unique_values[self.name])
         else:
             return super().unique()
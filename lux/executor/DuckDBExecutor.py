@@ -0,0 +1,626 @@
+#  Copyright 2019-2020 The Lux Authors.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import itertools
+from contextlib import ExitStack, contextmanager
+
+import numpy as np
+import pandas as pd
+from lux.vis.VisList import VisList
+from lux.vis.Vis import Vis
+from lux.core.frame import LuxDataFrame
+from lux.executor.PandasExecutor import PandasExecutor
+from lux.utils import utils
+from lux.utils.unique_values import UniqueValues
+import lux
+
+try:
+    import duckdb
+except ImportError:
+    duckdb = None
+
+# SQL aggregate functions of the aggregations of bar and line charts, other aggregations are
+# computed by pandas
+DUCKDB_AGGREGATIONS = {
+    "sum": "sum",
+    "min": "min",
+    "max": "max",
+    "median": "median",
+    "count": "count",
+    "std": "stddev_samp",
+    "var": "var_samp",
+}
+
+_connection = None
+_relation_ids = itertools.count()
+
+
+def connection():
+    """
+    In-process DuckDB database the dataframes are registered in, created on first use
+    """
+    global _connection
+    if _connection is None:
+        _connection = duckdb.connect(":memory:")
+    return _connection
+
+
+def query(sql: str, parameters: list = None) -> pd.DataFrame:
+    """
+    Run a query on the registered dataframes, and fetch its result as a pandas dataframe
+    """
+    return connection().execute(sql, parameters or []).df()
+
+
+def quote(attribute: str) -> str:
+    """
+    Quoted SQL identifier of a column
+    """
+    return '"' + attribute.replace('"', '""') + '"'
+
+
+def can_register(df: pd.DataFrame) -> bool:
+    """
+    Whether the columns of a dataframe can be queried by name in DuckDB
+    """
+    return all(isinstance(attr, str) for attr in df.columns) and df.columns.is_unique
+
+
+@contextmanager
+def registered(df: pd.DataFrame):
+    """
+    Register a dataframe as a DuckDB relation scanning its columns in place (without copying
+    them), under a name unique to this registration, and unregister it on exit
+
+    Yields
+    ------
+    str
+        Name of the relation
+    """
+    relation = f"lux_data_{next(_relation_ids)}"
+    # DuckDB checks dataframes against `pandas.DataFrame`, which Lux overrides with LuxDataFrame:
+    # plain dataframes (e.g., from `to_pandas`) are wrapped around the same blocks
+    if not isinstance(df, pd.DataFrame):
+        df = pd.DataFrame(df._mgr)
+    connection().register(relation, df)
+    try:
+        yield relation
+    finally:
+        connection().unregister(relation)
+
+
+def _parameter(val: object, dtype=None) -> object:
+    # numpy scalars are bound as Python scalars, and dates given as strings are parsed
+    if isinstance(val, str) and dtype is not None and pd.api.types.is_datetime64_any_dtype(dtype):
+        val = pd.Timestamp(val)
+    if isinstance(val, pd.Timestamp):
+        return val.to_pydatetime()
+    if isinstance(val, np.generic):
+        return val.item()
+    return val
+
+
+def _restore_missing_values(series: pd.Series, distinct: pd.DataFrame) -> np.ndarray:
+    """
+    Unique values of an object column as listed by `Series.unique`, from its distinct values and
+    their first position found by DuckDB, which scans every missing value (None, NaN, NA, ...) as
+    NULL: the distinct missing values of the column are put back at their first position
+    """
+    values = distinct.iloc[:, 0].to_numpy(dtype=object)
+    positions = distinct.iloc[:, 1].to_numpy(dtype=np.int64)
+    present = ~pd.isna(values)
+    values, positions = values[present], positions[present]
+    null_rows = np.flatnonzero(series.isna().to_numpy())
+    if len(null_rows):
+        missing = pd.Series(series.to_numpy()[null_rows]).drop_duplicates()
+        values = np.concatenate([values, missing.to_numpy(dtype=object)])
+        positions = np.concatenate([positions, null_rows[missing.index]])
+    return values[np.argsort(positions, kind="stable")]
+
+
+def _bin_case(column: str, edges: np.ndarray, op: str) -> tuple:
+    # bin of a value: the first bin whose end compares with `op` to the value, else the last bin
+    cases = " ".join(f"WHEN {column} {op} ? THEN {i}" for i in range(len(edges) - 2))
+    parameters = [float(edge) for edge in edges[1:-1]]
+    if not cases:
+        return "0", []
+    return f"CASE {cases} ELSE {len(edges) - 2} END", parameters
+
+
+class DuckDBExecutor(PandasExecutor):
+    """
+    Given a Vis objects with complete specifications, fetch and process data with the embedded,
+    multi-threaded SQL engine of DuckDB. The dataframe stays a pandas LuxDataFrame, registered as
+    a DuckDB relation that scans its columns in place, so that no database server is needed and
+    no data is copied. Charts are returned with the same data as the PandasExecutor, and charts
+    DuckDB cannot compute (e.g., custom aggregation functions, or columns of mixed types) are
+    computed by the PandasExecutor.
+    """
+
+    def __init__(self):
+        if duckdb is None:
+            raise ImportError("The DuckDBExecutor requires duckdb. Install it with `pip install duckdb`.")
+        super().__init__()
+        self.name = "DuckDBExecutor"
+
+    def __repr__(self):
+        return f"<DuckDBExecutor>"
+
+    @staticmethod
+    def execute(vislist: VisList, ldf: LuxDataFrame, approx=False):
+        """
+        Given a VisList, fetch the data required to render the vis.
+        1) Apply filters
+        2) Retrieve relevant attribute
+        3) Perform vis-related processing (aggregation, binning)
+        4) return a DataFrame with relevant results
+
+        Parameters
+        ----------
+        vislist: list[lux.Vis]
+            vis list that contains lux.Vis objects for visualization.
+        ldf : lux.core.frame
+            LuxDataFrame with specified intent.
+
+        Returns
+        -------
+        None
+        """
+        DuckDBExecutor.execute_sampling(ldf)
+        if approx:
+            DuckDBExecutor.execute_approx_sample(ldf)
+        data = ldf._approx_sample if approx else ldf._sampled
+        if not can_register(data):
+            PandasExecutor.execute(vislist, ldf, approx=approx)
+            return
+        with ExitStack() as registration:
+            try:
+                relation = registration.enter_context(registered(data))
+            except duckdb.Error:
+                # e.g., periods, intervals or complex numbers, which DuckDB cannot scan
+                PandasExecutor.execute(vislist, ldf, approx=approx)
+                return
+            for vis in vislist:
+                if any(
+                    clause.attribute not in data.columns
+                    for clause in vis._inferred_intent
+                    if clause.attribute != "Record"
+                ):
+                    PandasExecutor.execute([vis], ldf, approx=approx)
+                    continue
+                vis._source = ldf
+                vis._vis_data = data
+                if approx:
+                    vis._original_df = ldf._sampled
+                    vis.approx = True
+                try:
+                    DuckDBExecutor.execute_vis(ldf, vis, relation, approx=approx)
+                except duckdb.Error:
+                    # e.g., object columns of mixed types, or values of another type than the column
+                    PandasExecutor.execute([vis], ldf, approx=approx)
+                # Ensure that intent is not propogated to the vis data (bypass intent setter, since trigger vis.data metadata recompute)
+                vis.data._intent = []
+
+    @staticmethod
+    def execute_vis(ldf: LuxDataFrame, vis: Vis, relation: str, approx=False):
+        """
+        Fetch the data of a vis from a registered dataframe, in SQL queries applying its filters
+
+        Parameters
+        ----------
+        ldf : lux.core.frame
+            LuxDataFrame with specified intent.
+        vis : lux.Vis
+            lux.Vis object whose data is the registered dataframe
+        relation : str
+            Name the data of the vis is registered with (see `registered`)
+        approx : bool
+            Whether the vis is approximated for early pruning
+        """
+        filters = utils.get_filter_specs(vis._inferred_intent)
+        where_clause, parameters = DuckDBExecutor.create_where_clause(filters, vis._vis_data.dtypes)
+        sql = (relation, where_clause, parameters)
+        if vis.mark == "bar" or vis.mark == "line" or vis.mark == "geographical":
+            DuckDBExecutor.execute_aggregate(vis, isFiltered=len(filters) > 0, sql=sql)
+        elif vis.mark == "histogram":
+            DuckDBExecutor.execute_binning(ldf, vis, sql=sql)
+        elif vis.mark == "heatmap" and not approx:
+            DuckDBExecutor.execute_2D_binning(vis, sql=sql)
+        else:
+            if vis.mark == "heatmap":
+                # Early pruning based on interestingness of scatterplots
+                vis._mark = "scatter"
+            vis._vis_data = DuckDBExecutor.select(vis, sql)
+
+    @staticmethod
+    def create_where_clause(filters: list, dtypes: pd.Series = None) -> tuple:
+        """
+        SQL condition selecting the same rows as the filters of a vis in the PandasExecutor, with
+        the filter values bound as parameters
+
+        Parameters
+        ----------
+        filters : list
+            Filter clauses of the vis
+        dtypes : pd.Series, optional
+            Types of the columns, to parse dates given as strings
+
+        Returns
+        -------
+        tuple
+            WHERE clause (empty if there are no filters), and its parameters
+        """
+        conditions = []
+        parameters = []
+        for clause in filters:
+            column = quote(clause.attribute)
+            op = clause.filter_op
+            val = clause.value
+            # NaN values are scanned as nulls
+            if utils.like_nan(val):
+                if op == "=":
+                    conditions.append(f"{column} IS NULL")
+                elif op == "!=":
+                    conditions.append(f"{column} IS NOT NULL")
+                continue
+            if op in ("=", "<", ">", "<=", ">="):
+                conditions.append(f"{column} {op} ?")
+            elif op == "!=":
+                # missing values differ from any value, as in pandas
+                conditions.append(f"({column} != ? OR {column} IS NULL)")
+            else:
+                continue
+            dtype = dtypes.get(clause.attribute) if dtypes is not None else None
+            parameters.append(_parameter(val, dtype))
+        if not conditions:
+            return "", []
+        return "WHERE " + " AND ".join(conditions), parameters
+
+    @staticmethod
+    def select(vis: Vis, sql: tuple) -> LuxDataFrame:
+        """
+        Filtered rows of the attributes of a vis, in the order of the dataframe
+
+        Parameters
+        ----------
+        vis : lux.Vis
+        sql : tuple
+            Relation of the vis data, and the WHERE clause and parameters of its filters
+        """
+        relation, where_clause, parameters = sql
+        attributes = dict.fromkeys(
+            clause.attribute for clause in vis._inferred_intent if clause.attribute != "Record"
+        )
+        columns = ", ".join(quote(attr) for attr in attributes)
+        return LuxDataFrame(query(f"SELECT {columns} FROM {relation} {where_clause}", parameters))
+
+    @staticmethod
+    def execute_aggregate(vis: Vis, isFiltered=True, sql: tuple = None):
+        """
+        Aggregate data points on an axis for bar or line charts with a SQL group by, then complete
+        the missing groups and sort them as the PandasExecutor does
+
+        Parameters
+        ----------
+        vis: lux.Vis
+            lux.Vis object that represents a visualization
+        isFiltered : bool
+            Whether a filter was applied to the vis data
+        sql : tuple, optional
+            Relation of the vis data, and the WHERE clause and parameters of its filters. By
+            default, vis.data is registered and aggregated as a whole.
+
+        Returns
+        -------
+        None
+        """
+        if sql is None:
+            with registered(vis._vis_data) as relation:
+                return DuckDBExecutor.execute_aggregate(vis, isFiltered, sql=(relation, "", []))
+        relation, where_clause, parameters = sql
+        x_attr = vis.get_attr_by_channel("x")[0]
+        y_attr = vis.get_attr_by_channel("y")[0]
+        if x_attr.aggregation is None or y_attr.aggregation is None:
+            vis._vis_data = DuckDBExecutor.select(vis, sql)
+            return
+        if y_attr.aggregation != "":
+            groupby_attr, measure_attr = x_attr, y_attr
+        else:
+            groupby_attr, measure_attr = y_attr, x_attr
+        group_attrs = [groupby_attr.attribute]
+        color_attr = vis.get_attr_by_channel("color")
+        if len(color_attr) == 1:
+            group_attrs.append(color_attr[0].attribute)
+        groups = ", ".join(quote(attr) for attr in group_attrs)
+        agg_func = measure_attr.aggregation
+        measure = quote(measure_attr.attribute)
+        # pandas sums the floats of a group with Kahan summation, as `fsum` does
+        total = "fsum" if measure_attr.attribute in vis._vis_data.columns and pd.api.types.is_float_dtype(
+            vis._vis_data[measure_attr.attribute]
+        ) else "sum"
+        if measure_attr.attribute == "Record":
+            aggregation = "count(*)"
+        elif agg_func == "sum":
+            # the sum of no values is 0, as in pandas
+            aggregation = f"coalesce({total}({measure}), 0)"
+        elif agg_func == "mean":
+            aggregation = f"{total}({measure}) / count({measure})"
+        elif isinstance(agg_func, str) and agg_func in DUCKDB_AGGREGATIONS:
+            aggregation = f"{DUCKDB_AGGREGATIONS[agg_func]}({measure})"
+        else:
+            aggregation = None
+        source = vis._vis_data
+        if aggregation is None:
+            # e.g., custom aggregation functions
+            data = DuckDBExecutor.select(vis, sql)
+            aggregated = data.groupby(group_attrs, dropna=False, history=False).agg(agg_func).reset_index()
+        else:
+            aggregated = query(
+                f"SELECT {groups}, {aggregation} AS {measure} FROM {relation} {where_clause} GROUP BY {groups}",
+                parameters,
+            )
+        # groups are completed with the values of the source data
+        vis._vis_data = source
+        PandasExecutor.execute_aggregate(vis, isFiltered=isFiltered, aggregated=LuxDataFrame(aggregated))
+
+    @staticmethod
+    def execute_binning(ldf: LuxDataFrame, vis: Vis, sql: tuple = None):
+        """
+        Binning of data points for generating histograms, with the bins of `np.histogram` counted
+        by a SQL group by
+
+        Parameters
+        ----------
+        vis: lux.Vis
+            lux.Vis object that represents a visualization
+        ldf : lux.core.frame
+            LuxDataFrame with specified intent.
+        sql : tuple, optional
+            Relation of the vis data, and the WHERE clause and parameters of its filters. By
+            default, vis.data is registered and binned as a whole.
+
+        Returns
+        -------
+        None
+        """
+        from lux.utils.binning_utils import can_bin_codes
+
+        bin_attribute = [x for x in vis._inferred_intent if x.bin_size != 0][0]
+        bin_attr = bin_attribute.attribute
+        bins = bin_attribute.bin_size
+        if not can_bin_codes(vis._vis_data[bin_attr]):
+            # e.g., numbers stored as strings, or durations, binned as np.histogram does
+            if sql is not None:
+                vis._vis_data = DuckDBExecutor.select(vis, sql)
+            PandasExecutor.execute_binning(ldf, vis)
+            return
+        if sql is None:
+            with registered(vis._vis_data) as relation:
+                return DuckDBExecutor.execute_binning(ldf, vis, sql=(relation, "", []))
+        relation, where_clause, parameters = sql
+        values = f"(SELECT CAST({quote(bin_attr)} AS DOUBLE) AS value FROM {relation} {where_clause})"
+        finite = "FILTER (WHERE isfinite(value))"
+        stats = query(
+            f'SELECT count(*) AS "rows", count(value) {finite} AS "count", min(value) {finite} AS "min", '
+            + f'max(value) {finite} AS "max" FROM {values}',
+            parameters,
+        ).iloc[0]
+        if stats["count"] < stats["rows"]:
+            ldf._message.add_unique(
+                f"The column <code>{bin_attr}</code> contains missing values, not shown in the displayed histogram.",
+                priority=100,
+            )
+        # same range as np.histogram, including for empty and constant columns
+        first, last = (0.0, 1.0) if stats["count"] == 0 else (stats["min"], stats["max"])
+        if first == last:
+            first, last = first - 0.5, last + 0.5
+        edges = np.linspace(first, last, bins + 1)
+        # bin i holds the values in [edges[i], edges[i + 1]), and the last bin is closed
+        bin_case, bin_parameters = _bin_case("value", edges, "<")
+        counted = query(
+            f'SELECT {bin_case} AS "bin", count(*) AS "count" FROM {values} WHERE isfinite(value) GROUP BY "bin"',
+            bin_parameters + parameters,
+        )
+        counts = np.zeros(bins, dtype=np.int64)
+        counts[counted["bin"].to_numpy(dtype=np.intp)] = counted["count"].to_numpy()
+        binned_result = np.array([edges[0:-1], counts]).T
+        vis._vis_data = pd.DataFrame(binned_result, columns=[bin_attr, "Number of Records"])
+
+    @staticmethod
+    def execute_2D_binning(vis: Vis, sql: tuple = None) -> None:
+        """
+        Apply 2D binning (heatmap) to vis.data, with the bins of `pd.cut` on both axes counted by a
+        SQL group by
+
+        Parameters
+        ----------
+        vis : Vis
+        sql : tuple, optional
+            Relation of the vis data, and the WHERE clause and parameters of its filters. By
+            default, vis.data is registered and binned as a whole (e.g., by the renderers).
+        """
+        x_attr = vis.get_attr_by_channel("x")[0].attribute
+        y_attr = vis.get_attr_by_channel("y")[0].attribute
+        color_attr = vis.get_attr_by_channel("color")
+        color_attr = color_attr[0] if len(color_attr) > 0 else None
+        nominal_color = color_attr is not None and color_attr.data_type == "nominal"
+        dtypes = vis._vis_data.dtypes
+        if (
+            not can_register(vis._vis_data)
+            or dtypes[x_attr].kind not in "iuf"
+            or dtypes[y_attr].kind not in "iuf"
+            or (color_attr is not None and not nominal_color and dtypes[color_attr.attribute].kind not in "iufb")
+        ):
+            # e.g., values of mixed types, binned as pd.cut does, or averages of dates
+            if sql is not None:
+                vis._vis_data = DuckDBExecutor.select(vis, sql)
+            PandasExecutor.execute_2D_binning(vis)
+            return
+        if sql is None:
+            with registered(vis._vis_data) as relation:
+                return DuckDBExecutor.execute_2D_binning(vis, sql=(relation, "", []))
+        relation, where_clause, parameters = sql
+
+        x = f"CAST({quote(x_attr)} AS DOUBLE)"
+        y = f"CAST({quote(y_attr)} AS DOUBLE)"
+        extremes = query(
+            f"SELECT min({x}) FILTER (WHERE isfinite({x})), max({x}) FILTER (WHERE isfinite({x})), "
+            + f"min({y}) FILTER (WHERE isfinite({y})), max({y}) FILTER (WHERE isfinite({y})) "
+            + f"FROM {relation} {where_clause}",
+            parameters,
+        ).iloc[0]
+        if extremes.isna().any():
+            # no values to bin on an axis
+            vis._vis_data = DuckDBExecutor.select(vis, sql)
+            PandasExecutor.execute_2D_binning(vis)
+            return
+        bins = lux.config.heatmap_bin_size
+        x_labels, x_edges = pd.cut(extremes.to_numpy(dtype=float)[0:2], bins=bins, retbins=True)
+        y_labels, y_edges = pd.cut(extremes.to_numpy(dtype=float)[2:4], bins=bins, retbins=True)
+        # the bins are half-open (start, end], and the first start is below the minimum
+        x_case, x_parameters = _bin_case(x, x_edges, "<=")
+        y_case, y_parameters = _bin_case(y, y_edges, "<=")
+        cell = f"({x_case}) * {bins} + ({y_case})"
+        counted = f"isfinite({x}) AND isfinite({y})"
+        if color_attr is not None:
+            # cells are counted by their non-missing colors
+            counted += f" AND {quote(color_attr.attribute)} IS NOT NULL"
+        where_clause = f"{where_clause} AND {counted}" if where_clause else f"WHERE {counted}"
+        parameters = x_parameters + y_parameters + parameters
+        if color_attr is None:
+            cells = query(
+                f'SELECT {cell} AS "cell", count(*) AS "count" FROM {relation} {where_clause} GROUP BY "cell"',
+                parameters,
+            )
+        elif nominal_color:
+            # the most frequent color of each cell, the smallest one in case of ties
+            color = quote(color_attr.attribute)
+            cells = query(
+                f'SELECT {cell} AS "cell", count(*) AS "count", {color} FROM {relation} {where_clause} '
+                + f'GROUP BY "cell", {color}',
+                parameters,
+            )
+            totals = cells.groupby("cell")["count"].sum()
+            cells = cells.sort_values(
+                ["cell", "count", color_attr.attribute], ascending=[True, False, True], kind="mergesort"
+            ).drop_duplicates("cell")
+            cells["count"] = totals.reindex(cells["cell"]).to_numpy()
+        else:
+            color = quote(color_attr.attribute)
+            cells = query(
+                f'SELECT {cell} AS "cell", count(*) AS "count", fsum(CAST({color} AS DOUBLE)) / count({color}) AS {color} '
+                + f'FROM {relation} {where_clause} GROUP BY "cell"',
+                parameters,
+            )
+        # same cells as `lux.utils.binning_utils.heatmap_cells`, in increasing order
+        cells = cells.sort_values("cell")
+        kept = cells["cell"].to_numpy(dtype=np.intp)
+        result = pd.DataFrame({"count": cells["count"].to_numpy(dtype=np.int64)}, index=kept)
+        if color_attr is not None:
+            result[color_attr.attribute] = cells[color_attr.attribute].to_numpy()
+        x_positions = kept // bins
+        y_positions = kept % bins
+        result["xBinStart"] = np.asarray(x_labels.categories.left, dtype=float)[x_positions]
+        result["xBinEnd"] = np.asarray(x_labels.categories.right, dtype=float)[x_positions]
+        result["yBinStart"] = np.asarray(y_labels.categories.left, dtype=float)[y_positions]
+        result["yBinEnd"] = np.asarray(y_labels.categories.right, dtype=float)[y_positions]
+        vis._vis_data = result
+
+    def compute_stats(self, ldf: LuxDataFrame, attributes=None):
+        """
+        Compute per-column statistics (unique values, cardinality, min/max and null counts) for
+        all columns of the dataframe in SQL: the counts and extremes of every column in one scan,
+        then the distinct values of each column, in the order of their first appearance. Sketched
+        metadata, value counts, file statistics and partial recomputations are computed by the
+        PandasExecutor.
+
+        Parameters
+        ----------
+        ldf : lux.core.frame
+            LuxDataFrame whose metadata will be populated
+        attributes : list, optional
+            Only (re)compute the statistics of these columns
+        """
+        df = ldf.to_pandas()
+        if (
+            attributes is not None
+            or lux.config.sketch_metadata
+            or lux.config.value_counts
+            or getattr(ldf, "_file_metadata", None) is not None
+            or len(df.columns) == 0
+            or not can_register(df)
+            # columns of other types (e.g., categories, or dates with a timezone) are scanned as
+            # values of other types than the pandas ones
+            or not all(dtype.kind in "biufO" or dtype == "datetime64[ns]" for dtype in df.dtypes)
+            or any(pd.api.types.is_extension_array_dtype(dtype) for dtype in df.dtypes)
+        ):
+            return super().compute_stats(ldf, attributes)
+
+        numeric_attrs = [
+            attr
+            for attr, dtype in df.dtypes.items()
+            if pd.api.types.is_float_dtype(dtype) or pd.api.types.is_integer_dtype(dtype)
+        ]
+        expressions = []
+        for index, attr in enumerate(df.columns):
+            expressions.append(f"count({quote(attr)}) AS count_{index}")
+            if attr in numeric_attrs:
+                expressions.append(f"min({quote(attr)}) AS min_{index}")
+                expressions.append(f"max({quote(attr)}) AS max_{index}")
+        try:
+            with registered(df) as relation:
+                stats = query(f"SELECT {', '.join(expressions)} FROM {relation}").iloc[0]
+                # distinct values in order of first appearance, as listed by `Series.unique` (rows are
+                # numbered in the order of the scan, which DuckDB preserves by default)
+                distinct = [
+                    query(
+                        f"SELECT {quote(attr)}, min(position) AS position FROM (SELECT {quote(attr)}, "
+                        f"row_number() OVER () - 1 AS position FROM {relation}) GROUP BY {quote(attr)} "
+                        "ORDER BY position"
+                    )
+                    for attr in df.columns
+                ]
+        except duckdb.Error:
+            # e.g., object columns of mixed types
+            return super().compute_stats(ldf, attributes)
+
+        ldf.unique_values = {}
+        ldf._min_max = {}
+        ldf.cardinality = {}
+        ldf._null_count = {}
+        ldf._evenly_spaced = {}
+        ldf._value_counts = {}
+        ldf._length = len(ldf)
+        for index, (attr, values) in enumerate(zip(df.columns, distinct)):
+            series = df[attr]
+            if series.dtype == object:
+                unique_values = _restore_missing_values(series, values)
+            else:
+                unique_values = values.iloc[:, 0].to_numpy().astype(series.dtype, copy=False)
+            unique_values = UniqueValues(unique_values)
+            cardinality = len(unique_values)
+            ldf.unique_values[attr] = unique_values
+            ldf.cardinality[attr] = cardinality
+            ldf._null_count[attr] = len(df) - int(stats[f"count_{index}"])
+            if pd.api.types.is_integer_dtype(series.dtype) and cardinality > 500:
+                diff = np.diff(series.to_numpy(dtype="float64", na_value=np.nan))
+                ldf._evenly_spaced[attr] = bool(len(diff) == 0 or (diff == diff[0]).all())
+            if attr in numeric_attrs:
+                # the extremes are computed in the type of the column
+                ldf._min_max[attr] = tuple(
+                    np.nan if pd.isna(value) else series.dtype.type(value)
+                    for value in (stats[f"min_{index}"], stats[f"max_{index}"])
+                )
+
+        self.compute_index_stats(ldf)
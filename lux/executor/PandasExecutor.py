@@ -20,11 +20,27 @@ from lux.executor.Executor import Executor
 from lux.utils import utils
 from lux.utils.date_utils import is_datetime_series, is_timedelta64_series, timedelta64_to_float_seconds
 from lux.utils.utils import check_import_lux_widget, check_if_id_like, is_numeric_nan_column
+from lux.utils.sketch_utils import is_exact_unique, sketch_column
+from lux.utils.unique_values import UniqueValues
+from lux.utils.predicate_cache import evaluate_predicate, predicate_cache
+from lux.utils.binning_utils import can_bin_codes, cut_bin_codes, histogram_bin_codes
+from lux.utils.sample_utils import sample_rows
 import warnings
 import lux
+from concurrent.futures import ThreadPoolExecutor
 from lux.utils.tracing_utils import LuxTracer
 
 
+# Number of values a column's type is decided on before converting the full column
+TYPE_INFERENCE_SAMPLE_SIZE = 500
+# Frames with fewer rows compute their metadata serially, since thread pool overhead would dominate
+PARALLEL_METADATA_MIN_ROWS = 10000
+# Aggregations that a groupby of a frame only applies to its numeric columns, dropping the others
+NUMERIC_AGGREGATIONS = {"mean", "median", "std", "var", "sem", "prod", "sum"}
+# Aggregations that a groupby applies to columns of any type (except categoricals for min and max)
+ANY_TYPE_AGGREGATIONS = {"count", "nunique", "first", "last", "min", "max"}
+
+
 class PandasExecutor(Executor):
     """
     Given a Vis objects with complete specifications, fetch and process data using Pandas dataframe operations.
@@ -48,6 +64,10 @@ class PandasExecutor(Executor):
         lux.config.sampling_start = 100k rows
         lux.config.sampling_cap = 1M rows
 
+        The positions of the sampled rows are kept (see `lux.utils.sample_utils.RowSample`), so
+        that the rows are sampled again only when their number changes, and a row subset of a
+        sampled dataframe reuses the rows of its parent's sample.
+
         Parameters
         ----------
         ldf : LuxDataFrame
@@ -59,14 +79,14 @@ class PandasExecutor(Executor):
 
         if SAMPLE_FLAG and len(ldf) > SAMPLE_CAP:
             if ldf._sampled is None:  # memoize unfiltered sample df
-                ldf._sampled = ldf.sample(n=SAMPLE_CAP, random_state=1)
+                ldf._sampled = PandasExecutor._take_sample(ldf, size=SAMPLE_CAP)
             ldf._message.add_unique(
                 f"Large dataframe detected: Lux is only visualizing a sample capped at {SAMPLE_CAP} rows.",
                 priority=99,
             )
         elif SAMPLE_FLAG and len(ldf) > SAMPLE_START:
             if ldf._sampled is None:  # memoize unfiltered sample df
-                ldf._sampled = ldf.sample(frac=SAMPLE_FRAC, random_state=1)
+                ldf._sampled = PandasExecutor._take_sample(ldf, fraction=SAMPLE_FRAC)
             ldf._message.add_unique(
                 f"Large dataframe detected: Lux is visualizing a sample of {SAMPLE_FRAC}% of the dataframe ({len(ldf._sampled)} rows).",
                 priority=99,
@@ -74,6 +94,31 @@ class PandasExecutor(Executor):
         else:
             ldf._sampled = ldf
 
+    @staticmethod
+    def _take_sample(ldf: LuxDataFrame, size: int = None, fraction: float = None) -> LuxDataFrame:
+        """
+        Rows of the sample of `size` rows (or of a `fraction` of the rows) of a dataframe, drawn
+        once for its number of rows, or reused from the sample of the dataframe it is a row
+        subset of (when sampled by the same fraction)
+        """
+        row_sample = getattr(ldf, "_row_sample", None)
+        if (
+            row_sample is None
+            or row_sample.num_rows != len(ldf)
+            or row_sample.fraction != fraction
+            or (size is not None and len(row_sample) != size)
+        ):
+            row_sample = None
+            lineage = getattr(ldf, "_lineage", None)
+            if fraction is not None and lineage is not None and lineage.sample is not None:
+                parent_index, parent_sample = lineage.sample
+                if parent_sample.fraction == fraction:
+                    row_sample = parent_sample.subset(parent_index, ldf.index)
+            if row_sample is None:
+                row_sample = sample_rows(len(ldf), size=size, fraction=fraction)
+            ldf._row_sample = row_sample
+        return ldf.take(row_sample.positions)
+
     @staticmethod
     def execute_approx_sample(ldf: LuxDataFrame):
         """
@@ -86,9 +131,9 @@ class PandasExecutor(Executor):
         """
         if ldf._approx_sample is None:
             if len(ldf._sampled) > lux.config.early_pruning_sample_start:
-                ldf._approx_sample = ldf._sampled.sample(
-                    n=lux.config.early_pruning_sample_cap, random_state=1
-                )
+                # same rows as `DataFrame.sample`, taken once by their positions
+                row_sample = sample_rows(len(ldf._sampled), size=lux.config.early_pruning_sample_cap)
+                ldf._approx_sample = ldf._sampled.take(row_sample.positions)
             else:
                 ldf._approx_sample = ldf._sampled
 
@@ -114,6 +159,13 @@ class PandasExecutor(Executor):
         """
 
         PandasExecutor.execute_sampling(ldf)
+        # Charts sharing their filter attribute or their group-by attribute are computed in shared scans
+        shared_aggregation = SharedAggregation(vislist)
+        if approx:
+            PandasExecutor.execute_approx_sample(ldf)
+        # Unfiltered histograms count the cached bin codes of their column, binned in one pass
+        binned_sample = ldf._approx_sample if approx else ldf._sampled
+        PandasExecutor._compute_histogram_bin_codes(ldf, binned_sample, vislist)
         for vis in vislist:
             # The vis data starts off being original or sampled dataframe
             vis._source = ldf
@@ -124,31 +176,35 @@ class PandasExecutor(Executor):
                 PandasExecutor.execute_approx_sample(ldf)
                 vis._vis_data = ldf._approx_sample
                 vis.approx = True
-            filter_executed = PandasExecutor.execute_filter(vis)
             # Select relevant data based on attribute information
             attributes = set([])
             for clause in vis._inferred_intent:
                 if clause.attribute != "Record":
                     attributes.add(clause.attribute)
+            # filtered rows are taken with the relevant attributes only, rather than with every column
+            filter_executed, aggregated = shared_aggregation.filter_and_aggregate(vis, attributes)
+            # the code exported by Vis.to_code bins the values rather than reading cached bin codes
+            unfiltered = None if filter_executed or lux.config.tracer.is_tracing() else vis._vis_data
             # TODO: Add some type of cap size on Nrows ?
-            vis._vis_data = vis._vis_data[list(attributes)]
+            if set(vis._vis_data.columns) != attributes or len(vis._vis_data.columns) != len(attributes):
+                vis._vis_data = vis._vis_data[list(attributes)]
 
             if vis.mark == "bar" or vis.mark == "line" or vis.mark == "geographical":
-                PandasExecutor.execute_aggregate(vis, isFiltered=filter_executed)
+                PandasExecutor.execute_aggregate(vis, isFiltered=filter_executed, aggregated=aggregated)
             elif vis.mark == "histogram":
-                PandasExecutor.execute_binning(ldf, vis)
+                PandasExecutor.execute_binning(ldf, vis, source=unfiltered)
             elif vis.mark == "heatmap":
                 # Early pruning based on interestingness of scatterplots
                 if approx:
                     vis._mark = "scatter"
                 else:
                     vis._mark = "heatmap"
-                    PandasExecutor.execute_2D_binning(vis)
+                    PandasExecutor.execute_2D_binning(vis, ldf=ldf, source=unfiltered)
             # Ensure that intent is not propogated to the vis data (bypass intent setter, since trigger vis.data metadata recompute)
             vis.data._intent = []
 
     @staticmethod
-    def execute_aggregate(vis: Vis, isFiltered=True):
+    def execute_aggregate(vis: Vis, isFiltered=True, aggregated: pd.DataFrame = None):
         """
         Aggregate data points on an axis for bar or line charts
 
@@ -156,8 +212,11 @@ class PandasExecutor(Executor):
         ----------
         vis: lux.Vis
             lux.Vis object that represents a visualization
-        ldf : lux.core.frame
-            LuxDataFrame with specified intent.
+        isFiltered : bool
+            Whether a filter was applied to the vis data
+        aggregated : pd.DataFrame, optional
+            Aggregated data of the vis already computed in a scan shared with other charts (see
+            `SharedAggregation`), only completed with the missing groups and sorted
 
         Returns
         -------
@@ -193,7 +252,14 @@ class PandasExecutor(Executor):
         else:
             color_cardinality = 1
         if measure_attr != "":
-            if measure_attr.attribute == "Record":
+            value_counts = None
+            if measure_attr.attribute == "Record" and not isFiltered and not has_color and not vis.approx:
+                value_counts = PandasExecutor._record_counts(vis, groupby_attr.attribute)
+            if value_counts is not None:
+                vis._vis_data = value_counts
+            elif aggregated is not None:
+                vis._vis_data = aggregated
+            elif measure_attr.attribute == "Record":
                 # need to get the index name so that we can rename the index column to "Record"
                 # if there is no index, default to "index"
                 index_name = vis.data.index.name
@@ -234,55 +300,38 @@ class PandasExecutor(Executor):
                 groupby_result = groupby_result.agg(agg_func)
                 intermediate = groupby_result.reset_index()
                 vis._vis_data = intermediate.__finalize__(vis.data)
-            result_vals = list(vis.data[groupby_attr.attribute])
-            # create existing group by attribute combinations if color is specified
-            # this is needed to check what combinations of group_by_attr and color_attr values have a non-zero number of elements in them
-            if has_color:
-                res_color_combi_vals = []
-                result_color_vals = list(vis.data[color_attr.attribute])
-                for i in range(0, len(result_vals)):
-                    res_color_combi_vals.append([result_vals[i], result_color_vals[i]])
+            result_vals = vis.data[groupby_attr.attribute]
+            # Capped (sketched) unique values only cover the most frequent values, so extend them
+            # with the groups present in the result to avoid dropping those groups below
+            if not is_exact_unique(attr_unique_vals):
+                attr_unique_vals = list(dict.fromkeys(list(attr_unique_vals) + list(result_vals)))
+            if has_color and not is_exact_unique(color_attr_vals):
+                color_attr_vals = list(
+                    dict.fromkeys(list(color_attr_vals) + list(vis.data[color_attr.attribute]))
+                )
+                color_cardinality = len(color_attr_vals)
             # For filtered aggregation that have missing groupby-attribute values, set these aggregated value as 0, since no datapoints
             if isFiltered or has_color and attr_unique_vals:
                 N_unique_vals = len(attr_unique_vals)
                 if len(result_vals) != N_unique_vals * color_cardinality:
-                    columns = vis.data.columns
                     if has_color:
-                        df = pd.DataFrame(
-                            {
-                                columns[0]: attr_unique_vals * color_cardinality,
-                                columns[1]: pd.Series(color_attr_vals).repeat(N_unique_vals),
-                            }
+                        vis._vis_data = PandasExecutor._fill_missing_groups(
+                            vis.data,
+                            [color_attr.attribute, groupby_attr.attribute],
+                            [color_attr_vals, attr_unique_vals],
+                            measure_attr.attribute,
                         )
-                        vis._vis_data = vis.data.merge(
-                            df,
-                            on=[columns[0], columns[1]],
-                            how="right",
-                            suffixes=["", "_right"],
-                        )
-                        for col in columns[2:]:
-                            # Triggers __setitem__
-                            vis.data[col] = vis.data[col].fillna(0)
-                        assert len(list(vis.data[groupby_attr.attribute])) == N_unique_vals * len(
-                            color_attr_vals
-                        ), f"Aggregated data missing values compared to original range of values of `{groupby_attr.attribute, color_attr.attribute}`."
-                        # Keep only the three relevant columns not the *_right columns resulting from merge
                         vis._vis_data = vis.data[
                             [groupby_attr.attribute, color_attr.attribute, measure_attr.attribute]
                         ]
-
                     else:
-                        df = pd.DataFrame({columns[0]: attr_unique_vals})
-                        vis._vis_data = vis.data.merge(
-                            df, on=columns[0], how="right", suffixes=["", "_right"]
+                        vis._vis_data = PandasExecutor._fill_missing_groups(
+                            vis.data,
+                            [groupby_attr.attribute],
+                            [attr_unique_vals],
+                            measure_attr.attribute,
                         )
 
-                        for col in columns[1:]:
-                            vis.data[col] = vis.data[col].fillna(0)
-                        assert (
-                            len(list(vis.data[groupby_attr.attribute])) == N_unique_vals
-                        ), f"Aggregated data missing values compared to original range of values of `{groupby_attr.attribute}`."
-
             vis._vis_data = vis._vis_data.dropna(subset=[measure_attr.attribute])
             try:
                 vis._vis_data = vis._vis_data.sort_values(by=groupby_attr.attribute, ascending=True)
@@ -298,7 +347,82 @@ class PandasExecutor(Executor):
             vis._vis_data = vis._vis_data.drop(columns="index")
 
     @staticmethod
-    def execute_binning(ldf: LuxDataFrame, vis: Vis):
+    def _fill_missing_groups(data: pd.DataFrame, group_attrs: list, group_vals: list, measure) -> pd.DataFrame:
+        """
+        Complete aggregated data with every combination of the values of its group attributes,
+        setting the measure of the groups missing from the data to 0. The groups are located with
+        categorical codes and written in a zero-filled array, so that filling costs no more than
+        the size of the output, instead of merging with the cross product of the values.
+
+        Parameters
+        ----------
+        data : pd.DataFrame
+            Aggregated data, with one row per group
+        group_attrs : list
+            Group attributes, the first one varying the slowest in the output
+        group_vals : list
+            Values of each group attribute, rows of the data with other values are dropped
+        measure : str
+            Aggregated attribute
+
+        Returns
+        -------
+        pd.DataFrame
+            Data with the group attributes and measure, with one row per combination of values
+        """
+        import numpy as np
+
+        levels = []
+        positions = np.zeros(len(data), dtype=np.int64)
+        kept = np.ones(len(data), dtype=bool)
+        for attr, vals in zip(group_attrs, group_vals):
+            vals = pd.Index(vals)
+            categories = vals[vals.notna()]
+            codes = pd.Categorical(data[attr], categories=categories).codes.astype(np.int64)
+            if len(categories) < len(vals):
+                # missing values (None or NaN) form the last group
+                codes[pd.isna(data[attr]).to_numpy()] = len(categories)
+                categories = categories.append(pd.Index([np.nan]))
+            kept &= codes >= 0
+            positions = positions * len(categories) + codes
+            levels.append(categories)
+        num_groups = int(np.prod([len(level) for level in levels]))
+        measures = data[measure].to_numpy()
+        filled = np.zeros(num_groups, dtype=measures.dtype if measures.dtype.kind in "iufc" else object)
+        filled[positions[kept]] = measures[kept]
+        groups = pd.MultiIndex.from_product(levels, names=group_attrs).to_frame(index=False)
+        groups[measure] = filled
+        return groups
+
+    @staticmethod
+    def _record_counts(vis: Vis, attribute):
+        """
+        Number of records per value of `attribute` over the whole source dataframe, served from the
+        value counts kept in its metadata (see `lux.config.value_counts`) instead of a groupby
+
+        Returns
+        -------
+        LuxDataFrame
+            The values of the attribute and their "Record" count, or None if the counts were not kept
+            or if the charts of the source dataframe are computed on a sample of its rows
+        """
+        source = vis._source
+        value_counts = getattr(source, "_value_counts", None) or {}
+        if (
+            attribute not in value_counts
+            or not getattr(source, "_metadata_fresh", False)
+            # counts of the whole dataframe would not match the other charts of a sample
+            or getattr(source, "_sampled", None) is not source
+        ):
+            return None
+        counts = pd.DataFrame(
+            {attribute: source.unique_values[attribute].values, "Record": value_counts[attribute]}
+        )
+        # values that are all missing (e.g., None and NaN) form a single group, as in a groupby
+        return counts.groupby(attribute, dropna=False, history=False)["Record"].sum().reset_index()
+
+    @staticmethod
+    def execute_binning(ldf: LuxDataFrame, vis: Vis, source: pd.DataFrame = None):
         """
         Binning of data points for generating histograms
 
@@ -308,6 +432,8 @@ class PandasExecutor(Executor):
             lux.Vis object that represents a visualization
         ldf : lux.core.frame
             LuxDataFrame with specified intent.
+        source : pd.DataFrame, optional
+            Unfiltered data the vis data was projected from, whose cached bin codes are counted
 
         Returns
         -------
@@ -315,10 +441,20 @@ class PandasExecutor(Executor):
         """
         import numpy as np
 
-        vis._vis_data = vis._vis_data.replace([np.inf, -np.inf], np.nan)
-
         bin_attribute = [x for x in vis._inferred_intent if x.bin_size != 0][0]
         bin_attr = bin_attribute.attribute
+        bin_codes = PandasExecutor._bin_codes_cache(ldf, source).get((bin_attr, bin_attribute.bin_size))
+        if bin_codes is not None:
+            if bin_codes.has_missing:
+                ldf._message.add_unique(
+                    f"The column <code>{bin_attr}</code> contains missing values, not shown in the displayed histogram.",
+                    priority=100,
+                )
+            binned_result = np.array([bin_codes.edges[0:-1], bin_codes.counts()]).T
+            vis._vis_data = pd.DataFrame(binned_result, columns=[bin_attr, "Number of Records"])
+            return
+
+        vis._vis_data = vis._vis_data.replace([np.inf, -np.inf], np.nan)
         series = vis.data[bin_attr]
 
         if series.hasnans:
@@ -328,7 +464,8 @@ class PandasExecutor(Executor):
             )
             series = series.dropna()
         if pd.api.types.is_object_dtype(series):
-            series = series.astype("float", errors="ignore")
+            parsed = PandasExecutor._get_parsed_column(ldf, bin_attr, series)
+            series = parsed if parsed is not None else series.astype("float", errors="ignore")
 
         if is_timedelta64_series(series):
             series = timedelta64_to_float_seconds(series)
@@ -340,19 +477,66 @@ class PandasExecutor(Executor):
         vis._vis_data = pd.DataFrame(binned_result, columns=[bin_attr, "Number of Records"])
 
     @staticmethod
-    def execute_filter(vis: Vis) -> bool:
+    def _bin_codes_cache(ldf: LuxDataFrame, source) -> dict:
+        """
+        Bin codes (see `lux.utils.binning_utils.BinCodes`) cached on `ldf` for the columns of
+        `source`, the unfiltered data of its vis (its sample, or approximate sample), by
+        (attribute, number of bins) for histograms and (attribute, number of bins, "cut") for
+        heatmaps. Empty if there is no unfiltered data to cache the bin codes of.
+        """
+        if source is None or ldf is None or not hasattr(source, "fingerprint"):
+            return {}
+        fingerprint = source.fingerprint()
+        caches = getattr(ldf, "_bin_codes", None)
+        if caches is None:
+            caches = ldf._bin_codes = {}
+        if fingerprint not in caches and len(caches) >= 2:
+            # only the codes of the sample and approximate sample of the current data are reused
+            caches.clear()
+        return caches.setdefault(fingerprint, {})
+
+    @staticmethod
+    def _compute_histogram_bin_codes(ldf: LuxDataFrame, source, vislist: VisList) -> None:
+        """
+        Compute the missing bin codes of the columns of the unfiltered histograms of a VisList,
+        vectorized across columns with the same number of bins
+        """
+        if source is None or not hasattr(source, "fingerprint") or not source.columns.is_unique:
+            return
+        cache = PandasExecutor._bin_codes_cache(ldf, source)
+        attributes = {}
+        for vis in vislist:
+            if vis.mark != "histogram" or utils.get_filter_specs(vis._inferred_intent):
+                continue
+            for clause in vis._inferred_intent:
+                if clause.bin_size != 0 and clause.attribute in source.columns:
+                    attrs = attributes.setdefault(clause.bin_size, [])
+                    if (clause.attribute, clause.bin_size) not in cache and clause.attribute not in attrs:
+                        attrs.append(clause.attribute)
+                    break
+        for bins, attrs in attributes.items():
+            attrs = [attr for attr in attrs if can_bin_codes(source[attr])]
+            for attr, bin_codes in histogram_bin_codes(source, attrs, bins).items():
+                cache[(attr, bins)] = bin_codes
+
+    @staticmethod
+    def execute_filter(vis: Vis, attributes=None) -> bool:
         """
         Apply a Vis's filter to vis.data
 
         Parameters
         ----------
         vis : Vis
+        attributes : set, optional
+            Only take these attributes of the filtered rows, by default every column is kept
 
         Returns
         -------
         bool
             Boolean flag indicating if any filter was applied
         """
+        import numpy as np
+
         assert (
             vis.data is not None
         ), "execute_filter assumes input vis.data is populated (if not, populate with LuxDataFrame values)"
@@ -360,14 +544,46 @@ class PandasExecutor(Executor):
 
         if filters:
             # TODO: Need to handle OR logic
-            for filter in filters:
-                vis._vis_data = PandasExecutor.apply_filter(
-                    vis.data, filter.attribute, filter.filter_op, filter.value
-                )
+            rows = np.flatnonzero(PandasExecutor.filter_mask(vis.data, filters))
+            vis._vis_data = PandasExecutor.take_rows(vis.data, rows, attributes)
             return True
         else:
             return False
 
+    @staticmethod
+    def take_rows(df: pd.DataFrame, rows, attributes=None) -> pd.DataFrame:
+        """
+        Rows of a dataframe, by position, and only some of its columns: the columns are taken one
+        by one from the selected rows, so that the other columns of these rows are not copied
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+            Dataframe to take the rows of
+        rows : array-like
+            Positions of the rows
+        attributes : set, optional
+            Columns to take, by default every column
+
+        Returns
+        -------
+        df: pandas.DataFrame
+            Rows of the dataframe, with the columns of the same dataframe type and metadata as
+            `df.iloc[rows]`
+        """
+        import numpy as np
+
+        rows = np.asarray(rows, dtype=np.intp)
+        if attributes is None:
+            return df.iloc[rows]
+        if not df.columns.is_unique:
+            return df.iloc[rows][list(attributes)]
+        columns = {attr: df[attr].array.take(rows) for attr in attributes}
+        result = df._constructor(columns, index=df.index.take(rows)).__finalize__(df, method="take")
+        if hasattr(df, "_derive_metadata"):
+            df._derive_metadata(result)
+        return result
+
     @staticmethod
     def apply_filter(df: pd.DataFrame, attribute: str, op: str, val: object) -> pd.DataFrame:
         """
@@ -389,40 +605,82 @@ class PandasExecutor(Executor):
         df: pandas.DataFrame
             Dataframe resulting from the filter operation
         """
-        # Handling NaN filter values
-        if utils.like_nan(val):
-            if op != "=" and op != "!=":
-                warnings.warn("Filter on NaN must be used with equality operations (i.e., `=` or `!=`)")
-            else:
-                if op == "=":
-                    return df[df[attribute].isna()]
-                elif op == "!=":
-                    return df[~df[attribute].isna()]
-        # Applying filter in regular, non-NaN cases
-        if op == "=":
-            return df[df[attribute] == val]
-        elif op == "<":
-            return df[df[attribute] < val]
-        elif op == ">":
-            return df[df[attribute] > val]
-        elif op == "<=":
-            return df[df[attribute] <= val]
-        elif op == ">=":
-            return df[df[attribute] >= val]
-        elif op == "!=":
-            return df[df[attribute] != val]
-        return df
-
-    @staticmethod
-    def execute_2D_binning(vis: Vis) -> None:
+        mask = PandasExecutor.predicate_mask(df, attribute, op, val)
+        if mask is None:
+            return df
+        return df[mask]
+
+    @staticmethod
+    def predicate_mask(df: pd.DataFrame, attribute: str, op: str, val: object):
+        """
+        Boolean mask of the rows of a dataframe satisfying a filter, read from the predicate cache
+        of the dataframe (see `lux.utils.predicate_cache.PredicateCache`) when it was evaluated
+        before on the same data
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+            Dataframe to filter on
+        attribute : str
+            Filter attribute
+        op : str
+            Filter operation, '=', '<', '>', '<=', '>=', '!='
+        val : object
+            Filter value
+
+        Returns
+        -------
+        np.ndarray
+            Read-only mask of the rows kept by the filter, or None if the operation is not supported
+        """
+        cache = predicate_cache(df)
+        if cache is None:
+            return evaluate_predicate(df[attribute], op, val)
+        return cache.mask(df, attribute, op, val)
+
+    @staticmethod
+    def filter_mask(df: pd.DataFrame, filters: list):
+        """
+        Boolean mask of the rows of a dataframe satisfying all the filters (combined with AND), so
+        that the rows are taken once instead of once per filter
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+            Dataframe to filter on
+        filters : list
+            Filter clauses
+
+        Returns
+        -------
+        np.ndarray
+            Mask of the rows kept by the filters
+        """
+        import numpy as np
+
+        mask = np.ones(len(df), dtype=bool)
+        for clause in filters:
+            clause_mask = PandasExecutor.predicate_mask(df, clause.attribute, clause.filter_op, clause.value)
+            if clause_mask is not None:
+                mask &= clause_mask
+        return mask
+
+    @staticmethod
+    def execute_2D_binning(vis: Vis, ldf: LuxDataFrame = None, source: pd.DataFrame = None) -> None:
         """
         Apply 2D binning (heatmap) to vis.data
 
         Parameters
         ----------
         vis : Vis
+        ldf : LuxDataFrame, optional
+            Dataframe the bin codes of the unfiltered data are cached on
+        source : pd.DataFrame, optional
+            Unfiltered data the vis data was projected from, whose columns are binned once for all
+            the heatmaps
         """
         import numpy as np
+        from lux.utils.binning_utils import cut_bin_codes, heatmap_cells
 
         vis._vis_data = vis._vis_data.replace([np.inf, -np.inf], np.nan)
 
@@ -431,57 +689,48 @@ class PandasExecutor(Executor):
             x_attr = vis.get_attr_by_channel("x")[0].attribute
             y_attr = vis.get_attr_by_channel("y")[0].attribute
 
-            if vis.data[x_attr].dtype == np.dtype("O"):
-                mixed_dtype = len(set(type(val) for val in vis.data[x_attr])) >= 2
-                if mixed_dtype:
-                    try:
-                        vis.data[x_attr] = vis.data[x_attr].astype(float)
-                    except ValueError:
-                        pass
-
-            if vis.data[y_attr].dtype == np.dtype("O"):
-                mixed_dtype = len(set(type(val) for val in vis.data[y_attr])) >= 2
-                if mixed_dtype:
-                    try:
-                        vis.data[y_attr] = vis.data[y_attr].astype(float)
-                    except ValueError:
-                        pass
-
-            vis._vis_data["xBin"] = pd.cut(vis._vis_data[x_attr], bins=lux.config.heatmap_bin_size)
-            vis._vis_data["yBin"] = pd.cut(vis._vis_data[y_attr], bins=lux.config.heatmap_bin_size)
+            # values of mixed types (e.g., numbers stored as strings) are binned as floats
+            if pd.api.types.infer_dtype(vis.data[x_attr], skipna=False).startswith("mixed"):
+                try:
+                    vis.data[x_attr] = vis.data[x_attr].astype(float)
+                except ValueError:
+                    pass
+
+            if pd.api.types.infer_dtype(vis.data[y_attr], skipna=False).startswith("mixed"):
+                try:
+                    vis.data[y_attr] = vis.data[y_attr].astype(float)
+                except ValueError:
+                    pass
+
+            if source is None:
+                x_bins = cut_bin_codes(vis._vis_data[x_attr], bins=lux.config.heatmap_bin_size)
+                y_bins = cut_bin_codes(vis._vis_data[y_attr], bins=lux.config.heatmap_bin_size)
+            else:
+                x_bins, y_bins = PandasExecutor._cached_cut_bin_codes(ldf, source, vis, x_attr, y_attr)
 
+            # count the rows of each cell, and take the average color of each cell, or the most
+            # frequent color for nominal colors (the smallest one in case of ties)
             color_attr = vis.get_attr_by_channel("color")
             if len(color_attr) > 0:
                 color_attr = color_attr[0]
-                groups = vis._vis_data.groupby(["xBin", "yBin"], history=False)[color_attr.attribute]
-                if color_attr.data_type == "nominal":
-                    # Compute mode and count. Mode aggregates each cell by taking the majority vote for the category variable. In cases where there is ties across categories, pick the first item (.iat[0])
-                    result = groups.agg(
-                        [
-                            ("count", "count"),
-                            (color_attr.attribute, lambda x: pd.Series.mode(x).iat[0]),
-                        ]
-                    ).reset_index()
-                elif color_attr.data_type == "quantitative" or color_attr.data_type == "temporal":
-                    # Compute the average of all values in the bin
-                    result = groups.agg(
-                        [("count", "count"), (color_attr.attribute, "mean")]
-                    ).reset_index()
-                result = result.dropna()
+                color = vis._vis_data[color_attr.attribute]
+                vis._vis_data = heatmap_cells(x_bins, y_bins, color, color_attr.data_type)
             else:
-                groups = vis._vis_data.groupby(["xBin", "yBin"], history=False)[x_attr]
-                result = groups.count().reset_index(name=x_attr)
-                result = result.rename(columns={x_attr: "count"})
-                result = result[result["count"] != 0]
-
-            # convert type to facilitate weighted correlation interestingess calculation
-            result["xBinStart"] = result["xBin"].apply(lambda x: x.left).astype("float")
-            result["xBinEnd"] = result["xBin"].apply(lambda x: x.right)
-
-            result["yBinStart"] = result["yBin"].apply(lambda x: x.left).astype("float")
-            result["yBinEnd"] = result["yBin"].apply(lambda x: x.right)
+                vis._vis_data = heatmap_cells(x_bins, y_bins)
 
-            vis._vis_data = result.drop(columns=["xBin", "yBin"])
+    @staticmethod
+    def _cached_cut_bin_codes(ldf: LuxDataFrame, source, vis: Vis, x_attr, y_attr) -> tuple:
+        """
+        `pd.cut` bin codes of the x and y attributes of an unfiltered heatmap, cut once for all the
+        heatmaps of the same data
+        """
+        cache = PandasExecutor._bin_codes_cache(ldf, source)
+        for attr in (x_attr, y_attr):
+            key = (attr, lux.config.heatmap_bin_size, "cut")
+            if key not in cache:
+                cache[key] = cut_bin_codes(vis._vis_data[attr], lux.config.heatmap_bin_size)
+        bins = lux.config.heatmap_bin_size
+        return cache[(x_attr, bins, "cut")], cache[(y_attr, bins, "cut")]
 
     #######################################################
     ############ Metadata: data type, model #############
@@ -490,79 +739,29 @@ class PandasExecutor(Executor):
         ldf._data_type = {}
         self.compute_data_type(ldf)
 
-    def compute_data_type(self, ldf: LuxDataFrame):
+    def compute_data_type(self, ldf: LuxDataFrame, attributes=None):
         from pandas.api.types import is_datetime64_any_dtype as is_datetime
 
-        for attr in list(ldf.columns):
-            if attr in ldf._type_override:
-                ldf._data_type[attr] = ldf._type_override[attr]
-            else:
-                temporal_var_list = ["month", "year", "day", "date", "time", "weekday"]
-
-                if is_timedelta64_series(ldf[attr]):
-                    ldf._data_type[attr] = "quantitative"
-                    ldf._min_max[attr] = (
-                        timedelta64_to_float_seconds(ldf[attr].min()),
-                        timedelta64_to_float_seconds(ldf[attr].max()),
-                    )
-                elif is_datetime(ldf[attr]):
-                    ldf._data_type[attr] = "temporal"
-                elif self._is_datetime_string(ldf[attr]):
-                    ldf._data_type[attr] = "temporal"
-                elif isinstance(attr, pd._libs.tslibs.timestamps.Timestamp):
-                    ldf._data_type[attr] = "temporal"
-                elif str(attr).lower() in temporal_var_list:
-                    ldf._data_type[attr] = "temporal"
-                elif self._is_datetime_number(ldf[attr]):
-                    ldf._data_type[attr] = "temporal"
-                elif self._is_geographical_attribute(ldf[attr]):
-                    ldf._data_type[attr] = "geographical"
-                elif pd.api.types.is_float_dtype(ldf.dtypes[attr]):
-                    if ldf.cardinality[attr] != len(ldf) and (ldf.cardinality[attr] < 20):
-                        ldf._data_type[attr] = "nominal"
-                    else:
-                        ldf._data_type[attr] = "quantitative"
-                elif pd.api.types.is_integer_dtype(ldf.dtypes[attr]):
-                    # See if integer value is quantitative or nominal by checking if the ratio of cardinality/data size is less than 0.4 and if there are less than 10 unique values
-                    if ldf.pre_aggregated:
-                        if ldf.cardinality[attr] == len(ldf):
-                            ldf._data_type[attr] = "nominal"
-                    if ldf.cardinality[attr] / len(ldf) < 0.4 and ldf.cardinality[attr] < 20:
-                        ldf._data_type[attr] = "nominal"
-                    else:
-                        ldf._data_type[attr] = "quantitative"
-                    if check_if_id_like(ldf, attr):
-                        ldf._data_type[attr] = "id"
-                # Eliminate this clause because a single NaN value can cause the dtype to be object
-                elif pd.api.types.is_string_dtype(ldf.dtypes[attr]):
-                    # Check first if it's castable to float after removing NaN
-                    try:
-                        # HACK:
-                        # Re-structured because it seems that there might be delays in modin's computation.
-                        # where series.min, series.max would force evaluation of the queries.
-                        series = ldf[attr].astype("float")
-                        # int columns gets coerced into floats if contain NaN
-                        ldf._data_type[attr] = "quantitative"
-                        # min max was not computed since object type, so recompute here
-                        ldf._min_max[attr] = (
-                            series.min(),
-                            series.max(),
-                        )
-                    except:
-                        if check_if_id_like(ldf, attr):
-                            ldf._data_type[attr] = "id"
-                        else:
-                            ldf._data_type[attr] = "nominal"
-                # check if attribute is any type of datetime dtype
-                elif is_datetime_series(ldf.dtypes[attr]):
-                    ldf._data_type[attr] = "temporal"
-                else:
-                    ldf._data_type[attr] = "nominal"
+        if attributes is None:
+            attributes = list(ldf.columns)
+            # Full-column conversions made while inferring types, reused later (e.g., by execute_binning)
+            ldf._parsed_columns = {}
+        # extract the columns up front, so that worker threads only read the item cache of `ldf`
+        columns = [(attr, ldf[attr]) for attr in attributes]
+        column_results = PandasExecutor._map_columns(
+            lambda column: self._infer_data_type(ldf, *column), columns, len(ldf)
+        )
+        for attr, (data_type, min_max, parsed_column) in zip(attributes, column_results):
+            ldf._data_type[attr] = data_type
+            if min_max is not None:
+                ldf._min_max[attr] = min_max
+            if parsed_column is not None:
+                ldf._parsed_columns[attr] = parsed_column
         if not pd.api.types.is_integer_dtype(ldf.index) and ldf.index.name:
             ldf._data_type[ldf.index.name] = "nominal"
 
         non_datetime_attrs = []
-        for attr in ldf.columns:
+        for attr in attributes:
             if ldf._data_type[attr] == "temporal" and not is_datetime(ldf[attr]):
                 non_datetime_attrs.append(attr)
         warn_msg = ""
@@ -579,23 +778,111 @@ class PandasExecutor(Executor):
             warn_msg += f"\n\tdf.set_data_type({{'{attr}':'quantitative'}})"
             warnings.warn(warn_msg, stacklevel=2)
 
+    def _infer_data_type(self, ldf: LuxDataFrame, attr, series):
+        """
+        Infer the data type of one column of the dataframe
+
+        Returns
+        -------
+        Tuple[str, tuple, pd.Series]
+            The data type, the (min, max) of the column if it had to be computed during inference
+            (otherwise None), and the full-column conversion made during inference (otherwise None)
+        """
+        from pandas.api.types import is_datetime64_any_dtype as is_datetime
+
+        if attr in ldf._type_override:
+            return ldf._type_override[attr], None, None
+        file_metadata = getattr(ldf, "_file_metadata", None)
+        if file_metadata is not None and attr in file_metadata.data_type:
+            return file_metadata.data_type[attr], None, None
+        temporal_var_list = ["month", "year", "day", "date", "time", "weekday"]
+        parsed_columns = {}
+        if is_timedelta64_series(series):
+            min_max = (
+                timedelta64_to_float_seconds(series.min()),
+                timedelta64_to_float_seconds(series.max()),
+            )
+            return "quantitative", min_max, None
+        elif is_datetime(series):
+            return "temporal", None, None
+        elif self._is_datetime_string(series, parsed_columns):
+            return "temporal", None, parsed_columns.get(series.name)
+        elif isinstance(attr, pd._libs.tslibs.timestamps.Timestamp):
+            return "temporal", None, None
+        elif str(attr).lower() in temporal_var_list:
+            return "temporal", None, None
+        elif self._is_datetime_number(series):
+            return "temporal", None, None
+        elif self._is_geographical_attribute(series):
+            return "geographical", None, None
+        elif pd.api.types.is_float_dtype(series.dtype):
+            if ldf.cardinality[attr] != len(ldf) and (ldf.cardinality[attr] < 20):
+                return "nominal", None, None
+            return "quantitative", None, None
+        elif pd.api.types.is_integer_dtype(series.dtype):
+            # See if integer value is quantitative or nominal by checking if the ratio of cardinality/data size is less than 0.4 and if there are less than 10 unique values
+            if ldf.cardinality[attr] / len(ldf) < 0.4 and ldf.cardinality[attr] < 20:
+                data_type = "nominal"
+            else:
+                data_type = "quantitative"
+            if check_if_id_like(ldf, attr):
+                data_type = "id"
+            return data_type, None, None
+        # Eliminate this clause because a single NaN value can cause the dtype to be object
+        elif pd.api.types.is_string_dtype(series.dtype):
+            # Check first if it's castable to float after removing NaN
+            float_col = self._parse_float(series)
+            if float_col is not None:
+                # int columns gets coerced into floats if contain NaN
+                # min max was not computed since object type, so recompute here
+                return "quantitative", (float_col.min(), float_col.max()), float_col
+            elif check_if_id_like(ldf, attr):
+                return "id", None, None
+            return "nominal", None, None
+        # check if attribute is any type of datetime dtype
+        elif is_datetime_series(series.dtype):
+            return "temporal", None, None
+        return "nominal", None, None
+
+    @staticmethod
+    def _inference_sample(series, sample_size=TYPE_INFERENCE_SAMPLE_SIZE):
+        """
+        Deterministic, evenly-spaced sample of the non-null values of a column. Types are decided on
+        this sample first, since a conversion that fails on the sample also fails on the full column.
+        """
+        import numpy as np
+
+        if len(series) > sample_size:
+            positions = np.linspace(0, len(series) - 1, num=sample_size).astype(int)
+            series = series.iloc[positions]
+        return series.dropna()
+
     @staticmethod
-    def _is_datetime_string(series):
+    def _can_convert(convert, series) -> bool:
+        try:
+            convert(series)
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _is_datetime_string(series, parsed_columns=None):
         if series.dtype == object:
-            not_numeric = False
+            sample = PandasExecutor._inference_sample(series)
+            # Only numeric-looking samples need confirming on the full column
+            if PandasExecutor._can_convert(pd.to_numeric, sample) and PandasExecutor._can_convert(
+                pd.to_numeric, series
+            ):
+                return False
+            if not PandasExecutor._can_convert(pd.to_datetime, sample):
+                return False
             try:
-                pd.to_numeric(series)
+                datetime_col = pd.to_datetime(series)
             except Exception as e:
-                not_numeric = True
-
-            datetime_col = None
-            if not_numeric:
-                try:
-                    datetime_col = pd.to_datetime(series)
-                except Exception as e:
-                    return False
-            if datetime_col is not None:
-                return True
+                return False
+            if parsed_columns is not None:
+                parsed_columns[series.name] = datetime_col
+            return True
         return False
 
     @staticmethod
@@ -608,6 +895,9 @@ class PandasExecutor(Executor):
     def _is_datetime_number(series):
         is_int_dtype = pd.api.types.is_integer_dtype(series.dtype)
         if is_int_dtype:
+            sample = PandasExecutor._inference_sample(series)
+            if not PandasExecutor._can_convert(lambda s: pd.to_datetime(s.astype(str)), sample):
+                return False
             try:
                 temp = series.astype(str)
                 pd.to_datetime(temp)
@@ -616,32 +906,451 @@ class PandasExecutor(Executor):
                 return False
         return False
 
-    def compute_stats(self, ldf: LuxDataFrame):
-        # precompute statistics
-        ldf.unique_values = {}
-        ldf._min_max = {}
-        ldf.cardinality = {}
-        ldf._length = len(ldf)
-
-        for attribute in ldf.columns:
-            if isinstance(attribute, pd._libs.tslibs.timestamps.Timestamp):
-                # If timestamp, make the dictionary keys the _repr_ (e.g., TimeStamp('2020-04-05 00.000')--> '2020-04-05')
-                attribute_repr = str(attribute._date_repr)
+    @staticmethod
+    def _parse_float(series):
+        """
+        Cast a column to float, returning None if any of its values cannot be cast
+        """
+        sample = PandasExecutor._inference_sample(series)
+        if not PandasExecutor._can_convert(lambda s: s.astype("float"), sample):
+            return None
+        try:
+            # HACK:
+            # Re-structured because it seems that there might be delays in modin's computation.
+            # where series.min, series.max would force evaluation of the queries.
+            return series.astype("float")
+        except Exception:
+            return None
+
+    @staticmethod
+    def _get_parsed_column(ldf: LuxDataFrame, attr, series):
+        """
+        Return the values of `series` (a subset of rows of `ldf[attr]`) from the conversion cached
+        during type inference, or None if there is no usable cached conversion
+        """
+        parsed_columns = getattr(ldf, "_parsed_columns", None)
+        if parsed_columns and attr in parsed_columns and ldf.index.is_unique:
+            return parsed_columns[attr].reindex(series.index)
+        return None
+
+    def compute_stats(self, ldf: LuxDataFrame, attributes=None):
+        """
+        Compute per-column statistics (unique values, cardinality, min/max, null counts and
+        evenly-spaced checks) for all columns of the dataframe.
+
+        Columns are grouped by dtype so that min/max and null counts are computed with one
+        vectorized reduction over each block rather than one Python-level call per column.
+
+        Parameters
+        ----------
+        ldf : lux.core.frame
+            LuxDataFrame whose metadata will be populated
+        attributes : list, optional
+            Only (re)compute the statistics of these columns, keeping the entries of all other
+            columns. By default, the statistics of every column are recomputed from scratch.
+        """
+        import numpy as np
+
+        # Work on a plain pandas view so that column access does not propagate Lux metadata
+        df = ldf.to_pandas()
+        if attributes is None:
+            # precompute statistics
+            ldf.unique_values = {}
+            ldf._min_max = {}
+            ldf.cardinality = {}
+            ldf._null_count = {}
+            ldf._evenly_spaced = {}
+            ldf._value_counts = {}
+            ldf._length = len(ldf)
+        else:
+            df = df[list(attributes)]
+            if getattr(ldf, "_value_counts", None) is None:
+                ldf._value_counts = {}
+        numeric_attrs = [
+            attr
+            for attr, dtype in df.dtypes.items()
+            if pd.api.types.is_float_dtype(dtype) or pd.api.types.is_integer_dtype(dtype)
+        ]
+        # statistics supplied by the file the rows were read from are not recomputed
+        file_metadata = getattr(ldf, "_file_metadata", None)
+        file_null_count = file_metadata.null_count if file_metadata is not None else {}
+        file_min_max = file_metadata.min_max if file_metadata is not None else {}
+        file_distinct_count = file_metadata.distinct_count if file_metadata is not None else {}
+        null_counts = dict(file_null_count)
+        null_count_attrs = [attr for attr in df.columns if attr not in file_null_count]
+        if null_count_attrs:
+            null_counts.update(len(df) - df[null_count_attrs].count())
+        scanned_numeric_attrs = [attr for attr in numeric_attrs if attr not in file_min_max]
+        if scanned_numeric_attrs:
+            mins = df[scanned_numeric_attrs].min()
+            maxs = df[scanned_numeric_attrs].max()
+
+        sketch = lux.config.sketch_metadata
+        threshold = lux.config.unique_values_threshold
+        heavy_hitters_cap = lux.config.heavy_hitters_cap
+        keep_value_counts = lux.config.value_counts
+
+        def column_stats(series):
+            value_counts = None
+            if sketch and len(series) > threshold:
+                # keep a cardinality estimate and the most frequent values instead of every unique value
+                unique_values, cardinality = sketch_column(
+                    series, threshold, heavy_hitters_cap, cardinality=file_distinct_count.get(series.name)
+                )
+            elif keep_value_counts and not pd.api.types.is_categorical_dtype(series.dtype):
+                # counting the values hashes them once, and lists them in the same order as `unique`
+                counts = series.value_counts(dropna=False, sort=False)
+                unique_values = UniqueValues(counts.index)
+                value_counts = counts.to_numpy()
+                cardinality = len(unique_values)
             else:
-                attribute_repr = attribute
+                unique_values = UniqueValues(series.unique())
+                cardinality = len(unique_values)
+            evenly_spaced = None
+            # Evenly-spaced check only matters for high-cardinality integer columns (see check_if_id_like)
+            if pd.api.types.is_integer_dtype(series.dtype) and cardinality > 500:
+                diff = np.diff(series.to_numpy(dtype="float64", na_value=np.nan))
+                evenly_spaced = bool(len(diff) == 0 or (diff == diff[0]).all())
+            return unique_values, cardinality, evenly_spaced, value_counts
+
+        column_results = PandasExecutor._map_columns(
+            column_stats, [df[attribute] for attribute in df.columns], len(df)
+        )
+        for attribute, (unique_values, cardinality, evenly_spaced, value_counts) in zip(
+            df.columns, column_results
+        ):
+            attribute_repr = PandasExecutor._attribute_repr(attribute)
+            ldf.unique_values[attribute_repr] = unique_values
+            ldf.cardinality[attribute_repr] = cardinality
+            ldf._null_count[attribute_repr] = int(null_counts[attribute])
+            if evenly_spaced is not None:
+                ldf._evenly_spaced[attribute_repr] = evenly_spaced
+            if value_counts is not None:
+                ldf._value_counts[attribute_repr] = value_counts
+
+        for attribute in numeric_attrs:
+            attribute_repr = PandasExecutor._attribute_repr(attribute)
+            dtype = df.dtypes[attribute]
+            if attribute in file_min_max:
+                ldf._min_max[attribute_repr] = tuple(dtype.type(value) for value in file_min_max[attribute])
+                continue
+            ldf._min_max[attribute_repr] = (
+                PandasExecutor._as_dtype_scalar(mins[attribute], dtype, df[attribute].min),
+                PandasExecutor._as_dtype_scalar(maxs[attribute], dtype, df[attribute].max),
+            )
 
-            ldf.unique_values[attribute_repr] = list(ldf[attribute].unique())
-            ldf.cardinality[attribute_repr] = len(ldf.unique_values[attribute_repr])
+        if attributes is None:
+            self.compute_index_stats(ldf)
 
-            if pd.api.types.is_float_dtype(ldf.dtypes[attribute]) or pd.api.types.is_integer_dtype(
-                ldf.dtypes[attribute]
-            ):
-                ldf._min_max[attribute_repr] = (
-                    ldf[attribute].min(),
-                    ldf[attribute].max(),
+    def compute_index_stats(self, ldf: LuxDataFrame):
+        """
+        Compute the unique values and cardinality of a (non-integer) index, which is charted like a column
+        """
+        if pd.api.types.is_integer_dtype(ldf.index):
+            return
+        index_column_name = ldf.index.name
+        threshold = lux.config.unique_values_threshold
+        if lux.config.sketch_metadata and len(ldf.index) > threshold:
+            ldf.unique_values[index_column_name] = sketch_column(
+                ldf.index.to_series(index=False), threshold, lux.config.heavy_hitters_cap
+            )[0]
+        else:
+            # the index is already an array of its values, keep it rather than boxing every value
+            ldf.unique_values[index_column_name] = UniqueValues(ldf.index)
+        ldf.cardinality[index_column_name] = len(ldf.index)
+
+    @staticmethod
+    def _map_columns(func, columns, num_rows):
+        """
+        Apply `func` to each column, using a thread pool of `lux.config.metadata_workers` threads
+        for frames of at least PARALLEL_METADATA_MIN_ROWS rows. Most pandas/NumPy kernels release the
+        GIL, so columns are processed concurrently. Results are returned in the order of `columns`,
+        so the metadata is merged in the same order as when computed serially.
+        """
+        workers = min(lux.config.metadata_workers, len(columns))
+        if workers > 1 and num_rows >= PARALLEL_METADATA_MIN_ROWS:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                return list(pool.map(func, columns))
+        return [func(column) for column in columns]
+
+    @staticmethod
+    def _attribute_repr(attribute):
+        if isinstance(attribute, pd._libs.tslibs.timestamps.Timestamp):
+            # If timestamp, make the dictionary keys the _repr_ (e.g., TimeStamp('2020-04-05 00.000')--> '2020-04-05')
+            return str(attribute._date_repr)
+        return attribute
+
+    @staticmethod
+    def _as_dtype_scalar(value, dtype, fallback):
+        """
+        Frame-level reductions upcast mixed int/float results to float; cast the reduced value back
+        to the column's own scalar type so `_min_max` matches a per-column `Series.min()`/`max()`.
+        """
+        if pd.api.types.is_integer_dtype(dtype) and not pd.isna(value):
+            if abs(value) >= 2**53:
+                # float upcast may have lost precision, recompute exactly on this column
+                return fallback()
+            return dtype.type(value)
+        return value
+
+
+class SharedAggregation:
+    """
+    Plan for computing the charts of a VisList in shared scans of the data, instead of filtering
+    and aggregating the data once per chart.
+
+    - Charts filtered on the same attribute with an equality filter (e.g., the Filter action) are
+      filtered with the row positions of each value, found with a single groupby.
+    - Uncolored bar and line charts sharing their group-by attribute and their filters, or only
+      differing by the value of their equality filter, are aggregated by one groupby.
+
+    The other charts are filtered and aggregated on their own by `PandasExecutor`.
+    """
+
+    def __init__(self, vislist: VisList):
+        self._plans = {}
+        partition_counts = {}
+        measures = {}
+        for vis in vislist:
+            plan = SharedAggregation.plan(vis)
+            if plan is None:
+                continue
+            self._plans[id(vis)] = plan
+            filters, partition, key, measure = plan
+            if partition is not None:
+                partition_counts[partition[0]] = partition_counts.get(partition[0], 0) + 1
+            if key is not None:
+                measures.setdefault(key, []).append(measure)
+        # only scans shared by at least two charts are worth planning
+        self._partitioned = {attr for attr, count in partition_counts.items() if count > 1}
+        self._measures = {key: measure_lst for key, measure_lst in measures.items() if len(measure_lst) > 1}
+        self._positions = {}
+        self._filtered_data = {}
+        self._aggregates = {}
+
+    def filter_and_aggregate(self, vis: Vis, attributes=None):
+        """
+        Filter the data of a vis, reusing the scans shared with the other charts
+
+        Parameters
+        ----------
+        vis : Vis
+        attributes : set, optional
+            Attributes of the vis, the only ones taken from the filtered rows unless the rows are
+            aggregated with other charts
+
+        Returns
+        -------
+        tuple
+            Whether a filter was applied, and the aggregated data of the vis if it was computed in
+            a shared scan (None otherwise)
+        """
+        if id(vis) not in self._plans:
+            return PandasExecutor.execute_filter(vis, attributes), None
+        filters, partition, key, measure = self._plans[id(vis)]
+        data = vis._vis_data
+        # rows aggregated with other charts keep the attributes of all these charts
+        if key in self._measures or attributes is None:
+            attributes = None
+            filtered_key = (filters, None)
+        else:
+            filtered_key = (filters, frozenset(attributes))
+        if filtered_key in self._filtered_data:
+            vis._vis_data = self._filtered_data[filtered_key]
+        elif partition is not None and self._is_partitioned(data, partition[0]):
+            attribute, value = partition
+            if attribute not in self._positions:
+                self._positions[attribute] = data.groupby(attribute, sort=False, history=False).indices
+            rows = self._positions[attribute].get(value, [])
+            vis._vis_data = PandasExecutor.take_rows(data, rows, attributes)
+            self._filtered_data[filtered_key] = vis._vis_data
+        else:
+            PandasExecutor.execute_filter(vis, attributes)
+            if key in self._measures:
+                self._filtered_data[filtered_key] = vis._vis_data
+        aggregated = None
+        if key in self._measures:
+            if key not in self._aggregates:
+                # charts partitioned by the value of their filter are aggregated on the whole data
+                source = data if key[1] is not None else vis._vis_data
+                self._aggregates[key] = SharedAggregation.aggregate(source, key, self._measures[key])
+            value = partition[1] if key[1] is not None else None
+            aggregated = self._aggregates[key].get((value, measure))
+        return len(filters) > 0, aggregated
+
+    def _is_partitioned(self, data: pd.DataFrame, attribute) -> bool:
+        """
+        Whether the charts filtered on `attribute` are filtered with the positions of each value,
+        which matches an equality filter unless values are parsed (e.g., dates given as strings)
+        """
+        if attribute not in self._partitioned:
+            return False
+        dtype = data[attribute].dtype
+        return pd.api.types.is_numeric_dtype(dtype) or pd.api.types.is_object_dtype(dtype)
+
+    @staticmethod
+    def plan(vis: Vis):
+        """
+        How a chart can be computed in scans shared with other charts
+
+        Returns
+        -------
+        tuple or None
+            (filters, partition, key, measure), where `partition` is the (attribute, value) of a
+            single equality filter, `key` the (filters, partition attribute, group-by attribute)
+            of an uncolored bar or line chart aggregated in a shared groupby, and `measure` the
+            (aggregated attributes, aggregation) of that chart. None if the chart shares nothing.
+        """
+        filter_specs = utils.get_filter_specs(vis._inferred_intent)
+        filters = tuple((clause.attribute, clause.filter_op, clause.value) for clause in filter_specs)
+        partition = None
+        if len(filters) == 1 and filters[0][1] == "=" and not utils.like_nan(filters[0][2]):
+            partition = (filters[0][0], filters[0][2])
+        key, measure = None, None
+        groupby_attr, measure_attr = SharedAggregation._aggregated_attributes(vis)
+        if groupby_attr is not None:
+            if partition is not None:
+                key = ((), partition[0], groupby_attr.attribute)
+            else:
+                key = (filters, None, groupby_attr.attribute)
+            if measure_attr.attribute == "Record":
+                measure = (("Record",), "count")
+            else:
+                # like `execute_aggregate`, every attribute of the vis data is aggregated, including
+                # the attributes the vis is filtered on (in the order `execute` selects them)
+                attributes = set([])
+                for clause in vis._inferred_intent:
+                    if clause.attribute != "Record":
+                        attributes.add(clause.attribute)
+                attributes = tuple(attr for attr in attributes if attr != groupby_attr.attribute)
+                measure = (attributes, measure_attr.aggregation)
+        if partition is None and key is None:
+            return None
+        try:
+            hash((filters, partition, key, measure))
+        except TypeError:
+            # e.g., list-valued filters
+            return None
+        return filters, partition, key, measure
+
+    @staticmethod
+    def _aggregated_attributes(vis: Vis):
+        """
+        (group-by attribute, measure attribute) clauses of an uncolored bar or line chart, or
+        (None, None) if the chart is not aggregated that way
+        """
+        if vis.mark not in ("bar", "line", "geographical") or vis.get_attr_by_channel("color"):
+            return None, None
+        x_attrs = vis.get_attr_by_channel("x")
+        y_attrs = vis.get_attr_by_channel("y")
+        if len(x_attrs) != 1 or len(y_attrs) != 1:
+            return None, None
+        x_attr, y_attr = x_attrs[0], y_attrs[0]
+        if x_attr.aggregation is None or y_attr.aggregation is None:
+            return None, None
+        if (x_attr.aggregation == "") == (y_attr.aggregation == ""):
+            return None, None
+        if x_attr.aggregation != "":
+            groupby_attr, measure_attr = y_attr, x_attr
+        else:
+            groupby_attr, measure_attr = x_attr, y_attr
+        if groupby_attr.attribute == measure_attr.attribute:
+            return None, None
+        return groupby_attr, measure_attr
+
+    @staticmethod
+    def aggregate(data: pd.DataFrame, key: tuple, measures: list) -> dict:
+        """
+        Aggregate several measures by the same attribute with a single groupby
+
+        Parameters
+        ----------
+        data : pd.DataFrame
+            Data of the charts, filtered unless the charts are partitioned by a filter attribute
+        key : tuple
+            (filters, partition attribute, group-by attribute) of the charts. When the charts are
+            partitioned, the data is grouped by the partition attribute too.
+        measures : list
+            (aggregated attributes, aggregation) of each chart, where the "Record" attribute counts
+            the rows of each group
+
+        Returns
+        -------
+        dict
+            Aggregated data of each (filter value, measure), with the same columns as
+            `execute_aggregate` computes them. Charts whose data cannot be aggregated in the shared
+            groupby are missing.
+        """
+        _, partition_attr, groupby_attr = key
+        measures = list(dict.fromkeys(measures))
+        if partition_attr is None:
+            grouped = data.groupby(groupby_attr, dropna=False, history=False)
+        elif any(pd.api.types.is_categorical_dtype(data[attr]) for attr in (partition_attr, groupby_attr)):
+            # categorical groupers produce every combination of categories
+            return {}
+        else:
+            grouped = data.groupby([partition_attr, groupby_attr], dropna=False, history=False)
+        # like a per-chart groupby, drop the attributes the aggregation does not apply to
+        columns = {}
+        for attributes, aggregation in measures:
+            if attributes != ("Record",):
+                columns[(attributes, aggregation)] = SharedAggregation._aggregated_columns(
+                    data, attributes, aggregation
                 )
+        # each (attribute, aggregation) pair is computed once, even if several charts need it
+        pairs = {}
+        for (attributes, aggregation), kept in columns.items():
+            for attr in kept:
+                pairs.setdefault((attr, aggregation), f"_{len(pairs)}")
+        try:
+            if pairs:
+                aggregated = grouped.agg(**{name: pair for pair, name in pairs.items()})
+        except (TypeError, ValueError, IndexError):
+            return {}
+        results = {}
+        for attributes, aggregation in measures:
+            if attributes == ("Record",):
+                result = grouped.size().to_frame("Record")
+            elif attributes[0] not in columns[(attributes, aggregation)]:
+                # the measure itself is not aggregated (the chart fails to compute on its own)
+                continue
+            else:
+                kept = columns[(attributes, aggregation)]
+                names = [pairs[(attr, aggregation)] for attr in kept]
+                result = aggregated[names].set_axis(kept, axis=1)
+            if partition_attr is None:
+                results[(None, (attributes, aggregation))] = SharedAggregation._finalize(
+                    result, data, attributes
+                )
+                continue
+            for value, part in result.groupby(level=0, sort=False, history=False):
+                results[(value, (attributes, aggregation))] = SharedAggregation._finalize(
+                    part.droplevel(0), data, attributes
+                )
+        return results
 
-        if not pd.api.types.is_integer_dtype(ldf.index):
-            index_column_name = ldf.index.name
-            ldf.unique_values[index_column_name] = list(ldf.index)
-            ldf.cardinality[index_column_name] = len(ldf.index)
+    @staticmethod
+    def _aggregated_columns(data: pd.DataFrame, attributes: tuple, aggregation) -> list:
+        """
+        Attributes a per-chart groupby keeps in its result, decided from their types: pandas drops
+        the non-numeric columns of a mixed frame that some aggregations do not apply to (e.g., the
+        sum of strings). When the result depends on the values (e.g., custom aggregation functions),
+        no attribute is kept, and the chart is aggregated on its own.
+        """
+        dtypes = [data[attr].dtype for attr in attributes]
+        if all(pd.api.types.is_numeric_dtype(dtype) for dtype in dtypes):
+            return list(attributes)
+        if aggregation in NUMERIC_AGGREGATIONS:
+            return [attr for attr, dtype in zip(attributes, dtypes) if pd.api.types.is_numeric_dtype(dtype)]
+        if aggregation in ANY_TYPE_AGGREGATIONS and (
+            aggregation not in ("min", "max")
+            or not any(pd.api.types.is_categorical_dtype(dtype) for dtype in dtypes)
+        ):
+            return list(attributes)
+        return []
+
+    @staticmethod
+    def _finalize(result: pd.DataFrame, data: pd.DataFrame, attributes: tuple) -> pd.DataFrame:
+        if attributes == ("Record",):
+            return result.reset_index()
+        return result.reset_index().__finalize__(data)
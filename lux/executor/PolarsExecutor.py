@@ -0,0 +1,397 @@
+#  Copyright 2019-2020 The Lux Authors.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import numpy as np
+import pandas as pd
+from lux.vis.VisList import VisList
+from lux.vis.Vis import Vis
+from lux.core.frame import LuxDataFrame
+from lux.executor.PandasExecutor import PandasExecutor
+from lux.utils import utils
+from lux.utils.unique_values import UniqueValues
+import lux
+
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+# Aggregations of bar and line charts computed by Polars, other aggregations are computed by pandas
+POLARS_AGGREGATIONS = {"mean", "sum", "min", "max", "median", "count", "std", "var"}
+
+
+def to_polars(df: pd.DataFrame):
+    """
+    Polars frame of a LuxDataFrame's columns, converted through Arrow (without copying the
+    numeric columns that Arrow can share) and cached on the dataframe until its data changes
+
+    Returns
+    -------
+    polars.DataFrame
+        Converted frame, or None if Polars cannot hold the columns (e.g., non-string or
+        duplicated column names, or object columns of mixed types)
+    """
+    if not all(isinstance(attr, str) for attr in df.columns) or not df.columns.is_unique:
+        return None
+    fingerprint = df.fingerprint() if hasattr(df, "fingerprint") else None
+    cached = getattr(df, "_polars_frame", None)
+    if cached is not None and fingerprint is not None and cached[0] == fingerprint:
+        return cached[1]
+    try:
+        frame = pl.from_pandas(df.to_pandas() if hasattr(df, "to_pandas") else df, rechunk=False)
+    except (TypeError, ValueError, pl.exceptions.PolarsError):
+        frame = None
+    if fingerprint is not None:
+        df._polars_frame = (fingerprint, frame)
+    return frame
+
+
+class PolarsExecutor(PandasExecutor):
+    """
+    Given a Vis objects with complete specifications, fetch and process data using the
+    multi-threaded lazy engine of Polars. The dataframe stays a pandas LuxDataFrame: its columns
+    are shared with Polars through Arrow, and charts are returned with the same data as the
+    PandasExecutor. Charts Polars cannot compute (e.g., custom aggregation functions, or columns
+    of mixed types) are computed by the PandasExecutor.
+    """
+
+    def __init__(self):
+        if pl is None:
+            raise ImportError("The PolarsExecutor requires polars. Install it with `pip install polars`.")
+        super().__init__()
+        self.name = "PolarsExecutor"
+
+    def __repr__(self):
+        return f"<PolarsExecutor>"
+
+    @staticmethod
+    def execute(vislist: VisList, ldf: LuxDataFrame, approx=False):
+        """
+        Given a VisList, fetch the data required to render the vis.
+        1) Apply filters
+        2) Retrieve relevant attribute
+        3) Perform vis-related processing (aggregation, binning)
+        4) return a DataFrame with relevant results
+
+        Parameters
+        ----------
+        vislist: list[lux.Vis]
+            vis list that contains lux.Vis objects for visualization.
+        ldf : lux.core.frame
+            LuxDataFrame with specified intent.
+
+        Returns
+        -------
+        None
+        """
+        PolarsExecutor.execute_sampling(ldf)
+        if approx:
+            PolarsExecutor.execute_approx_sample(ldf)
+        data = ldf._approx_sample if approx else ldf._sampled
+        frame = to_polars(data)
+        for vis in vislist:
+            if frame is None or any(
+                clause.attribute not in frame.columns
+                for clause in vis._inferred_intent
+                if clause.attribute != "Record"
+            ):
+                PandasExecutor.execute([vis], ldf, approx=approx)
+                continue
+            vis._source = ldf
+            if approx:
+                vis._original_df = ldf._sampled
+                vis.approx = True
+            vis._vis_data = frame.lazy()
+            filter_executed = PolarsExecutor.execute_filter(vis)
+            # Select relevant data based on attribute information
+            attributes = list(
+                dict.fromkeys(
+                    clause.attribute for clause in vis._inferred_intent if clause.attribute != "Record"
+                )
+            )
+            vis._vis_data = vis._vis_data.select(attributes)
+
+            if vis.mark == "bar" or vis.mark == "line" or vis.mark == "geographical":
+                PolarsExecutor.execute_aggregate(vis, isFiltered=filter_executed, source=data)
+            elif vis.mark == "histogram":
+                PolarsExecutor.execute_binning(ldf, vis)
+            elif vis.mark == "heatmap" and not approx:
+                vis._vis_data = LuxDataFrame(vis._vis_data.collect().to_pandas())
+                PandasExecutor.execute_2D_binning(vis)
+            else:
+                if vis.mark == "heatmap":
+                    # Early pruning based on interestingness of scatterplots
+                    vis._mark = "scatter"
+                vis._vis_data = LuxDataFrame(vis._vis_data.collect().to_pandas())
+            # Ensure that intent is not propogated to the vis data (bypass intent setter, since trigger vis.data metadata recompute)
+            vis.data._intent = []
+
+    @staticmethod
+    def execute_filter(vis: Vis) -> bool:
+        """
+        Apply a Vis's filters to the lazy frame of its data, combined in a single predicate
+
+        Parameters
+        ----------
+        vis : Vis
+
+        Returns
+        -------
+        bool
+            Boolean flag indicating if any filter was applied
+        """
+        filters = utils.get_filter_specs(vis._inferred_intent)
+        if not filters:
+            return False
+        schema = vis._vis_data.schema
+        predicate = None
+        for clause in filters:
+            expression = PolarsExecutor.filter_expression(
+                clause.attribute, clause.filter_op, clause.value, schema[clause.attribute]
+            )
+            if expression is not None:
+                predicate = expression if predicate is None else predicate & expression
+        if predicate is not None:
+            vis._vis_data = vis._vis_data.filter(predicate)
+        return True
+
+    @staticmethod
+    def filter_expression(attribute: str, op: str, val: object, dtype=None):
+        """
+        Polars predicate of a filter, selecting the same rows as `PandasExecutor.apply_filter`
+
+        Parameters
+        ----------
+        attribute : str
+            Filter attribute
+        op : str
+            Filter operation, '=', '<', '>', '<=', '>=', '!='
+        val : object
+            Filter value
+        dtype : polars.DataType, optional
+            Type of the filtered column, to parse dates given as strings
+
+        Returns
+        -------
+        polars.Expr
+            Predicate, or None if the operation is not supported
+        """
+        column = pl.col(attribute)
+        # NaN values are converted to nulls
+        if utils.like_nan(val):
+            if op == "=":
+                return column.is_null()
+            elif op == "!=":
+                return column.is_not_null()
+        if isinstance(val, str) and dtype is not None and dtype.is_temporal():
+            val = pd.Timestamp(val).to_pydatetime()
+        if op == "=":
+            return column == val
+        elif op == "<":
+            return column < val
+        elif op == ">":
+            return column > val
+        elif op == "<=":
+            return column <= val
+        elif op == ">=":
+            return column >= val
+        elif op == "!=":
+            # missing values differ from any value, as in pandas
+            return (column != val) | column.is_null()
+        return None
+
+    @staticmethod
+    def execute_aggregate(vis: Vis, isFiltered=True, source: pd.DataFrame = None):
+        """
+        Aggregate data points on an axis for bar or line charts with a Polars group by, then
+        complete the missing groups and sort them as the PandasExecutor does
+
+        Parameters
+        ----------
+        vis: lux.Vis
+            lux.Vis object that represents a visualization
+        isFiltered : bool
+            Whether a filter was applied to the vis data
+        source : pd.DataFrame
+            Data the lazy frame of the vis was read from, whose values the groups are completed with
+
+        Returns
+        -------
+        None
+        """
+        x_attr = vis.get_attr_by_channel("x")[0]
+        y_attr = vis.get_attr_by_channel("y")[0]
+        if x_attr.aggregation is None or y_attr.aggregation is None:
+            vis._vis_data = LuxDataFrame(vis._vis_data.collect().to_pandas())
+            return
+        if y_attr.aggregation != "":
+            groupby_attr, measure_attr = x_attr, y_attr
+        else:
+            groupby_attr, measure_attr = y_attr, x_attr
+        group_attrs = [groupby_attr.attribute]
+        color_attr = vis.get_attr_by_channel("color")
+        if len(color_attr) == 1:
+            group_attrs.append(color_attr[0].attribute)
+        agg_func = measure_attr.aggregation
+        if measure_attr.attribute == "Record":
+            aggregation = pl.len().alias("Record")
+        elif isinstance(agg_func, str) and agg_func in POLARS_AGGREGATIONS:
+            aggregation = getattr(pl.col(measure_attr.attribute), agg_func)()
+        else:
+            aggregation = None
+        if aggregation is None:
+            # e.g., custom aggregation functions
+            data = vis._vis_data.collect().to_pandas()
+            aggregated = data.groupby(group_attrs, dropna=False).agg(agg_func).reset_index()
+        else:
+            aggregated = vis._vis_data.group_by(group_attrs).agg(aggregation).collect().to_pandas()
+        # groups are completed with the values of the source data
+        vis._vis_data = source
+        PandasExecutor.execute_aggregate(
+            vis, isFiltered=isFiltered, aggregated=LuxDataFrame(aggregated)
+        )
+
+    @staticmethod
+    def execute_binning(ldf: LuxDataFrame, vis: Vis):
+        """
+        Binning of data points for generating histograms, with the bins of `np.histogram` counted
+        by a Polars group by
+
+        Parameters
+        ----------
+        vis: lux.Vis
+            lux.Vis object that represents a visualization
+        ldf : lux.core.frame
+            LuxDataFrame with specified intent.
+
+        Returns
+        -------
+        None
+        """
+        bin_attribute = [x for x in vis._inferred_intent if x.bin_size != 0][0]
+        bin_attr = bin_attribute.attribute
+        bins = bin_attribute.bin_size
+        if not vis._vis_data.schema[bin_attr].is_numeric():
+            # e.g., numbers stored as strings, or durations
+            vis._vis_data = LuxDataFrame(vis._vis_data.collect().to_pandas())
+            PandasExecutor.execute_binning(ldf, vis)
+            return
+        column = pl.col(bin_attr).cast(pl.Float64)
+        finite = column.filter(column.is_finite())
+        stats = vis._vis_data.select(
+            pl.len().alias("rows"),
+            finite.count().alias("count"),
+            finite.min().alias("min"),
+            finite.max().alias("max"),
+        )
+        stats = stats.collect().row(0, named=True)
+        if stats["count"] < stats["rows"]:
+            ldf._message.add_unique(
+                f"The column <code>{bin_attr}</code> contains missing values, not shown in the displayed histogram.",
+                priority=100,
+            )
+        # same range as np.histogram, including for empty and constant columns
+        first, last = (0.0, 1.0) if stats["count"] == 0 else (stats["min"], stats["max"])
+        if first == last:
+            first, last = first - 0.5, last + 0.5
+        edges = np.linspace(first, last, bins + 1)
+        # bin i holds the values in [edges[i], edges[i + 1]), and the last bin is closed
+        positions = (
+            pl.lit(pl.Series(edges)).search_sorted(column, side="right").cast(pl.Int64) - 1
+        ).clip(0, bins - 1)
+        counted = vis._vis_data.select(finite.alias(bin_attr)).select(positions.alias("bin")).group_by("bin").len().collect()
+        counts = np.zeros(bins, dtype=np.int64)
+        counts[counted["bin"].to_numpy()] = counted["len"].to_numpy()
+        binned_result = np.array([edges[0:-1], counts]).T
+        vis._vis_data = pd.DataFrame(binned_result, columns=[bin_attr, "Number of Records"])
+
+    @staticmethod
+    def execute_2D_binning(vis: Vis, ldf: LuxDataFrame = None, source: pd.DataFrame = None) -> None:
+        """
+        Apply 2D binning (heatmap) to vis.data, collecting the binned columns for the vectorized
+        NumPy kernel of the PandasExecutor
+        """
+        if pl is not None and isinstance(vis._vis_data, pl.LazyFrame):
+            vis._vis_data = LuxDataFrame(vis._vis_data.collect().to_pandas())
+        PandasExecutor.execute_2D_binning(vis, ldf=ldf, source=source)
+
+    def compute_stats(self, ldf: LuxDataFrame, attributes=None):
+        """
+        Compute per-column statistics (unique values, cardinality, min/max and null counts) for
+        all columns of the dataframe, in one multi-threaded Polars query. Sketched metadata, value
+        counts, file statistics and partial recomputations are computed by the PandasExecutor.
+
+        Parameters
+        ----------
+        ldf : lux.core.frame
+            LuxDataFrame whose metadata will be populated
+        attributes : list, optional
+            Only (re)compute the statistics of these columns
+        """
+        frame = None
+        if (
+            attributes is None
+            and not lux.config.sketch_metadata
+            and not lux.config.value_counts
+            and getattr(ldf, "_file_metadata", None) is None
+        ):
+            frame = to_polars(ldf)
+        if frame is None:
+            return super().compute_stats(ldf, attributes)
+
+        ldf.unique_values = {}
+        ldf._min_max = {}
+        ldf.cardinality = {}
+        ldf._null_count = {}
+        ldf._evenly_spaced = {}
+        ldf._value_counts = {}
+        ldf._length = len(ldf)
+        numeric_attrs = [
+            attr
+            for attr, dtype in ldf.dtypes.items()
+            if pd.api.types.is_float_dtype(dtype) or pd.api.types.is_integer_dtype(dtype)
+        ]
+        expressions = []
+        for index, attr in enumerate(frame.columns):
+            column = pl.col(attr)
+            expressions.append(column.null_count().alias(f"null_{index}"))
+            expressions.append(column.unique(maintain_order=True).implode().alias(f"unique_{index}"))
+            if attr in numeric_attrs:
+                expressions.append(column.min().alias(f"min_{index}"))
+                expressions.append(column.max().alias(f"max_{index}"))
+        stats = frame.lazy().select(expressions).collect()
+
+        for index, attr in enumerate(frame.columns):
+            series = ldf[attr]
+            unique_values = stats[f"unique_{index}"][0].to_numpy()
+            if unique_values.dtype == object:
+                # missing values were converted to nulls
+                unique_values[pd.isna(unique_values)] = np.nan
+            unique_values = UniqueValues(unique_values)
+            cardinality = len(unique_values)
+            ldf.unique_values[attr] = unique_values
+            ldf.cardinality[attr] = cardinality
+            ldf._null_count[attr] = int(stats[f"null_{index}"][0])
+            if pd.api.types.is_integer_dtype(series.dtype) and cardinality > 500:
+                diff = np.diff(series.to_numpy(dtype="float64", na_value=np.nan))
+                ldf._evenly_spaced[attr] = bool(len(diff) == 0 or (diff == diff[0]).all())
+            if attr in numeric_attrs:
+                dtype = series.dtype
+                min_max = (stats[f"min_{index}"][0], stats[f"max_{index}"][0])
+                ldf._min_max[attr] = tuple(
+                    np.nan if value is None else PandasExecutor._as_dtype_scalar(value, dtype, None)
+                    for value in min_max
+                )
+
+        self.compute_index_stats(ldf)
@@ -0,0 +1,43 @@
+#  Copyright 2019-2020 The Lux Authors.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from typing import Dict
+
+
+class Lineage:
+    """
+    Lineage records how a dataframe was derived from a parent dataframe whose metadata was
+    already computed, so that the metadata that did not change is inherited instead of recomputed.
+
+    A projection (subset of columns, all rows) inherits the exact metadata of its columns, while a
+    row subset (subset of rows, optionally of columns) inherits the data types that do not depend
+    on the values (of datetime columns, and overridden types) and recomputes the rest. A row subset of a sampled parent
+    also samples the rows of the parent's sample that it kept, instead of drawing a new sample.
+    """
+
+    PROJECTION = "projection"
+    ROW_SUBSET = "row subset"
+
+    def __init__(self, operation: str, parent_shape: tuple, data_type: Dict, sample: tuple = None):
+        self.operation = operation
+        self.parent_shape = parent_shape
+        # data types inherited from the parent (row subsets only)
+        self.data_type = data_type
+        # index and RowSample of the parent, if it was sampled (row subsets only)
+        self.sample = sample
+
+    def __repr__(self):
+        return (
+            f"<Lineage: {self.operation} of a {self.parent_shape[0]}x{self.parent_shape[1]} dataframe>"
+        )
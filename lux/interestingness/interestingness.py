@@ -28,7 +28,7 @@ from lux.vis.VisList import VisList
 import warnings
 
 
-def interestingness(vis: Vis, ldf: LuxDataFrame) -> int:
+def interestingness(vis: Vis, ldf: LuxDataFrame, overall_cache: dict = None) -> int:
     """
     Compute the interestingness score of the vis.
     The interestingness metric is dependent on the vis type.
@@ -37,6 +37,9 @@ def interestingness(vis: Vis, ldf: LuxDataFrame) -> int:
     ----------
     vis : Vis
     ldf : LuxDataFrame
+    overall_cache : dict, optional
+            Cache shared by the scoring of several filtered vis of the same dataframe (e.g., by the
+            Filter action), so that the unfiltered vis and the filter sizes are computed once
 
     Returns
     -------
@@ -82,7 +85,9 @@ def interestingness(vis: Vis, ldf: LuxDataFrame) -> int:
             if n_filter == 0:
                 return unevenness(vis, ldf, measure_lst, dimension_lst)
             elif n_filter == 1:
-                return deviation_from_overall(vis, ldf, filter_specs, measure_lst[0].attribute)
+                return deviation_from_overall(
+                    vis, ldf, filter_specs, measure_lst[0].attribute, overall_cache=overall_cache
+                )
         # Histogram
         elif n_dim == 0 and n_msr == 1:
             if v_size < 2:
@@ -92,7 +97,9 @@ def interestingness(vis: Vis, ldf: LuxDataFrame) -> int:
                     v = vis.data["Number of Records"]
                     return skewness(v)
             elif n_filter == 1 and "Number of Records" in vis.data:
-                return deviation_from_overall(vis, ldf, filter_specs, "Number of Records")
+                return deviation_from_overall(
+                    vis, ldf, filter_specs, "Number of Records", overall_cache=overall_cache
+                )
             return -1
         # Scatter Plot
         elif n_dim == 0 and n_msr == 2:
@@ -169,12 +176,31 @@ def interestingness(vis: Vis, ldf: LuxDataFrame) -> int:
             raise
 
 
-def get_filtered_size(filter_specs, ldf):
+def get_filtered_size(filter_specs, ldf, overall_cache: dict = None):
     filter_intents = filter_specs[0]
-    result = PandasExecutor.apply_filter(
+    attribute, value = filter_intents.attribute, filter_intents.value
+    if (
+        overall_cache is not None
+        and filter_intents.filter_op == "="
+        and not utils.like_nan(value)
+        and (
+            pd.api.types.is_numeric_dtype(ldf[attribute].dtype)
+            or pd.api.types.is_object_dtype(ldf[attribute].dtype)
+        )
+    ):
+        # the sizes of all the equality filters on an attribute come from one count of its values
+        if ("value_counts", attribute) not in overall_cache:
+            overall_cache[("value_counts", attribute)] = ldf[attribute].value_counts()
+        try:
+            return int(overall_cache[("value_counts", attribute)].get(value, 0))
+        except TypeError:
+            pass
+    mask = PandasExecutor.predicate_mask(
         ldf, filter_intents.attribute, filter_intents.filter_op, filter_intents.value
     )
-    return len(result)
+    if mask is None:
+        return len(ldf)
+    return int(mask.sum())
 
 
 def skewness(v):
@@ -202,6 +228,7 @@ def deviation_from_overall(
     filter_specs: list,
     msr_attribute: str,
     exclude_nan: bool = True,
+    overall_cache: dict = None,
 ) -> int:
     """
     Difference in bar chart/histogram shape from overall chart
@@ -217,18 +244,20 @@ def deviation_from_overall(
             The attribute name of the measure value of the chart
     exclude_nan: bool
             Whether to include/exclude NaN values as part of the deviation calculation
+    overall_cache : dict, optional
+            Cache of the unfiltered vis and filter sizes shared with the other filtered vis scored
 
     Returns
     -------
     int
             Score describing how different the vis is from the overall vis
     """
-    if lux.config.executor.name == "PandasExecutor":
+    if lux.config.executor.name in utils.IN_MEMORY_EXECUTORS:
         if exclude_nan:
             vdata = vis.data.dropna()
         else:
             vdata = vis.data
-        v_filter_size = get_filtered_size(filter_specs, ldf)
+        v_filter_size = get_filtered_size(filter_specs, ldf, overall_cache)
         v_size = len(vis.data)
     else:
         from lux.executor.SQLExecutor import SQLExecutor
@@ -241,17 +270,28 @@ def deviation_from_overall(
     v_filter = v_filter / total  # normalize by total to get ratio
     if total == 0:
         return 0
-    # Generate an "Overall" Vis (TODO: This is computed multiple times for every vis, alternative is to directly access df.current_vis but we do not have guaruntee that will always be unfiltered vis (in the non-Filter action scenario))
+    # Generate an "Overall" Vis (computed once per overall_cache, since we do not have guaruntee that df.current_vis will always be unfiltered vis (in the non-Filter action scenario))
     import copy
 
-    unfiltered_vis = copy.copy(vis)
-    # Remove filters, keep only attribute intent
-    unfiltered_vis._inferred_intent = utils.get_attrs_specs(vis._inferred_intent)
-    lux.config.executor.execute([unfiltered_vis], ldf)
+    attrs_specs = utils.get_attrs_specs(vis._inferred_intent)
+    overall_key = (vis.mark,) + tuple(
+        (clause.attribute, clause.channel, clause.aggregation, clause.bin_size, clause.data_type)
+        for clause in attrs_specs
+    )
+    if overall_cache is not None and overall_key in overall_cache:
+        unfiltered_data = overall_cache[overall_key]
+    else:
+        unfiltered_vis = copy.copy(vis)
+        # Remove filters, keep only attribute intent
+        unfiltered_vis._inferred_intent = attrs_specs
+        lux.config.executor.execute([unfiltered_vis], ldf)
+        unfiltered_data = unfiltered_vis.data
+        if overall_cache is not None:
+            overall_cache[overall_key] = unfiltered_data
     if exclude_nan:
-        uv = unfiltered_vis.data.dropna()
+        uv = unfiltered_data.dropna()
     else:
-        uv = unfiltered_vis.data
+        uv = unfiltered_data
     v = uv[msr_attribute]
     v = v / v.sum()
     assert len(v) == len(v_filter), "Data for filtered and unfiltered vis have unequal length."
@@ -322,6 +362,36 @@ def mutual_information(v_x: list, v_y: list) -> int:
     return mutual_info_score(v_x, v_y)
 
 
+def correlation_matrix(data: pd.DataFrame, measures: list) -> np.ndarray:
+    """
+    Monotonicity scores of every pair of measures at once: the absolute Pearson's correlation of
+    each pair, computed on the rows where both measures are present (as `monotonicity` computes it
+    on the data of a scatterplot).
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+            Data of the scatterplots (i.e., sampled and filtered dataframe)
+    measures : list
+            Names of the measure attributes
+
+    Returns
+    -------
+    np.ndarray
+            Square matrix of scores, -1 where the correlation is undefined (e.g., uniform values)
+    """
+    columns = {}
+    for i, attr in enumerate(measures):
+        series = data[attr]
+        if not pd.api.types.is_numeric_dtype(series.dtype):
+            series = pd.to_numeric(series, errors="coerce")
+        columns[i] = series.astype(float).to_numpy()
+    # pairwise-complete observations, with at least two rows per pair
+    scores = np.abs(pd.DataFrame(columns).corr(min_periods=2).to_numpy())
+    scores[np.isnan(scores)] = -1
+    return scores
+
+
 def monotonicity(vis: Vis, attr_specs: list, ignore_identity: bool = True) -> int:
     """
     Monotonicity measures there is a monotonic trend in the scatterplot, whether linear or not.
@@ -17,6 +17,7 @@ from lux.core.frame import LuxDataFrame
 from lux.vis.Clause import Clause
 from typing import List
 from lux.utils.date_utils import is_datetime_series, is_datetime_string
+from lux.utils.sketch_utils import is_exact_unique
 import warnings
 import pandas as pd
 import lux
@@ -91,10 +92,15 @@ class Validator:
                                         vals = clause.value
                                     else:
                                         vals = [clause.value]
+                                    # hash lookups in the cached unique values when they are complete
+                                    unique_vals = (ldf.unique_values or {}).get(clause.attribute)
+                                    if unique_vals is None or not is_exact_unique(unique_vals):
+                                        unique_vals = series.values
                                     for val in vals:
                                         if (
-                                            lux.config.executor.name == "PandasExecutor"
-                                            and val not in series.values
+                                            lux.config.executor.name
+                                            in lux.utils.utils.IN_MEMORY_EXECUTORS
+                                            and val not in unique_vals
                                         ):
                                             warn_msg = f"\n- The input value '{val}' does not exist for the attribute '{clause.attribute}' for the DataFrame."
             return warn_msg
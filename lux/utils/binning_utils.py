@@ -0,0 +1,206 @@
+#  Copyright 2019-2020 The Lux Authors.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+
+class BinCodes:
+    """
+    Bin index of every row of a column, so that histograms over the same bins are counted with a
+    `np.bincount` instead of binning the values again.
+
+    Attributes
+    ----------
+    codes : np.ndarray
+        Bin index of each row, -1 for missing (or infinite) values
+    edges : np.ndarray
+        Bin edges, of size number of bins + 1
+    has_missing : bool
+        Whether some rows are missing, and not counted in any bin
+    categories : pd.IntervalIndex, optional
+        Intervals of the bins, as labelled by `pd.cut`
+    """
+
+    def __init__(self, codes: np.ndarray, edges: np.ndarray, has_missing: bool, categories=None):
+        self.codes = codes
+        self.edges = edges
+        self.has_missing = has_missing
+        self.categories = categories
+
+    def __repr__(self):
+        return f"<BinCodes: {len(self.edges) - 1} bins over {len(self.codes)} rows>"
+
+    @property
+    def bins(self) -> int:
+        return len(self.edges) - 1
+
+    def counts(self) -> np.ndarray:
+        """
+        Number of rows in each bin
+        """
+        return np.bincount(self.codes[self.codes >= 0], minlength=self.bins)
+
+
+def can_bin_codes(series: pd.Series) -> bool:
+    """
+    Whether `histogram_bin_codes` bins the series exactly as `np.histogram` does: numpy bins the
+    values of other dtypes (e.g., float32) with edges of their own precision
+    """
+    dtype = series.dtype
+    return (
+        pd.api.types.is_integer_dtype(dtype) and not pd.api.types.is_extension_array_dtype(dtype)
+    ) or dtype == np.float64
+
+
+def histogram_bin_codes(data: pd.DataFrame, attributes: List, bins: int) -> Dict:
+    """
+    Bin codes of several columns with the equal-width bins `np.histogram` splits the range of the
+    finite values of each column into, computed in one vectorized pass over the columns
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        Data whose columns are binned
+    attributes : List
+        Integer or float64 columns (see `can_bin_codes`)
+    bins : int
+        Number of bins
+
+    Returns
+    -------
+    Dict
+        BinCodes of each attribute
+    """
+    if len(attributes) == 0:
+        return {}
+    values = data[list(attributes)].to_numpy(dtype=np.float64)
+    finite = np.isfinite(values)
+    has_values = finite.any(axis=0)
+    low = np.where(finite, values, np.inf).min(axis=0)
+    high = np.where(finite, values, -np.inf).max(axis=0)
+    # np.histogram of no values spans [0, 1], and of a single value spans [value - 0.5, value + 0.5]
+    low = np.where(has_values, low, 0.0)
+    high = np.where(has_values, high, 1.0)
+    constant = low == high
+    low = np.where(constant, low - 0.5, low)
+    high = np.where(constant, high + 0.5, high)
+    edges = np.linspace(low, high, bins + 1, axis=1)
+    result = {}
+    for i, attr in enumerate(attributes):
+        # the bins are half-open [start, end), except the last one, which includes its end
+        codes = np.searchsorted(edges[i], values[:, i], side="right") - 1
+        codes[codes == bins] = bins - 1
+        codes[~finite[:, i]] = -1
+        result[attr] = BinCodes(codes, edges[i], not finite[:, i].all())
+    return result
+
+
+def cut_bin_codes(series: pd.Series, bins: int) -> BinCodes:
+    """
+    Bin codes of a column with the equal-width bins of `pd.cut`, keeping the intervals it labels
+    the bins with. The bins only depend on the range of the column, so only its minimum and
+    maximum are cut, and the values are assigned to the bins with a binary search.
+    """
+    values = series.to_numpy()
+    valid = ~pd.isna(values)
+    if values.dtype.kind not in "iuf" or not valid.any():
+        binned, edges = pd.cut(series, bins=bins, retbins=True)
+        codes = np.asarray(binned.cat.codes, dtype=np.intp)
+        return BinCodes(codes, edges, bool((codes < 0).any()), categories=binned.cat.categories)
+    extremes = np.array([values[valid].min(), values[valid].max()], dtype=values.dtype)
+    labels, edges = pd.cut(extremes, bins=bins, retbins=True)
+    # the bins are half-open (start, end], and the first start is below the minimum
+    codes = np.searchsorted(edges, values, side="left") - 1
+    codes[~valid] = -1
+    return BinCodes(codes, edges, not valid.all(), categories=labels.categories)
+
+
+def heatmap_cells(
+    x_bins: BinCodes, y_bins: BinCodes, color: pd.Series = None, color_data_type: str = None
+) -> pd.DataFrame:
+    """
+    Count the rows of each cell of a heatmap from the bin codes of its axes, and aggregate the
+    color of each cell (the most frequent value of a nominal color, or the mean of others)
+
+    Parameters
+    ----------
+    x_bins, y_bins : BinCodes
+        Bin codes of the x and y attributes, with the intervals of their bins
+    color : pd.Series, optional
+        Values of the color attribute
+    color_data_type : str, optional
+        Data type of the color attribute
+
+    Returns
+    -------
+    pd.DataFrame
+        "count" (and color) of the non-empty cells, with the "xBinStart", "xBinEnd", "yBinStart"
+        and "yBinEnd" of their bins, indexed by the position of the cell in the grid
+    """
+    num_cells = x_bins.bins * y_bins.bins
+    cells = x_bins.codes * y_bins.bins + y_bins.codes
+    counted = (x_bins.codes >= 0) & (y_bins.codes >= 0)
+    if color is not None:
+        # cells are counted by their non-missing colors
+        counted &= color.notna().to_numpy()
+    counts = np.bincount(cells[counted], minlength=num_cells)
+    kept = np.flatnonzero(counts)
+    result = pd.DataFrame({"count": counts[kept]}, index=kept)
+    if color is not None:
+        values = color.to_numpy()[counted]
+        if color_data_type == "nominal":
+            result[color.name] = _cell_modes(cells[counted], values)
+        else:
+            result[color.name] = _cell_means(cells[counted], values, counts, kept)
+    x_positions = kept // y_bins.bins
+    y_positions = kept % y_bins.bins
+    result["xBinStart"] = np.asarray(x_bins.categories.left, dtype=float)[x_positions]
+    result["xBinEnd"] = np.asarray(x_bins.categories.right, dtype=float)[x_positions]
+    result["yBinStart"] = np.asarray(y_bins.categories.left, dtype=float)[y_positions]
+    result["yBinEnd"] = np.asarray(y_bins.categories.right, dtype=float)[y_positions]
+    return result
+
+
+def _cell_modes(cells: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """
+    Most frequent value of each cell, in increasing order of cells, breaking ties with the
+    smallest value (as `pd.Series.mode` sorts the modes)
+    """
+    try:
+        codes, uniques = pd.factorize(values, sort=True)
+    except TypeError:
+        # values that cannot be compared
+        codes, uniques = pd.factorize(values)
+    num_values = max(len(uniques), 1)
+    keys, counts = np.unique(cells.astype(np.int64) * num_values + codes, return_counts=True)
+    key_cells = keys // num_values
+    key_codes = keys % num_values
+    order = np.lexsort((key_codes, -counts, key_cells))
+    first = np.ones(len(order), dtype=bool)
+    first[1:] = key_cells[order][1:] != key_cells[order][:-1]
+    return np.asarray(uniques)[key_codes[order[first]]]
+
+
+def _cell_means(cells: np.ndarray, values: np.ndarray, counts: np.ndarray, kept: np.ndarray):
+    """
+    Mean value of each non-empty cell, in increasing order of cells
+    """
+    if values.dtype.kind in "iufb":
+        sums = np.bincount(cells, weights=values.astype(float), minlength=len(counts))
+        return sums[kept] / counts[kept]
+    # e.g., datetimes
+    return pd.Series(values).groupby(cells).mean().to_numpy()
@@ -0,0 +1,93 @@
+#  Copyright 2019-2020 The Lux Authors.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+# Number of evenly-spaced rows (including the first and last) whose values are hashed
+FINGERPRINT_SAMPLE_ROWS = 1024
+
+
+def dataframe_fingerprint(
+    df: pd.DataFrame, sample_rows: int = FINGERPRINT_SAMPLE_ROWS, version: int = 0
+) -> str:
+    """
+    Fingerprint of a dataframe computed in time independent of its number of rows. It combines the
+    schema and shape, the identity of the buffers holding each block of columns, and a hash of the
+    values of a fixed sample of rows of each block.
+
+    Two dataframes with the same fingerprint hold the same data, as long as the buffers were not
+    modified in place outside of pandas. Copies of a dataframe have different fingerprints, since
+    they do not share buffers.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Dataframe to fingerprint
+    sample_rows : int
+        Number of evenly-spaced rows whose values are hashed
+    version : int
+        Number of times the dataframe was modified in place, so that writes to rows outside of the
+        sample still change the fingerprint
+
+    Returns
+    -------
+    str
+        Hex digest
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    schema = (
+        version,
+        df.shape,
+        [(str(attr), str(dtype)) for attr, dtype in df.dtypes.items()],
+        str(df.index.name),
+        str(df.index.dtype),
+    )
+    digest.update(repr(schema).encode())
+    num_rows = len(df)
+    positions = np.unique(np.linspace(0, num_rows - 1, num=min(sample_rows, num_rows)).astype(np.intp))
+    for block in df._mgr.blocks:
+        values = block.values
+        digest.update(np.asarray(block.mgr_locs.as_array).tobytes())
+        digest.update(repr((id(values), _buffer_address(values))).encode())
+        if values.ndim == 2:
+            # 2D blocks, including extension arrays backed by a 2D ndarray (e.g., datetimes)
+            sample = np.asarray(values[:, positions]).ravel()
+        else:
+            sample = values[positions]
+        digest.update(_hash_values(sample))
+    digest.update(repr((id(df.index), _buffer_address(df.index._values))).encode())
+    digest.update(_hash_values(df.index._values[positions]))
+    return digest.hexdigest()
+
+
+def _buffer_address(values):
+    """
+    Address of the memory holding an array's values, or None for arrays not backed by one buffer
+    """
+    if isinstance(values, np.ndarray):
+        return values.__array_interface__["data"][0]
+    return None
+
+
+def _hash_values(values) -> bytes:
+    if not isinstance(values, np.ndarray):
+        values = np.asarray(values, dtype=object)
+    try:
+        return pd.util.hash_array(values).tobytes()
+    except TypeError:
+        # unhashable values (e.g., lists): fall back to their representation
+        return repr(list(values)).encode()
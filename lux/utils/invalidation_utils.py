@@ -0,0 +1,50 @@
+#  Copyright 2019-2020 The Lux Authors.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from collections import Counter
+from typing import Dict
+
+
+class InvalidationCounter:
+    """
+    Counts how often the cached metadata and recommendations of Lux dataframes were invalidated,
+    broken down by the operation that caused it. Accessible through `lux.config.invalidations`.
+
+    Example
+    -------
+    >>> lux.config.invalidations.reset()
+    >>> df["Horsepower"].fillna(0, inplace=True)
+    >>> lux.config.invalidations.counts
+    {'series write': 1}
+    """
+
+    def __init__(self):
+        self._counts = Counter()
+
+    def __repr__(self):
+        return f"<InvalidationCounter: {dict(self._counts)}>"
+
+    def record(self, reason: str) -> None:
+        self._counts[reason] += 1
+
+    def reset(self) -> None:
+        self._counts.clear()
+
+    @property
+    def counts(self) -> Dict[str, int]:
+        return dict(self._counts)
+
+    @property
+    def total(self) -> int:
+        return sum(self._counts.values())
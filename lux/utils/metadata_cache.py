@@ -0,0 +1,308 @@
+#  Copyright 2019-2020 The Lux Authors.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import hashlib
+import json
+import os
+import warnings
+import zipfile
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+import lux
+from lux.utils.sketch_utils import HeavyHitters
+from lux.utils.unique_values import UniqueValues
+
+# Bumped whenever the layout of the cached metadata changes, so that stale entries are never read
+CACHE_VERSION = 4
+CACHE_FILE_SUFFIX = ".npz"
+
+
+def metadata_fingerprint(df: pd.DataFrame) -> Optional[str]:
+    """
+    Fingerprint of a dataframe's schema and content, together with the Lux settings that affect
+    the metadata computed on it. The content is hashed with vectorized pandas hashing, which is
+    several times cheaper than computing the metadata itself.
+
+    Returns
+    -------
+    str
+        Hex digest, or None if the dataframe holds values that cannot be hashed (e.g., lists)
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    schema = (
+        CACHE_VERSION,
+        df.shape,
+        [(str(attr), str(dtype)) for attr, dtype in df.dtypes.items()],
+        str(df.index.name),
+        str(df.index.dtype),
+        lux.config.sketch_metadata,
+        lux.config.unique_values_threshold,
+        lux.config.heavy_hitters_cap,
+        lux.config.value_counts,
+    )
+    digest.update(repr(schema).encode())
+    try:
+        for attr in df.columns:
+            digest.update(pd.util.hash_pandas_object(df[attr], index=False).to_numpy().tobytes())
+        digest.update(pd.util.hash_pandas_object(df.index).to_numpy().tobytes())
+    except TypeError:
+        return None
+    return digest.hexdigest()
+
+
+class MetadataCache:
+    """
+    On-disk cache of dataframe metadata shared across sessions, keyed by `metadata_fingerprint`.
+    Once the files in the cache directory exceed `max_size` bytes, the least recently used
+    entries are evicted.
+    """
+
+    def __init__(self, directory: str, max_size: int):
+        self.directory = directory
+        self.max_size = max_size
+
+    def __repr__(self):
+        return f"<MetadataCache: directory={self.directory}, size={self.size}/{self.max_size} bytes>"
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + CACHE_FILE_SUFFIX)
+
+    def _entries(self) -> List[os.DirEntry]:
+        if not os.path.isdir(self.directory):
+            return []
+        return [
+            entry
+            for entry in os.scandir(self.directory)
+            if entry.is_file() and entry.name.endswith(CACHE_FILE_SUFFIX)
+        ]
+
+    @property
+    def size(self) -> int:
+        return sum(entry.stat().st_size for entry in self._entries())
+
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        Return the metadata cached under `key`, or None if there is no (readable) entry
+        """
+        path = self._path(key)
+        try:
+            metadata = read_metadata(path)
+            # mark as recently used
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except (ValueError, KeyError, TypeError, EOFError, zipfile.BadZipFile):
+            # unreadable entry (e.g., truncated file or written by an incompatible version)
+            self._remove(path)
+            return None
+        return metadata
+
+    def put(self, key: str, metadata: Dict) -> None:
+        """
+        Store the metadata under `key`, then evict entries if the cache is over its size limit.
+        Metadata holding values that cannot be stored as data (see `write_metadata`) is not cached.
+        """
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            # only the user can read or write the entries of a directory created by Lux
+            os.makedirs(self.directory, mode=0o700, exist_ok=True)
+            write_metadata(tmp_path, metadata)
+            # atomic, so that concurrent sessions never read a partially written entry
+            os.replace(tmp_path, path)
+        except TypeError:
+            self._remove(tmp_path)
+            return
+        except OSError as error:
+            self._remove(tmp_path)
+            warnings.warn(f"\nLux could not write to the metadata cache: {error}", stacklevel=2)
+            return
+        self.evict()
+
+    def evict(self) -> None:
+        """
+        Remove the least recently used entries until the cache fits in `max_size` bytes
+        """
+        entries = sorted(self._entries(), key=lambda entry: entry.stat().st_mtime)
+        size = sum(entry.stat().st_size for entry in entries)
+        for entry in entries:
+            if size <= self.max_size:
+                break
+            size -= entry.stat().st_size
+            self._remove(entry.path)
+
+    def clear(self) -> None:
+        for entry in self._entries():
+            self._remove(entry.path)
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    @staticmethod
+    def mismatched_types(metadata: Dict, type_override: Dict) -> List:
+        """
+        Attributes whose cached data type no longer matches the dataframe's `_type_override`,
+        i.e., whose override was added, changed or removed since the metadata was cached
+
+        Parameters
+        ----------
+        metadata : Dict
+            Metadata returned by `get`
+        type_override : Dict
+            The `_type_override` of the dataframe the metadata is used for
+        """
+        cached_override = metadata["type_override"]
+        return [
+            attr
+            for attr in list(cached_override) + [a for a in type_override if a not in cached_override]
+            if cached_override.get(attr) != type_override.get(attr)
+        ]
+
+
+def write_metadata(path: str, metadata: Dict) -> None:
+    """
+    Write metadata as data only, so that reading a cache entry never executes code: NumPy arrays
+    of numbers and dates are stored as they are, and every other value is encoded in a JSON
+    document (see `_encode`), in an uncompressed .npz archive read with `allow_pickle=False`.
+
+    Raises
+    ------
+    TypeError
+        If the metadata holds values that cannot be encoded (e.g., arbitrary Python objects)
+    """
+    arrays = []
+    document = json.dumps(_encode(metadata, arrays)).encode()
+    named_arrays = {f"array_{i}": array for i, array in enumerate(arrays)}
+    with open(path, "wb") as f:
+        np.savez(f, metadata=np.frombuffer(document, dtype=np.uint8), **named_arrays)
+
+
+def read_metadata(path: str) -> Dict:
+    """
+    Read the metadata written by `write_metadata`
+    """
+    with np.load(path, allow_pickle=False) as data:
+        return _decode(json.loads(data["metadata"].tobytes().decode()), data)
+
+
+def _encode(value, arrays: List):
+    # NumPy scalars are tagged with their dtype, since np.float64 is also a float
+    if isinstance(value, np.generic):
+        if value.dtype.kind in "mM":
+            return {"__scalar__": str(value.dtype), "value": int(value.view("i8"))}
+        if value.dtype.kind not in "biuf":
+            raise TypeError(f"Cannot cache {type(value).__name__} values")
+        return {"__scalar__": str(value.dtype), "value": value.item()}
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if value is pd.NaT:
+        return {"__nat__": True}
+    if value is pd.NA:
+        return {"__na__": True}
+    if isinstance(value, pd.Timestamp):
+        return {"__timestamp__": value.value, "tz": None if value.tz is None else str(value.tz)}
+    if isinstance(value, pd.Timedelta):
+        return {"__timedelta__": value.value}
+    if isinstance(value, tuple):
+        return {"__tuple__": [_encode(v, arrays) for v in value]}
+    if isinstance(value, HeavyHitters):
+        return {
+            "__heavy_hitters__": [_encode(v, arrays) for v in value],
+            "cardinality": _encode(value.cardinality, arrays),
+            "counts": [_encode(v, arrays) for v in value.counts],
+        }
+    if isinstance(value, list):
+        return [_encode(v, arrays) for v in value]
+    if isinstance(value, dict):
+        # keys are not only strings (e.g., the None name of an index)
+        return {"__dict__": [[_encode(k, arrays), _encode(v, arrays)] for k, v in value.items()]}
+    if isinstance(value, UniqueValues):
+        return {"__unique_values__": _encode(value.values, arrays)}
+    if isinstance(value, pd.Index):
+        return {"__index__": _encode(value.array, arrays), "name": _encode(value.name, arrays)}
+    if isinstance(value, pd.arrays.PandasArray):
+        return _encode(value.to_numpy(), arrays)
+    if isinstance(value, np.ndarray):
+        if value.dtype == object:
+            return {"__objects__": [_encode(v, arrays) for v in value]}
+        arrays.append(value)
+        return {"__array__": len(arrays) - 1}
+    if isinstance(value, pd.Categorical):
+        return {
+            "__categorical__": _encode(value.categories, arrays),
+            "codes": _encode(value.codes, arrays),
+            "ordered": value.ordered,
+        }
+    if isinstance(value, pd.api.extensions.ExtensionArray):
+        return {"__extension__": str(value.dtype), "values": [_encode(v, arrays) for v in value]}
+    raise TypeError(f"Cannot cache {type(value).__name__} values")
+
+
+def _decode(value, arrays):
+    if isinstance(value, list):
+        return [_decode(v, arrays) for v in value]
+    if not isinstance(value, dict):
+        return value
+    if "__scalar__" in value:
+        dtype = np.dtype(value["__scalar__"])
+        if dtype.kind in "mM":
+            return np.array(value["value"], dtype="i8").view(dtype)[()]
+        return dtype.type(value["value"])
+    if "__nat__" in value:
+        return pd.NaT
+    if "__na__" in value:
+        return pd.NA
+    if "__timestamp__" in value:
+        timestamp = pd.Timestamp(value["__timestamp__"])
+        return timestamp if value["tz"] is None else timestamp.tz_localize("UTC").tz_convert(value["tz"])
+    if "__timedelta__" in value:
+        return pd.Timedelta(value["__timedelta__"])
+    if "__tuple__" in value:
+        return tuple(_decode(v, arrays) for v in value["__tuple__"])
+    if "__heavy_hitters__" in value:
+        return HeavyHitters(
+            _decode(value["__heavy_hitters__"], arrays),
+            _decode(value["cardinality"], arrays),
+            _decode(value["counts"], arrays),
+        )
+    if "__dict__" in value:
+        return {_decode(k, arrays): _decode(v, arrays) for k, v in value["__dict__"]}
+    if "__unique_values__" in value:
+        return UniqueValues(_decode(value["__unique_values__"], arrays))
+    if "__index__" in value:
+        values = _decode(value["__index__"], arrays)
+        # keep object indexes of numbers as they are rather than inferring their dtype
+        dtype = object if getattr(values, "dtype", None) == object else None
+        return pd.Index(values, dtype=dtype, name=_decode(value["name"], arrays))
+    if "__objects__" in value:
+        values = np.empty(len(value["__objects__"]), dtype=object)
+        values[:] = [_decode(v, arrays) for v in value["__objects__"]]
+        return values
+    if "__array__" in value:
+        return arrays[f"array_{value['__array__']}"]
+    if "__categorical__" in value:
+        return pd.Categorical.from_codes(
+            _decode(value["codes"], arrays),
+            categories=_decode(value["__categorical__"], arrays),
+            ordered=value["ordered"],
+        )
+    if "__extension__" in value:
+        return pd.array(_decode(value["values"], arrays), dtype=value["__extension__"])
+    raise ValueError(f"Unknown cached value: {value}")
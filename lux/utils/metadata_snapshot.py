@@ -0,0 +1,64 @@
+#  Copyright 2019-2020 The Lux Authors.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import copy
+from operator import is_
+from types import MappingProxyType
+from typing import Dict, Iterable
+
+
+class MetadataSnapshot:
+    """
+    Immutable snapshot of the Lux metadata attributes of a dataframe or series, shared by all the
+    series derived from it instead of copying every attribute into each of them.
+
+    A derived object reads an attribute from the snapshot the first time it is accessed, and keeps
+    its own copy of mutable values (dicts and lists) from then on, so that modifying it never
+    affects the snapshot nor the other objects sharing it.
+    """
+
+    __slots__ = ("_values", "_names", "_items")
+
+    def __init__(self, values: Dict):
+        self._values = MappingProxyType(dict(values))
+        self._names = tuple(values)
+        self._items = tuple(values.values())
+
+    def __repr__(self):
+        return f"<MetadataSnapshot: {len(self._values)} attributes>"
+
+    def __contains__(self, name):
+        return name in self._values
+
+    @classmethod
+    def of(cls, obj, names: Iterable) -> "MetadataSnapshot":
+        """
+        Snapshot of the attributes `names` set on `obj`
+        """
+        return cls({name: obj.__dict__.get(name) for name in names})
+
+    def matches(self, obj) -> bool:
+        """
+        Whether the attributes of `obj` still hold the values of the snapshot
+        """
+        return all(map(is_, map(obj.__dict__.get, self._names), self._items))
+
+    def read(self, name):
+        """
+        Value of the attribute for a derived object: mutable values are copied
+        """
+        value = self._values.get(name)
+        if isinstance(value, (dict, list)):
+            return copy.copy(value)
+        return value
@@ -0,0 +1,124 @@
+#  Copyright 2019-2020 The Lux Authors.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import copy
+from typing import List
+
+import pandas as pd
+
+
+class ParquetMetadata:
+    """
+    Column statistics and logical types read from the footer of a Parquet file, used to seed the
+    metadata of a dataframe holding the file's rows without scanning its values.
+
+    Attributes
+    ----------
+    num_rows : int
+        Number of rows in the file
+    min_max : Dict[str, tuple]
+        (min, max) of numeric columns whose row groups all carry min/max statistics
+    null_count : Dict[str, int]
+        Number of nulls of non-floating columns whose row groups all carry null counts (Parquet
+        counts NaN as a value, while pandas counts it as missing)
+    distinct_count : Dict[str, int]
+        Exact number of distinct values, only available for single row group files whose writer
+        recorded it
+    data_type : Dict[str, str]
+        Lux data types implied by the Arrow logical type of timestamps, dates and booleans
+    """
+
+    def __init__(self, path, columns: List[str] = None):
+        try:
+            import pyarrow.parquet as pq
+            import pyarrow.types as pa_types
+        except ImportError:
+            raise ImportError(
+                "Reading Parquet file statistics requires pyarrow. Install it with `pip install pyarrow`."
+            )
+        parquet_file = pq.ParquetFile(path)
+        file_metadata = parquet_file.metadata
+        self.num_rows = file_metadata.num_rows
+        self.min_max = {}
+        self.null_count = {}
+        self.distinct_count = {}
+        self.data_type = {}
+
+        arrow_schema = parquet_file.schema_arrow
+        attributes = [name for name in arrow_schema.names if columns is None or name in columns]
+        for attr in attributes:
+            arrow_type = arrow_schema.field(attr).type
+            if pa_types.is_timestamp(arrow_type) or pa_types.is_date(arrow_type):
+                self.data_type[attr] = "temporal"
+            elif pa_types.is_boolean(arrow_type):
+                self.data_type[attr] = "nominal"
+
+        # position of each (non-nested) column among the leaf columns of the row groups
+        leaf_position = {
+            file_metadata.schema.column(i).path: i for i in range(file_metadata.num_columns)
+        }
+        for attr in attributes:
+            if attr not in leaf_position:
+                continue
+            arrow_type = arrow_schema.field(attr).type
+            chunks = [
+                file_metadata.row_group(i).column(leaf_position[attr]).statistics
+                for i in range(file_metadata.num_row_groups)
+            ]
+            if any(stats is None for stats in chunks):
+                continue
+            is_floating = pa_types.is_floating(arrow_type)
+            if not is_floating and all(stats.has_null_count for stats in chunks):
+                self.null_count[attr] = int(sum(stats.null_count for stats in chunks))
+            # statistics of all-null row groups have no min/max
+            valued_chunks = [stats for stats in chunks if stats.num_values > 0]
+            is_numeric = is_floating or pa_types.is_integer(arrow_type)
+            if is_numeric and valued_chunks and all(stats.has_min_max for stats in valued_chunks):
+                self.min_max[attr] = (
+                    min(stats.min for stats in valued_chunks),
+                    max(stats.max for stats in valued_chunks),
+                )
+            if len(chunks) == 1 and chunks[0].has_distinct_count:
+                self.distinct_count[attr] = int(chunks[0].distinct_count)
+
+    def __repr__(self):
+        return f"<ParquetMetadata: {self.num_rows} rows, statistics for {len(self.null_count)} columns>"
+
+    def without(self, attributes: List) -> "ParquetMetadata":
+        """
+        Copy of the metadata without the entries of the given columns (e.g., after they changed)
+        """
+        metadata = copy.copy(self)
+        for name in ["min_max", "null_count", "distinct_count", "data_type"]:
+            entries = getattr(self, name)
+            setattr(metadata, name, {k: v for k, v in entries.items() if k not in attributes})
+        return metadata
+
+
+def read_parquet(path, **kwargs) -> pd.DataFrame:
+    """
+    Read a Parquet file with `pd.read_parquet`, and attach the file's column statistics to the
+    resulting dataframe so that Lux computes only the metadata the file cannot supply.
+
+    Parameters
+    ----------
+    path : str
+        Path of the Parquet file
+    **kwargs
+        Passed on to `pd.read_parquet`
+    """
+    df = pd.read_parquet(path, **kwargs)
+    if hasattr(df, "attach_file_metadata") and not kwargs.get("filters"):
+        df.attach_file_metadata(ParquetMetadata(path, columns=kwargs.get("columns")))
+    return df
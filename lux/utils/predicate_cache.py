@@ -0,0 +1,171 @@
+#  Copyright 2019-2020 The Lux Authors.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import warnings
+from collections import OrderedDict
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+import lux
+from lux.utils import utils
+
+# Columns with more distinct values are not coded, their equality masks are computed by comparison
+MAX_CODED_CARDINALITY = 2**16
+
+
+def evaluate_predicate(series: pd.Series, op: str, val: object) -> Optional[np.ndarray]:
+    """
+    Boolean mask of the rows of a column satisfying a filter predicate
+
+    Parameters
+    ----------
+    series : pd.Series
+        Filtered column
+    op : str
+        Filter operation, '=', '<', '>', '<=', '>=', '!='
+    val : object
+        Filter value
+
+    Returns
+    -------
+    np.ndarray
+        Mask of the rows kept by the filter, or None if the operation is not supported
+    """
+    # Handling NaN filter values
+    if utils.like_nan(val):
+        if op != "=" and op != "!=":
+            warnings.warn("Filter on NaN must be used with equality operations (i.e., `=` or `!=`)")
+        elif op == "=":
+            return series.isna().to_numpy()
+        else:
+            return series.notna().to_numpy()
+    # Applying filter in regular, non-NaN cases
+    if op == "=":
+        result = series == val
+    elif op == "<":
+        result = series < val
+    elif op == ">":
+        result = series > val
+    elif op == "<=":
+        result = series <= val
+    elif op == ">=":
+        result = series >= val
+    elif op == "!=":
+        result = series != val
+    else:
+        return None
+    # nullable comparisons (e.g., on extension arrays) do not keep missing values
+    return result.to_numpy(dtype=bool, na_value=False)
+
+
+class PredicateCache:
+    """
+    Masks of the filter predicates evaluated on a dataframe, so that the charts and actions
+    filtering the same data on the same (attribute, operation, value) compare its values once.
+    Masks are kept until the data changes (its fingerprint differs), and the least recently used
+    ones are evicted once they exceed `max_size` bytes.
+
+    Equality predicates on object columns of low cardinality are answered from the codes of the
+    column's values: factorized once, they index every value's rows like a compressed bitmap, so
+    that each mask is an integer comparison instead of a comparison of Python objects.
+    """
+
+    def __init__(self, fingerprint: str, max_size: int):
+        self.fingerprint = fingerprint
+        self.max_size = max_size
+        self.size = 0
+        self._entries = OrderedDict()
+
+    def __repr__(self):
+        return f"<PredicateCache: {len(self._entries)} entries, size={self.size}/{self.max_size} bytes>"
+
+    def mask(self, df: pd.DataFrame, attribute: str, op: str, val: object) -> Optional[np.ndarray]:
+        """
+        Read-only mask of the rows of `df` satisfying the predicate (see `evaluate_predicate`)
+        """
+        key = ("mask", attribute, op, type(val), val)
+        try:
+            mask = self._get(key)
+        except TypeError:
+            # unhashable filter values are not cached
+            return evaluate_predicate(df[attribute], op, val)
+        if mask is not None:
+            return mask
+        mask = None
+        if op == "=" and not utils.like_nan(val) and df[attribute].dtype == object:
+            mask = self._coded_mask(df[attribute], val)
+        if mask is None:
+            mask = evaluate_predicate(df[attribute], op, val)
+            if mask is None:
+                return None
+        mask.flags.writeable = False
+        self._put(key, mask, mask.nbytes)
+        return mask
+
+    def _coded_mask(self, series: pd.Series, val: object) -> Optional[np.ndarray]:
+        key = ("codes", series.name)
+        coded = self._get(key)
+        if coded is None:
+            codes, uniques = pd.factorize(series)
+            if len(uniques) > MAX_CODED_CARDINALITY:
+                coded = (None, None)
+                self._put(key, coded, 0)
+            else:
+                coded = (codes.astype(np.min_scalar_type(len(uniques))), pd.Index(uniques))
+                self._put(key, coded, coded[0].nbytes + coded[1].nbytes)
+        codes, uniques = coded
+        if codes is None:
+            return None
+        code = uniques.get_indexer([val])[0]
+        if code < 0:
+            return np.zeros(len(codes), dtype=bool)
+        return codes == code
+
+    def _get(self, key):
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            return entry[0]
+        return None
+
+    def _put(self, key, value, size: int) -> None:
+        if size > self.max_size:
+            return
+        self._entries[key] = (value, size)
+        self.size += size
+        while self.size > self.max_size:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self.size -= evicted_size
+
+
+def predicate_cache(df: pd.DataFrame) -> Optional[PredicateCache]:
+    """
+    Predicate cache of a LuxDataFrame, created (or reset once the data changed) on access
+
+    Returns
+    -------
+    PredicateCache
+        Cache of the dataframe, or None if disabled (see `lux.config.predicate_cache_size`) or
+        if the dataframe cannot be fingerprinted
+    """
+    if lux.config.predicate_cache_size == 0 or not hasattr(df, "fingerprint"):
+        return None
+    fingerprint = df.fingerprint()
+    cache = getattr(df, "_predicate_cache", None)
+    if cache is None or cache.fingerprint != fingerprint:
+        cache = PredicateCache(fingerprint, lux.config.predicate_cache_size)
+        df._predicate_cache = cache
+    cache.max_size = lux.config.predicate_cache_size
+    return cache
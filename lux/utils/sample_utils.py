@@ -0,0 +1,102 @@
+#  Copyright 2019-2020 The Lux Authors.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+
+class RowSample:
+    """
+    Rows of a dataframe sampled for computing its charts, kept as their positions rather than as
+    a copy of the rows. The positions only depend on the number of rows, so they are kept when
+    columns change, and a row subset of the dataframe reuses them (see `subset`) instead of
+    drawing a sample of its own.
+
+    Attributes
+    ----------
+    num_rows : int
+        Number of rows of the sampled dataframe
+    positions : np.ndarray
+        Positions of the sampled rows, in the order they were drawn
+    fraction : float, optional
+        Fraction of the rows drawn, or None if a fixed number of rows was drawn
+    """
+
+    def __init__(self, num_rows: int, positions: np.ndarray, fraction: Optional[float] = None):
+        self.num_rows = num_rows
+        self.positions = positions
+        self.fraction = fraction
+
+    def __repr__(self):
+        return f"<RowSample: {len(self.positions)} of {self.num_rows} rows>"
+
+    def __len__(self):
+        return len(self.positions)
+
+    def subset(self, parent_index: pd.Index, index: pd.Index) -> Optional["RowSample"]:
+        """
+        Sample of a subset of the rows of the sampled dataframe: the rows of the subset that are
+        in this sample, which are a sample of the same fraction of the subset
+
+        Parameters
+        ----------
+        parent_index : pd.Index
+            Index of the sampled dataframe, with unique labels
+        index : pd.Index
+            Index of the row subset
+
+        Returns
+        -------
+        RowSample
+            Sample of the subset, or None if its rows cannot be located in the sampled dataframe
+        """
+        if len(parent_index) != self.num_rows:
+            return None
+        parent_positions = parent_index.get_indexer(index)
+        if (parent_positions < 0).any():
+            return None
+        sampled = np.zeros(self.num_rows, dtype=bool)
+        sampled[self.positions] = True
+        return RowSample(len(index), np.flatnonzero(sampled[parent_positions]), self.fraction)
+
+
+def sample_rows(
+    num_rows: int, size: int = None, fraction: float = None, random_state: int = 1
+) -> RowSample:
+    """
+    Draw the same rows as `DataFrame.sample(n=size, frac=fraction, random_state=random_state)`,
+    without taking them
+
+    Parameters
+    ----------
+    num_rows : int
+        Number of rows of the sampled dataframe
+    size : int, optional
+        Number of rows to draw
+    fraction : float, optional
+        Fraction of the rows to draw, if no size is given
+    random_state : int
+        Seed of the random number generator
+
+    Returns
+    -------
+    RowSample
+        Positions of the drawn rows
+    """
+    if size is None:
+        size = round(fraction * num_rows)
+    positions = np.random.RandomState(random_state).choice(num_rows, size=size, replace=False)
+    return RowSample(num_rows, positions.astype(np.intp, copy=False), fraction)
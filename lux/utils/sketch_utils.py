@@ -0,0 +1,181 @@
+#  Copyright 2019-2020 The Lux Authors.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+from lux.utils.unique_values import UniqueValues
+
+# Number of rows hashed at a time, bounds the memory used for the intermediate hash array
+HASH_CHUNK_SIZE = 1000000
+
+
+class HyperLogLog:
+    """
+    HyperLogLog sketch for estimating the number of distinct values of a column
+    with a fixed amount of memory (2^precision one-byte registers).
+    """
+
+    def __init__(self, precision: int = 14):
+        self.precision = precision
+        self.num_registers = 1 << precision
+        self.registers = np.zeros(self.num_registers, dtype=np.uint8)
+
+    def __repr__(self):
+        return f"<HyperLogLog: precision={self.precision}, estimate={self.estimate()}>"
+
+    def add_hashes(self, hashes: np.ndarray) -> None:
+        """
+        Update the sketch with an array of 64-bit hashes
+        """
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        if len(hashes) == 0:
+            return
+        p = np.uint64(self.precision)
+        index = (hashes >> (np.uint64(64) - p)).astype(np.intp)
+        # Remaining bits, with a sentinel bit so that the rank is bounded by 64 - precision + 1
+        remainder = (hashes << p) | (np.uint64(1) << (p - np.uint64(1)))
+        rank = (np.uint8(65) - _bit_length(remainder)).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+
+    def add_series(self, series: pd.Series) -> None:
+        """
+        Hash the values of a series in chunks and update the sketch
+        """
+        for start in range(0, len(series), HASH_CHUNK_SIZE):
+            chunk = series.iloc[start : start + HASH_CHUNK_SIZE]
+            self.add_hashes(pd.util.hash_pandas_object(chunk, index=False).to_numpy())
+
+    def merge(self, other: "HyperLogLog") -> "HyperLogLog":
+        """
+        Return a new sketch that estimates the distinct count of the union of both inputs
+        """
+        if self.precision != other.precision:
+            raise ValueError("Cannot merge HyperLogLog sketches with different precisions.")
+        merged = HyperLogLog(self.precision)
+        merged.registers = np.maximum(self.registers, other.registers)
+        return merged
+
+    def estimate(self) -> int:
+        m = self.num_registers
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw_estimate = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(np.int64)))
+        num_zeros = int(np.count_nonzero(self.registers == 0))
+        if raw_estimate <= 2.5 * m and num_zeros > 0:
+            # small range correction (linear counting)
+            return int(round(m * np.log(m / num_zeros)))
+        return int(round(raw_estimate))
+
+
+def _bit_length(values: np.ndarray) -> np.ndarray:
+    """
+    Vectorized int.bit_length for uint64 arrays. Each 32-bit half is exactly representable
+    as a float64, so frexp returns the exact bit length of each half.
+    """
+    high = (values >> np.uint64(32)).astype(np.float64)
+    low = (values & np.uint64(0xFFFFFFFF)).astype(np.float64)
+    high_length = np.frexp(high)[1]
+    low_length = np.frexp(low)[1]
+    return np.where(high_length > 0, high_length + 32, low_length).astype(np.uint8)
+
+
+class HeavyHitters(list):
+    """
+    Capped stand-in for the full list of unique values of a high-cardinality column.
+
+    Holds only the (at most) k most frequent values, most frequent first, together with the
+    estimated number of distinct values. Since it is a list, consumers that iterate over or
+    test membership in `unique_values` keep working; code that needs the complete domain of a
+    column should check `is_exact_unique` first.
+    """
+
+    def __init__(self, values, cardinality: int, counts=None):
+        super().__init__(values)
+        self.cardinality = cardinality
+        self.counts = list(counts) if counts is not None else []
+
+    def __repr__(self):
+        return f"<HeavyHitters: top {len(self)} of ~{self.cardinality} values>"
+
+
+def is_exact_unique(values) -> bool:
+    """
+    Whether a `unique_values` entry holds every distinct value of its column
+    """
+    return not isinstance(values, HeavyHitters)
+
+
+def sketch_column(
+    series: pd.Series, threshold: int, k: int, sample_size: int = 100000, cardinality: int = None
+):
+    """
+    Summarize the distinct values of a column, keeping the exact unique list only when the
+    estimated cardinality is at most `threshold`.
+
+    Parameters
+    ----------
+    series : pd.Series
+        Column to summarize
+    threshold : int
+        Largest (estimated) cardinality for which the exact list of unique values is kept
+    k : int
+        Number of most frequent values kept for columns above the threshold
+    sample_size : int
+        Number of rows used to find the most frequent values of high-cardinality columns
+    cardinality : int, optional
+        Exact cardinality of the column when already known (e.g., from file statistics), used
+        instead of a HyperLogLog estimate. Either is capped by the number of values of the column.
+
+    Returns
+    -------
+    Tuple[Sequence, int]
+        The unique values (UniqueValues, or a HeavyHitters list when capped) and the cardinality
+    """
+    if cardinality is None:
+        sketch = HyperLogLog()
+        sketch.add_series(series)
+        estimate = sketch.estimate()
+    else:
+        estimate = cardinality
+    # an estimate cannot exceed the number of values (missing values count as one unique value, as
+    # in `Series.unique`), and a column within the threshold gets its exact cardinality below
+    non_null = series.count()
+    estimate = min(estimate, non_null + int(non_null < len(series)))
+    if estimate <= threshold:
+        unique_values = UniqueValues(series.unique())
+        return unique_values, len(unique_values)
+    # Frequent values are by definition well-represented in a sample, so a bounded
+    # sample is enough to find them without building a hash table over every value
+    if len(series) > sample_size:
+        series = series.sample(n=sample_size, random_state=1)
+    counts = series.value_counts(dropna=False).head(k)
+    return HeavyHitters(counts.index, estimate, counts.to_numpy()), estimate
+
+
+def merge_unique_values(parts: List) -> Optional[UniqueValues]:
+    """
+    Unique values of the concatenation of columns, merged from the unique values of each column in
+    the order in which they first appear, as `Series.unique` would return them
+
+    Returns
+    -------
+    UniqueValues
+        The merged unique values, or None if the unique values of a column are capped
+    """
+    if not all(is_exact_unique(values) for values in parts):
+        return None
+    arrays = [values.values if isinstance(values, UniqueValues) else values for values in parts]
+    merged = pd.concat([pd.Series(array) for array in arrays], ignore_index=True)
+    return UniqueValues(merged.unique())
@@ -5,6 +5,7 @@ import lux
 import autopep8
 import math
 import os
+from lux.utils.utils import IN_MEMORY_EXECUTORS
 
 
 class LuxTracer:
@@ -64,6 +65,9 @@ class LuxTracer:
         # print ("-----------stop_tracing-----------")
         sys.settrace(None)
 
+    def is_tracing(self) -> bool:
+        return sys.gettrace() == self.profile_func
+
     def process_executor_code(self, executor_lines):
         selected = {}
         selected_index = {}
@@ -106,6 +110,10 @@ class LuxTracer:
                     "execute_aggregate",
                     "execute_binning",
                     "execute_2D_binning",
+                    "shared_aggregation",
+                    "histogram_bin_codes",
+                    "_bin_codes_cache",
+                    "cached_cut_bin_codes",
                 ]  # Lux-specific keywords to ignore
                 whitelist = ['if clause.attribute != "Record":', "bin_attribute ="]
                 ignore = ignore_construct + ignore_lux_keyword
@@ -131,10 +139,11 @@ class LuxTracer:
                         index += 1
 
         curr_executor = lux.config.executor.name
-        if curr_executor != "PandasExecutor":
+        if curr_executor not in IN_MEMORY_EXECUTORS:
             import_code = "from lux.utils import utils\nfrom lux.executor.SQLExecutor import SQLExecutor\nimport pandas\nimport math\n"
             var_init_code = "tbl = 'insert your LuxSQLTable variable here'\nview = 'insert the name of your Vis object here'\n"
         else:
+            # in-memory executors export the code of the PandasExecutor (see Vis.to_code)
             import_code = "from lux.utils import utils\nfrom lux.executor.PandasExecutor import PandasExecutor\nimport pandas\nimport math\n"
             var_init_code = "ldf = 'insert your LuxDataFrame variable here'\nvis = 'insert the name of your Vis object here'\nvis._vis_data = ldf\n"
         function_code += "\t" + import_code
@@ -167,7 +176,7 @@ class LuxTracer:
             function_code += line
             prev_line = line
 
-        if curr_executor != "PandasExecutor":
+        if curr_executor not in IN_MEMORY_EXECUTORS:
             output += "def create_chart_data(tbl, view):\n"
             function_code += "\nreturn view._vis_data"
         else:
@@ -0,0 +1,91 @@
+#  Copyright 2019-2020 The Lux Authors.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from collections.abc import Sequence
+
+import numpy as np
+import pandas as pd
+
+
+class UniqueValues(Sequence):
+    """
+    Distinct values of a column, stored as the typed array returned by `Series.unique` (or the
+    index itself) instead of a list of boxed Python objects.
+
+    It behaves like the list it replaces: iterating, indexing, `len`, `==`, `+` and `*` give the
+    same results as on `list(values)`, and the list is only materialized by `tolist`. Membership
+    tests are answered through the hash table of a `pd.Index` built on first use.
+    """
+
+    def __init__(self, values):
+        self._values = values
+        self._index = None
+
+    def __repr__(self):
+        return f"UniqueValues({self.tolist()!r})"
+
+    @property
+    def values(self):
+        """
+        The underlying NumPy or pandas array
+        """
+        return self._values
+
+    def tolist(self) -> list:
+        return list(self._values)
+
+    def __len__(self):
+        return len(self._values)
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return list(self._values[key])
+        return self._values[key]
+
+    def __contains__(self, value):
+        if self._index is None:
+            self._index = pd.Index(self._values, copy=False)
+        try:
+            return value in self._index
+        except (TypeError, ValueError):
+            # e.g., unhashable values, which a column's unique values cannot hold
+            return False
+
+    def __array__(self, dtype=None):
+        return np.asarray(self._values, dtype=dtype)
+
+    def __eq__(self, other):
+        if isinstance(other, (list, tuple, UniqueValues)):
+            return self.tolist() == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __add__(self, other):
+        return self.tolist() + list(other)
+
+    def __radd__(self, other):
+        return list(other) + self.tolist()
+
+    def __mul__(self, n):
+        return self.tolist() * n
+
+    __rmul__ = __mul__
+
+    def __getstate__(self):
+        # the hash table is rebuilt on demand
+        return {"_values": self._values, "_index": None}
@@ -15,6 +15,9 @@ import pandas as pd
 import matplotlib.pyplot as plt
 import lux
 
+# Executors computing the charts of the dataframe in memory, rather than in a SQL database
+IN_MEMORY_EXECUTORS = ("PandasExecutor", "PolarsExecutor", "DuckDBExecutor")
+
 
 def convert_to_list(x):
     """
@@ -84,7 +87,7 @@ def check_if_id_like(df, attribute):
     if is_string:
         # For string IDs, usually serial numbers or codes with alphanumerics have a consistent length (eg., CG-39405) with little deviation. For a high cardinality string field but not ID field (like Name or Brand), there is less uniformity across the string lengths.
         if len(df) > 50:
-            if lux.config.executor.name == "PandasExecutor":
+            if lux.config.executor.name in IN_MEMORY_EXECUTORS:
                 sampled = df[attribute].sample(50, random_state=99)
             else:
                 from lux.executor.SQLExecutor import SQLExecutor
@@ -99,12 +102,16 @@ def check_if_id_like(df, attribute):
             and str_length_uniformity
         )
     else:
-        if len(df) >= 2:
-            series = df[attribute]
-            diff = series.diff()
-            evenly_spaced = all(diff.iloc[1:] == diff.iloc[1])
-        else:
-            evenly_spaced = True
+        evenly_spaced = False
+        if high_cardinality:
+            # use the evenly-spaced check precomputed in compute_stats when available
+            evenly_spaced = (getattr(df, "_evenly_spaced", None) or {}).get(attribute)
+            if evenly_spaced is None:
+                if len(df) >= 2:
+                    diff = df[attribute].diff()
+                    evenly_spaced = bool((diff.iloc[1:] == diff.iloc[1]).all())
+                else:
+                    evenly_spaced = True
         if attribute_contain_id:
             almost_all_vals_unique = df.cardinality[attribute] >= 0.75 * len(df)
         return high_cardinality and (almost_all_vals_unique or evenly_spaced)
@@ -14,7 +14,7 @@
 
 from typing import List, Callable, Union
 from lux.vis.Clause import Clause
-from lux.utils.utils import check_import_lux_widget
+from lux.utils.utils import check_import_lux_widget, IN_MEMORY_EXECUTORS
 import lux
 import warnings
 
@@ -239,7 +239,7 @@ class Vis:
         renderer = AltairRenderer(output_type="Altair")
         self._code = renderer.create_vis(self, standalone)
 
-        if lux.config.executor.name == "PandasExecutor":
+        if lux.config.executor.name in IN_MEMORY_EXECUTORS:
             function_code = "def plot_data(source_df, vis):\n"
             function_code += "\timport altair as alt\n"
             function_code += "\tvisData = create_chart_data(source_df, vis)\n"
@@ -339,8 +339,14 @@ class Vis:
         elif language == "matplotlib_svg":
             return self._to_matplotlib_svg()
         elif language == "python":
+            executor = lux.config.executor
+            # chart data of in-memory dataframes is exported as the pandas code computing it
+            if executor.name in IN_MEMORY_EXECUTORS:
+                from lux.executor.PandasExecutor import PandasExecutor
+
+                executor = PandasExecutor()
             lux.config.tracer.start_tracing()
-            lux.config.executor.execute(lux.vis.VisList.VisList(input_lst=[self]), self._source)
+            executor.execute(lux.vis.VisList.VisList(input_lst=[self]), self._source)
             lux.config.tracer.stop_tracing()
             self._trace_code = lux.config.tracer.process_executor_code(lux.config.tracer_relevant_lines)
             lux.config.tracer_relevant_lines = []
@@ -324,3 +324,42 @@ def test_metadata_propogate_invalid_intent():
     assert new_df._inferred_intent == [], "Invalid inferred intent is cleared"
     new_df._ipython_display_()
     assert new_df.current_vis == []
+
+
+def test_filter_shared_scan(global_var):
+    from lux.action.filter import add_filter
+    from lux.interestingness.interestingness import interestingness
+
+    df = pd.read_csv("lux/data/car.csv")
+    df.set_intent(["Horsepower"])
+    recommendation = add_filter(df)
+    assert len(recommendation["collection"]) > 0
+    for vis in recommendation["collection"]:
+        # charts filtered with the shared positions of each value equal charts filtered on their own
+        expected = Vis(vis._inferred_intent, df)
+        assert vis.data.to_pandas().equals(expected.data.to_pandas())
+        # the shared unfiltered vis and filter sizes give the same scores
+        assert vis.score == interestingness(expected, df)
+
+
+def test_correlation_from_matrix(global_var):
+    from lux.action.correlation import correlation
+    from lux.interestingness.interestingness import interestingness
+
+    df = pd.read_csv("lux/data/car.csv")
+    df.maintain_metadata()
+    recommendation = correlation(df)
+    collection = recommendation["collection"]
+    assert 0 < len(collection) <= lux.config.topk
+    scores = [vis.score for vis in collection]
+    assert scores == sorted(scores, reverse=True)
+    pairs = [
+        frozenset(vis.get_attr_by_data_model("measure")[i].attribute for i in (0, 1))
+        for vis in collection
+    ]
+    assert len(set(pairs)) == len(pairs), "Only one of {X,Y} and {Y,X} is recommended"
+    for vis in collection:
+        # the score from the correlation matrix is the score of the scatterplot
+        expected = Vis(vis._inferred_intent, df)
+        assert vis.data.to_pandas().equals(expected.data.to_pandas())
+        assert vis.score == pytest.approx(interestingness(expected, df))
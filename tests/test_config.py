@@ -248,6 +248,80 @@ def test_sampling_parameters_config():
     lux.config.sampling_start = 10000
 
 
+def test_sketch_metadata_config():
+    lux.config.sketch_metadata = True
+    lux.config.unique_values_threshold = 50
+    lux.config.heavy_hitters_cap = 10
+    df = pd.read_csv("lux/data/car.csv")
+    df.maintain_metadata()
+    # high-cardinality columns keep a capped list of their most frequent values
+    assert len(df.unique_values["Name"]) == 10
+    assert df.cardinality["Name"] > 50
+    assert df.data_type["Name"] == "nominal"
+    # low-cardinality columns are unaffected
+    assert sorted(df.unique_values["Origin"]) == ["Europe", "Japan", "USA"]
+    assert df.cardinality["Origin"] == 3
+    # cached Series.unique is only used when the unique values are exact
+    assert len(df["Name"].unique()) == len(set(df["Name"]))
+    lux.config.sketch_metadata = False
+    lux.config.unique_values_threshold = 10000
+    lux.config.heavy_hitters_cap = 100
+
+
+def test_metadata_workers_config(monkeypatch):
+    import lux.executor.PandasExecutor
+
+    serial_df = pd.read_csv("lux/data/car.csv")
+    serial_df.maintain_metadata()
+    # run the thread pool on small frames too
+    monkeypatch.setattr(lux.executor.PandasExecutor, "PARALLEL_METADATA_MIN_ROWS", 0)
+    lux.config.metadata_workers = 4
+    df = pd.read_csv("lux/data/car.csv")
+    df.maintain_metadata()
+    assert df.data_type == serial_df.data_type
+    assert df.cardinality == serial_df.cardinality
+    assert df._min_max == serial_df._min_max
+    assert list(df.unique_values) == list(serial_df.unique_values)
+    with pytest.warns(UserWarning, match="must be a positive integer"):
+        lux.config.metadata_workers = 0
+    assert lux.config.metadata_workers == 4
+    lux.config.metadata_workers = 1
+
+
+def test_metadata_cache_config(tmp_path):
+    import os
+    import pickle
+    import stat
+
+    tmp_path = tmp_path / "cache"
+    lux.config.metadata_cache_dir = str(tmp_path)
+    df = pd.read_csv("lux/data/car.csv")
+    df.maintain_metadata()
+    assert stat.S_IMODE(os.stat(tmp_path).st_mode) == 0o700
+    (entry,) = tmp_path.iterdir()
+    assert entry.suffix == ".npz"
+    cached_df = pd.read_csv("lux/data/car.csv")
+    cached_df.maintain_metadata()
+    assert cached_df.data_type == df.data_type
+    assert cached_df.cardinality == df.cardinality
+    assert cached_df._min_max == df._min_max
+    assert cached_df.unique_values == df.unique_values
+    # entries are read as data only: a pickled entry is discarded rather than loaded
+    entry.write_bytes(pickle.dumps(cached_df._cached_metadata()))
+    assert lux.config.metadata_cache.get(entry.stem) is None
+    assert not entry.exists()
+    # cached types are checked against the types specified by the user
+    override_df = pd.read_csv("lux/data/car.csv")
+    override_df.set_data_type({"Cylinders": "quantitative"})
+    override_df.maintain_metadata()
+    assert override_df.data_type["Cylinders"] == "quantitative"
+    # entries are evicted once the cache is over its size limit
+    lux.config.metadata_cache_size = 0
+    assert len(list(tmp_path.iterdir())) == 0
+    lux.config.metadata_cache_size = 256 * 1024 * 1024
+    lux.config.metadata_cache_dir = None
+
+
 def test_heatmap_flag_config():
     lux.config.heatmap = True
     df = pd.read_csv("https://raw.githubusercontent.com/lux-org/lux-datasets/master/data/airbnb_nyc.csv")
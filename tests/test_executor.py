@@ -15,7 +15,8 @@
 from .context import lux
 import pytest
 import pandas as pd
-from lux.executor.PandasExecutor import PandasExecutor
+import numpy as np
+from lux.executor.PandasExecutor import PandasExecutor, SharedAggregation
 from lux.vis.Vis import Vis
 from lux.vis.VisList import VisList
 
@@ -164,6 +165,128 @@ def test_binning(global_var):
     assert len(vis.data) == nbins
 
 
+def test_cached_bin_codes(global_var):
+    df = pd.read_csv("lux/data/car.csv")
+    vislist = VisList([lux.Clause("?", data_model="measure")], df)
+    assert len(df._bin_codes) == 1, "Histograms of the same data share its bin codes"
+    for vis in vislist:
+        bin_attr = vis.get_attr_by_channel("x")[0].attribute
+        counts, edges = np.histogram(
+            df[bin_attr].dropna(), bins=vis.get_attr_by_channel("x")[0].bin_size
+        )
+        assert list(vis.data["Number of Records"]) == list(counts)
+        assert list(vis.data[bin_attr]) == list(edges[:-1])
+
+    vis = Vis([lux.Clause("Horsepower"), lux.Clause("Weight")], df)
+    vis._mark = "heatmap"
+    PandasExecutor.execute([vis], df)
+    expected = Vis([lux.Clause("Horsepower"), lux.Clause("Weight")], df)
+    expected._mark = "heatmap"
+    expected._vis_data = df[["Horsepower", "Weight"]]
+    PandasExecutor.execute_2D_binning(expected)
+    assert vis.data.to_pandas().equals(expected.data.to_pandas())
+
+
+def test_predicate_cache(global_var):
+    df = pd.read_csv("lux/data/car.csv")
+    origin = lux.Clause(attribute="Origin", filter_op="=", value="Japan")
+    cylinders = lux.Clause(attribute="Cylinders", filter_op=">", value=3)
+    mask = PandasExecutor.filter_mask(df, [origin, cylinders])
+    assert mask.sum() == ((df["Origin"] == "Japan") & (df["Cylinders"] > 3)).sum()
+    cached = PandasExecutor.predicate_mask(df, "Origin", "=", "Japan")
+    assert cached is PandasExecutor.predicate_mask(df, "Origin", "=", "Japan")
+    assert PandasExecutor.predicate_mask(df, "Origin", "=", "Mars").sum() == 0
+    assert PandasExecutor.predicate_mask(df, "Origin", "=", np.nan).sum() == 0
+
+    df["Origin"] = df["Origin"].str.upper()
+    assert PandasExecutor.predicate_mask(df, "Origin", "=", "Japan").sum() == 0
+    assert PandasExecutor.predicate_mask(df, "Origin", "=", "JAPAN").sum() == cached.sum()
+
+    predicate_cache_size = lux.config.predicate_cache_size
+    lux.config.predicate_cache_size = 0
+    try:
+        assert PandasExecutor.apply_filter(df, "Cylinders", "<=", 4).equals(df[df["Cylinders"] <= 4])
+    finally:
+        lux.config.predicate_cache_size = predicate_cache_size
+
+
+def test_polars_executor(global_var):
+    pytest.importorskip("polars")
+    df = pd.read_csv("lux/data/car.csv")
+    intents = [
+        [lux.Clause(attribute="Horsepower", aggregation="mean"), lux.Clause(attribute="Origin")],
+        [lux.Clause(attribute="Cylinders"), lux.Clause("Origin=Japan")],
+        [lux.Clause(attribute="Horsepower", bin_size=10), lux.Clause("Cylinders>3")],
+        [lux.Clause(attribute="Horsepower"), lux.Clause(attribute="Weight")],
+    ]
+    expected = []
+    for intent in intents:
+        expected.append(Vis(intent, df).data.reset_index(drop=True))
+    lux.config.set_executor_type("Polars")
+    try:
+        for intent, pandas_data in zip(intents, expected):
+            polars_data = Vis(intent, df).data.reset_index(drop=True)
+            pd.testing.assert_frame_equal(
+                pd.DataFrame(polars_data), pd.DataFrame(pandas_data), check_dtype=False, check_like=True
+            )
+    finally:
+        lux.config.set_executor_type("Pandas")
+
+
+def test_duckdb_executor(global_var):
+    pytest.importorskip("duckdb")
+    df = pd.read_csv("lux/data/car.csv")
+    intents = [
+        [lux.Clause(attribute="Horsepower", aggregation="mean"), lux.Clause(attribute="Origin")],
+        [lux.Clause(attribute="Cylinders"), lux.Clause("Origin=Japan")],
+        [
+            lux.Clause(attribute="Weight", aggregation="sum"),
+            lux.Clause("Origin"),
+            lux.Clause("Cylinders"),
+        ],
+        [lux.Clause(attribute="Horsepower", bin_size=10), lux.Clause("Cylinders>3")],
+        [lux.Clause(attribute="Horsepower"), lux.Clause(attribute="Weight")],
+    ]
+    expected = []
+    for intent in intents:
+        expected.append(Vis(intent, df).data.reset_index(drop=True))
+    heatmap = Vis([lux.Clause(attribute="Horsepower"), lux.Clause(attribute="Weight")], df)
+    heatmap._vis_data = df[["Horsepower", "Weight"]]
+    PandasExecutor.execute_2D_binning(heatmap)
+    expected_heatmap = heatmap.data
+    df.maintain_metadata()
+    expected_unique_values = {attr: list(df.unique_values[attr]) for attr in df.columns}
+    missing = pd.DataFrame({"c1": [1.0, np.nan, 3.0, 4.0], "c2": ["x", None, "y", np.nan]})
+    missing.maintain_metadata()
+    expected_missing = {attr: [repr(v) for v in missing.unique_values[attr]] for attr in missing.columns}
+    lux.config.set_executor_type("DuckDB")
+    try:
+        # missing values are listed as the pandas values found in the column (e.g., None or NaN)
+        missing = pd.DataFrame({"c1": [1.0, np.nan, 3.0, 4.0], "c2": ["x", None, "y", np.nan]})
+        missing.maintain_metadata()
+        for attr in missing.columns:
+            assert [repr(v) for v in missing.unique_values[attr]] == expected_missing[attr]
+        duckdb_df = pd.read_csv("lux/data/car.csv")
+        duckdb_df.maintain_metadata()
+        for attr in df.columns:
+            # in order of first appearance, as in the PandasExecutor
+            assert pd.Series(list(duckdb_df.unique_values[attr])).equals(
+                pd.Series(expected_unique_values[attr])
+            )
+        for intent, pandas_data in zip(intents, expected):
+            duckdb_data = Vis(intent, df).data.reset_index(drop=True)
+            pd.testing.assert_frame_equal(
+                pd.DataFrame(duckdb_data), pd.DataFrame(pandas_data), check_dtype=False, check_like=True
+            )
+        heatmap._vis_data = df[["Horsepower", "Weight"]]
+        lux.config.executor.execute_2D_binning(heatmap)
+        pd.testing.assert_frame_equal(
+            pd.DataFrame(heatmap.data), pd.DataFrame(expected_heatmap), check_dtype=False
+        )
+    finally:
+        lux.config.set_executor_type("Pandas")
+
+
 def test_record(global_var):
     df = pytest.car_df
     vis = Vis([lux.Clause(attribute="Cylinders")], df)
@@ -187,6 +310,26 @@ def test_filter_aggregation_fillzero_aligned(global_var):
     assert result[result["Cylinders"] == 6]["MilesPerGal"].values[0] == externalValidation[6]
 
 
+def test_filter_aggregation_fillzero_missing_values(global_var):
+    df = pd.DataFrame(
+        {
+            "Group": ["a", "b", None, "a", "c"] * 10,
+            "Color": ["x", "y", "x", None, "x"] * 10,
+            "Value": np.arange(50.0),
+        }
+    )
+    vis = Vis([lux.Clause("Group"), lux.Clause("Color=x")], df)
+    counts = dict(zip(vis.data["Group"].fillna("missing"), vis.data["Record"]))
+    assert counts == {"a": 10, "b": 0, "c": 10, "missing": 10}
+
+    vis = Vis([lux.Clause("Group"), lux.Clause("Value"), lux.Clause("Color", channel="color")], df)
+    assert len(vis.data) == 4 * 3
+    result = vis.data.fillna("missing").set_index(["Group", "Color"])["Value"]
+    assert result[("b", "x")] == 0
+    assert result[("a", "missing")] == df["Value"][3::5].mean()
+    assert result[("missing", "x")] == df["Value"][2::5].mean()
+
+
 def test_exclude_attribute(global_var):
     df = pytest.car_df
     intent = [lux.Clause("?", exclude=["Name", "Year"]), lux.Clause("Horsepower")]
@@ -196,3 +339,164 @@ def test_exclude_attribute(global_var):
         assert vis.get_attr_by_channel("x")[0].attribute != "Name"
         assert vis.get_attr_by_channel("y")[0].attribute != "Year"
         assert vis.get_attr_by_channel("y")[0].attribute != "Year"
+
+
+def test_compute_stats_vectorized():
+    df = pd.DataFrame(
+        {
+            "int": [3, 1, 2, 5, 4],
+            "float": [0.5, None, 1.5, 2.5, 0.5],
+            "nullable": pd.array([1, None, 3, 4, 5], dtype="Int64"),
+            "str": ["a", "b", "a", None, "c"],
+        }
+    )
+    df.maintain_metadata()
+    # min/max keep the column's own scalar type even though reductions run over mixed int/float blocks
+    assert df._min_max["int"] == (1, 5)
+    assert isinstance(df._min_max["int"][0], np.integer)
+    assert df._min_max["float"] == (0.5, 2.5)
+    assert df._min_max["nullable"] == (1, 5)
+    assert "str" not in df._min_max
+    assert df._null_count == {"int": 0, "float": 1, "nullable": 1, "str": 1}
+    assert df.cardinality == {"int": 5, "float": 4, "nullable": 5, "str": 4}
+
+
+def test_evenly_spaced_id():
+    df = pd.DataFrame({"serial": range(0, 2000, 2), "val": [1.0, 2.0] * 500})
+    df.maintain_metadata()
+    assert df._evenly_spaced == {"serial": True}
+    assert df.data_type["serial"] == "id"
+
+
+def test_parquet_file_metadata(global_var, tmp_path):
+    pytest.importorskip("pyarrow", exc_type=ImportError)
+    path = str(tmp_path / "car.parquet")
+    pytest.car_df.to_parquet(path)
+    expected = pd.read_parquet(path)
+    expected.maintain_metadata()
+
+    df = lux.read_parquet(path)
+    assert df._file_metadata.num_rows == len(df)
+    assert "Horsepower" in df._file_metadata.min_max
+    df.maintain_metadata()
+    assert df._min_max == expected._min_max
+    assert df._null_count == expected._null_count
+    assert df.cardinality == expected.cardinality
+    assert df.data_type == expected.data_type
+
+    # statistics of a changed column are dropped, the others are kept
+    df["Horsepower"] = df["Horsepower"] * 2
+    assert "Horsepower" not in df._file_metadata.min_max
+    assert "Weight" in df._file_metadata.min_max
+    df.maintain_metadata()
+    assert df._min_max["Horsepower"] == tuple(2 * v for v in expected._min_max["Horsepower"])
+
+    # statistics of another number of rows are not attached
+    head = pd.read_parquet(path).head(10)
+    with pytest.warns(UserWarning, match="file statistics"):
+        head.attach_file_metadata(path)
+    assert head._file_metadata is None
+
+
+def test_record_counts_from_value_counts(global_var):
+    lux.config.value_counts = True
+    df = pd.read_csv("lux/data/car.csv")
+    df.loc[3, "Origin"] = None
+    df.maintain_metadata()
+    assert list(df._value_counts["Origin"]) == list(df["Origin"].value_counts(dropna=False, sort=False))
+    vis = Vis([lux.Clause("Origin")], df)
+    counts = PandasExecutor._record_counts(vis, "Origin")
+    assert counts is not None
+    lux.config.value_counts = False
+    expected_df = pd.read_csv("lux/data/car.csv")
+    expected_df.loc[3, "Origin"] = None
+    expected = Vis([lux.Clause("Origin")], expected_df)
+    assert vis.data.to_pandas().equals(expected.data.to_pandas())
+
+    # the counts of a sampled dataframe are computed on its sample, like its other charts
+    lux.config.value_counts = True
+    sampling_start = lux.config.sampling_start
+    lux.config.sampling_start = 100
+    try:
+        df = pd.read_csv("lux/data/car.csv")
+        vis = Vis([lux.Clause("Origin")], df)
+        assert PandasExecutor._record_counts(vis, "Origin") is None
+        assert vis.data["Record"].sum() == len(df._sampled)
+    finally:
+        lux.config.value_counts = False
+        lux.config.sampling_start = sampling_start
+
+
+def test_shared_aggregation(global_var):
+    df = pd.read_csv("lux/data/car.csv")
+    intent = [
+        lux.Clause("Origin"),
+        lux.Clause("Horsepower", filter_op=">", value=100),
+        lux.Clause("?", data_model="measure"),
+    ]
+    vislist = VisList(intent, df)
+    plans = [SharedAggregation.plan(vis) for vis in vislist]
+    assert (
+        len(set(key for _, _, key, _ in plans)) == 1
+    ), "Charts share their filters and group-by attribute"
+    for vis in vislist:
+        # each chart computed on its own gives the same data as the batched computation
+        expected = Vis(vis._inferred_intent, df)
+        assert vis.data.to_pandas().equals(expected.data.to_pandas())
+
+    shared = SharedAggregation.aggregate(
+        df, ((), None, "Origin"), [(("Record",), "count"), (("Horsepower",), "max"), (("Name",), "mean")]
+    )
+    assert (None, (("Horsepower",), "max")) in shared
+    # aggregations that do not apply to a column are dropped
+    assert (None, (("Name",), "mean")) not in shared
+    # as a per-chart groupby drops them, which is decided from the types of the columns
+    attributes = ("Horsepower", "Name")
+    for aggregation in ["mean", "sum", "std"]:
+        assert SharedAggregation._aggregated_columns(df, attributes, aggregation) == ["Horsepower"]
+    for aggregation in ["max", "count", "first", "nunique"]:
+        assert SharedAggregation._aggregated_columns(df, attributes, aggregation) == list(attributes)
+    assert SharedAggregation._aggregated_columns(df, attributes, np.ptp) == []
+
+
+def test_shared_filter_partition(global_var):
+    df = pd.read_csv("lux/data/car.csv")
+    intent = [lux.Clause("Origin"), lux.Clause("Cylinders", filter_op="=", value="?")]
+    vislist = VisList(intent, df)
+    plans = [SharedAggregation.plan(vis) for vis in vislist]
+    assert all(partition[0] == "Cylinders" for _, partition, _, _ in plans)
+    for vis in vislist:
+        expected = Vis(vis._inferred_intent, df)
+        assert vis.data.to_pandas().equals(expected.data.to_pandas())
+
+
+def test_sample_positions_reuse(global_var):
+    from lux.utils.sample_utils import sample_rows
+
+    df = pd.DataFrame({"a": np.arange(1000), "b": np.arange(1000) % 10})
+    row_sample = sample_rows(len(df), fraction=0.75)
+    assert df.take(row_sample.positions).equals(df.sample(frac=0.75, random_state=1))
+
+    sampling_start = lux.config.sampling_start
+    pruning_cap = lux.config.early_pruning_sample_cap
+    pruning_start = lux.config.early_pruning_sample_start
+    lux.config.sampling_start = 100
+    lux.config.early_pruning_sample_cap = 100
+    lux.config.early_pruning_sample_start = 150
+    try:
+        df.maintain_metadata()
+        PandasExecutor.execute_sampling(df)
+        assert df._sampled.equals(df.sample(frac=0.75, random_state=1))
+        PandasExecutor.execute_approx_sample(df)
+        expected = df._sampled.sample(n=lux.config.early_pruning_sample_cap, random_state=1)
+        assert df._approx_sample.equals(expected)
+        child = df[df["b"] > 4]
+        assert child._sampled is None, "A row subset draws its own sample"
+        PandasExecutor.execute_sampling(child)
+        # the row subset samples the rows of its parent's sample that it kept
+        expected = df._sampled[df._sampled["b"] > 4].sort_index()
+        assert child._sampled.equals(expected)
+    finally:
+        lux.config.sampling_start = sampling_start
+        lux.config.early_pruning_sample_cap = pruning_cap
+        lux.config.early_pruning_sample_start = pruning_start
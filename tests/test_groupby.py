@@ -78,3 +78,33 @@ def test_series_groupby(global_var):
     new_ser = df.set_index("Brand")["Displacement"].groupby(level=0).agg("mean")
     assert new_ser._history[0].name == "groupby"
     assert new_ser.pre_aggregated
+
+
+def test_aggregate_metadata(global_var):
+    df = pytest.car_df
+    df.maintain_metadata()
+    new_df = (
+        df[["Horsepower", "Cylinders", "Brand"]]
+        .groupby("Brand")
+        .agg({"Horsepower": "mean", "Cylinders": "max"})
+    )
+    # the metadata is seeded from the groups and the aggregation functions
+    assert new_df._dirty_columns == {"Horsepower", "Cylinders"}
+    assert new_df.cardinality["Brand"] == len(df["Brand"].unique())
+    new_df.maintain_metadata()
+    assert new_df.data_type == {"Horsepower": "quantitative", "Cylinders": "nominal", "Brand": "nominal"}
+    assert new_df.cardinality["Horsepower"] == len(new_df["Horsepower"].unique())
+    assert new_df._min_max["Cylinders"] == (new_df["Cylinders"].min(), new_df["Cylinders"].max())
+
+    # only the types that cannot differ from a fresh inference are seeded
+    df = pd.read_csv("lux/data/car.csv")
+    df.maintain_metadata()
+    new_df = df.groupby("Origin", as_index=False).agg(
+        {"Year": "mean", "Weight": "max", "Cylinders": "min"}
+    )
+    assert new_df._retained_metadata["_data_type"] == {"Origin": "nominal"}
+    new_df.maintain_metadata()
+    expected = pd.DataFrame({attr: new_df[attr].to_numpy() for attr in new_df.columns})
+    expected.maintain_metadata()
+    assert new_df.data_type == expected.data_type
+    assert new_df.data_type["Year"] == "temporal"
@@ -84,6 +84,176 @@ def test_recs_inplace_operation(global_var):
     assert df._recs_fresh == True, "Failed to maintain recommendation after display df"
 
 
+def test_metadata_column_assignment(global_var):
+    df = pd.read_csv("lux/data/car.csv")
+    df._ipython_display_()
+    correlation = df.recommendation["Correlation"]
+    df["Brand Name"] = df["Brand"] + " " + df["Name"]
+    assert df._metadata_fresh == False, "Failed to expire metadata after column assignment"
+    assert df._dirty_columns == {"Brand Name"}
+    df._ipython_display_()
+    assert df.data_type["Brand Name"] == "nominal"
+    assert df.cardinality["Brand Name"] == len(df["Brand Name"].unique())
+    assert list(df.unique_values) == list(df.columns)
+    # recommendations that do not involve nominal attributes are kept
+    assert df.recommendation["Correlation"] is correlation
+    assert any(vis.get_attr_by_attr_name("Brand Name") for vis in df.recommendation["Occurrence"])
+    del df["Horsepower"]
+    df._ipython_display_()
+    assert "Horsepower" not in df.data_type
+    assert df.recommendation["Correlation"] is not correlation
+    expected = pd.read_csv("lux/data/car.csv")
+    expected["Brand Name"] = expected["Brand"] + " " + expected["Name"]
+    del expected["Horsepower"]
+    expected.maintain_metadata()
+    assert df.data_type == expected.data_type
+    assert df._min_max == expected._min_max
+    assert df.cardinality == expected.cardinality
+
+
+def test_metadata_eager_maintain(global_var):
+    lux.config.lazy_maintain = False
+    df = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+    df.maintain_metadata()
+    df["a"] = [4, 5, 6]
+    df.maintain_metadata()
+    assert df._min_max["a"] == (4, 6)
+    lux.config.lazy_maintain = True
+
+
+def test_metadata_lineage(global_var):
+    df = pd.read_csv("lux/data/car.csv")
+    df.maintain_metadata()
+
+    projected = df[["Horsepower", "Origin"]]
+    assert projected.lineage.operation == "projection"
+    expected = pd.read_csv("lux/data/car.csv")[["Horsepower", "Origin"]]
+    expected.maintain_metadata()
+    projected.maintain_metadata()
+    assert projected.data_type == expected.data_type
+    assert projected.cardinality == expected.cardinality
+    assert projected._min_max == expected._min_max
+    assert df.drop(columns=["Name"]).lineage.operation == "projection"
+
+    subset = df[df["Cylinders"] == 8]
+    assert subset.lineage.operation == "row subset"
+    subset.maintain_metadata()
+    assert subset.data_type["Cylinders"] == "nominal"
+    assert subset.cardinality["Cylinders"] == 1
+    assert subset.cardinality["Brand"] == len(subset["Brand"].unique())
+
+    # types that depend on the values (e.g., on the cardinality of numeric columns) are inferred
+    # again for the selected rows, the types of datetime columns and overridden types are kept
+    df["Year"] = pd.to_datetime(df["Year"], format="%Y")
+    df.set_data_type({"Weight": "nominal"})
+    df.maintain_metadata()
+    head = df.head(30)
+    assert head.lineage.data_type == {"Year": "temporal", "Weight": "nominal"}
+    head.maintain_metadata()
+    expected = pd.read_csv("lux/data/car.csv").head(30)
+    expected["Year"] = pd.to_datetime(expected["Year"], format="%Y")
+    expected.set_data_type({"Weight": "nominal"})
+    expected.maintain_metadata()
+    assert head.data_type == expected.data_type
+    assert head.data_type["MilesPerGal"] == "nominal"
+
+    # lineage no longer holds once the derived frame is modified
+    subset["Horsepower"] = subset["Horsepower"] * 2
+    assert subset.lineage is None
+
+
+def test_metadata_concat(global_var):
+    df = pd.read_csv("lux/data/car.csv")
+    df["Year"] = pd.to_datetime(df["Year"], format="%Y")
+    first, second = df.iloc[:200].copy(), df.iloc[200:].copy()
+    first.maintain_metadata()
+    second.maintain_metadata()
+    combined = pd.concat([first, second])
+    # statistics are merged from the parts, no column needs a scan
+    assert combined._dirty_columns == set()
+    combined.maintain_metadata()
+    expected = pd.read_csv("lux/data/car.csv")
+    expected["Year"] = pd.to_datetime(expected["Year"], format="%Y")
+    expected.maintain_metadata()
+    assert combined.data_type == expected.data_type
+    assert combined.unique_values == expected.unique_values
+    assert combined.cardinality == expected.cardinality
+    assert combined._min_max == expected._min_max
+    assert combined._null_count == expected._null_count
+    # columns lacking statistics in a part are recomputed
+    del second._null_count["Weight"]
+    assert pd.concat([first, second])._dirty_columns == {"Weight"}
+
+
+def test_fingerprint(global_var):
+    df = pd.read_csv("lux/data/car.csv")
+    fingerprint = df.fingerprint()
+    assert df.fingerprint() == fingerprint
+    assert df.copy().fingerprint() != fingerprint
+    df.loc[3, "Horsepower"] = 1
+    assert df.fingerprint() != fingerprint
+    fingerprint = df.fingerprint()
+    df["Brand"] = df["Brand"].str.upper()
+    assert df.fingerprint() != fingerprint
+    # writes to rows outside of the hashed sample are caught through the invalidation hooks
+    df = pd.DataFrame({"a": range(5000)})
+    fingerprint = df.fingerprint()
+    df.iloc[1, 0] = -1
+    assert df.fingerprint() != fingerprint
+
+
+def test_metadata_read_write_invalidation(global_var):
+    df = pd.read_csv("lux/data/car.csv")
+    df._ipython_display_()
+    lux.config.invalidations.reset()
+    df.Horsepower.mean()
+    df["Weight"].describe()
+    df.copy()
+    assert df._metadata_fresh == True, "Metadata should not be expired by read-only operations"
+    assert df._recs_fresh == True, "Recommendations should not be expired by read-only operations"
+    assert lux.config.invalidations.total == 0
+
+    df.Horsepower.fillna(0, inplace=True)
+    assert df._metadata_fresh == False, "Failed to expire metadata after writing to a column"
+    assert df._dirty_columns == {"Horsepower"}
+    df._ipython_display_()
+    df.loc[df["Origin"] == "USA", "Weight"] = 0
+    assert df._metadata_fresh == False, "Failed to expire metadata after writing through an indexer"
+    df._ipython_display_()
+    assert df._min_max["Weight"][0] == 0
+    assert lux.config.invalidations.counts == {"series write": 1, "indexer write": 1}
+
+
+def test_metadata_untracked_write(global_var, monkeypatch):
+    import sys
+
+    # pandas versions without write tracking compare the hash of the values instead
+    monkeypatch.setattr(sys.modules["lux.core.frame"], "PANDAS_WRITE_TRACKING", False)
+    df = pd.DataFrame({"a": [1.0, 2.0, 3.0], "b": ["x", "y", "z"]})
+    df.maintain_metadata()
+    df.maintain_metadata()
+    assert df._metadata_fresh == True, "Metadata should not be expired when the values are unchanged"
+    df["a"].to_numpy()[0] = 10.0
+    df.maintain_metadata()
+    assert df._min_max["a"] == (2.0, 10.0)
+
+    # only maintaining the metadata hashes the values, derived dataframes do not
+    digests = []
+    digest = type(df)._data_digest
+    monkeypatch.setattr(type(df), "_data_digest", lambda self: digests.append(1) or digest(self))
+    assert df[df["a"] > 2.0].lineage is not None
+    assert df[["a"]].lineage is not None
+    assert digests == []
+
+    # values that cannot be hashed leave the digest unknown, and the metadata is kept
+    monkeypatch.setattr(type(df), "_data_digest", lambda self: None)
+    df = pd.DataFrame({"a": [1.0, 2.0, 3.0], "b": ["x", "y", "z"]})
+    df.maintain_metadata()
+    assert not df._data_replaced(compare_values=True)
+    df.maintain_metadata()
+    assert df._metadata_fresh == True
+
+
 def test_intent_cleared_after_vis_data():
     df = pd.read_csv(
         "https://github.com/lux-org/lux-datasets/blob/master/data/real_estate_tutorial.csv?raw=true"
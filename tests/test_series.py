@@ -93,3 +93,30 @@ def test_unnamed_column():
     series.__repr__()
     exported_code_str = series.recommendation["Distribution"][0].to_altair()
     assert axis_title in exported_code_str, "Unnamed column should have 'Series' as placeholder"
+
+
+def test_series_shared_metadata():
+    df = pd.read_csv("lux/data/car.csv")
+    df.maintain_metadata()
+    weight = df["Weight"]
+    horsepower = df["Horsepower"]
+    # derived series point to the same snapshot of the dataframe's metadata
+    assert weight._metadata_snapshot is horsepower._metadata_snapshot
+    assert weight.cardinality == df.cardinality
+    assert weight._data_type == df._data_type
+
+    # attributes read from the snapshot are copies owned by the series
+    weight.cardinality["Weight"] = -1
+    assert df.cardinality["Weight"] != -1
+    assert horsepower.cardinality["Weight"] != -1
+
+    # reassigning an attribute of the dataframe rebuilds the snapshot shared afterwards
+    snapshot = df._share_metadata()
+    assert df._share_metadata() is snapshot
+    df._type_override = {"Weight": "nominal"}
+    assert df._share_metadata() is not snapshot
+    assert df._share_metadata().read("_type_override") == {"Weight": "nominal"}
+
+    series = pd.Series([1, 2, 3])
+    assert series._intent == [] and series._pandas_only == False
+    assert series.unique_values is None
@@ -383,3 +383,26 @@ def test_id_absenteeism_data():
         "Body mass index": "nominal",
         "Absenteeism time in hours": "nominal",
     }
+
+
+def test_parsed_columns_cached():
+    df = pd.DataFrame(
+        {
+            "date": ["2020-01-01", "2020-02-01", "2020-03-01", None, "2020-05-01"] * 20,
+            "amount": ["1.5", "2.5", "3.5", "4.5", None] * 20,
+            "label": ["a", "b", "c", "d", "e"] * 20,
+        }
+    )
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        df.maintain_metadata()
+    assert df.data_type == {"date": "temporal", "amount": "quantitative", "label": "nominal"}
+    # full-column conversions made during type inference are kept for reuse
+    assert pd.api.types.is_datetime64_any_dtype(df._parsed_columns["date"])
+    assert df._parsed_columns["amount"].dtype == "float64"
+    assert "label" not in df._parsed_columns
+    assert df._min_max["amount"] == (1.5, 4.5)
+
+    vis = lux.vis.Vis.Vis([lux.Clause("amount")], df)
+    assert vis.mark == "histogram"
+    assert vis.data["Number of Records"].sum() == 80
@@ -1,4 +1,15 @@
 import lux
+import numpy as np
+import pandas as pd
+from lux.utils.sketch_utils import (
+    HyperLogLog,
+    HeavyHitters,
+    is_exact_unique,
+    merge_unique_values,
+    sketch_column,
+)
+from lux.utils.unique_values import UniqueValues
+from lux.utils.binning_utils import cut_bin_codes, heatmap_cells, histogram_bin_codes
 
 
 class TestDebugUtils:
@@ -16,5 +27,106 @@ class TestDebugUtils:
         assert "altair" in versions
 
 
+class TestSketchUtils:
+    def test_hyperloglog_estimate(self):
+        for n in [10, 1000, 100000]:
+            sketch = HyperLogLog()
+            sketch.add_series(pd.Series(np.arange(n)))
+            assert abs(sketch.estimate() - n) <= 0.05 * n
+
+    def test_hyperloglog_merge(self):
+        left = HyperLogLog()
+        left.add_series(pd.Series(np.arange(0, 60000)))
+        right = HyperLogLog()
+        right.add_series(pd.Series(np.arange(30000, 90000)))
+        assert abs(left.merge(right).estimate() - 90000) <= 0.05 * 90000
+
+    def test_sketch_column(self):
+        series = pd.Series(["a"] * 50 + ["b"] * 30 + [str(i) for i in range(200)])
+        values, cardinality = sketch_column(series, threshold=1000, k=2)
+        assert is_exact_unique(values) and cardinality == 202
+        values, cardinality = sketch_column(series, threshold=100, k=2)
+        assert isinstance(values, HeavyHitters)
+        assert list(values) == ["a", "b"] and values.counts == [50, 30]
+        assert abs(cardinality - 202) <= 10
+        # an estimate larger than the column is capped by its number of (non-null) values
+        values, cardinality = sketch_column(series, threshold=100, k=2, cardinality=10**6)
+        assert isinstance(values, HeavyHitters) and cardinality == len(series)
+        with_nulls = pd.concat([series, pd.Series([None] * 20)], ignore_index=True)
+        values, cardinality = sketch_column(with_nulls, threshold=100, k=2, cardinality=10**6)
+        assert cardinality == len(series) + 1
+        # which makes small columns exact
+        values, cardinality = sketch_column(series, threshold=300, k=2, cardinality=10**6)
+        assert is_exact_unique(values) and cardinality == 202
+
+    def test_merge_unique_values(self):
+        merged = merge_unique_values([UniqueValues(np.array([3, 1])), UniqueValues(np.array([1, 2]))])
+        assert merged == [3, 1, 2]
+        assert merge_unique_values([UniqueValues(np.array([1])), HeavyHitters([1], 1000)]) is None
+
+
+class TestUniqueValues:
+    def test_list_compatibility(self):
+        values = UniqueValues(pd.Series([3, 1, 3, 2]).unique())
+        assert values == [3, 1, 2] and len(values) == 3
+        assert values[0] == 3 and values[1:] == [1, 2]
+        assert list(values) == [3, 1, 2] and sorted(values) == [1, 2, 3]
+        assert values * 2 == [3, 1, 2, 3, 1, 2]
+        assert list(np.array(values)) == [3, 1, 2]
+
+    def test_contains(self):
+        values = UniqueValues(pd.Series(["USA", "Japan", "USA", None]).unique())
+        assert "Japan" in values and "Europe" not in values
+        assert ["USA"] not in values
+        dates = UniqueValues(pd.date_range("2020-01-01", periods=3))
+        assert pd.Timestamp("2020-01-02") in dates
+
+
+class TestBinningUtils:
+    def test_histogram_bin_codes(self):
+        df = pd.DataFrame(
+            {
+                "a": [1.5, np.nan, 3.0, -np.inf, 7.25, 3.0, 10.0],
+                "b": [4, 4, 4, 4, 4, 4, 4],
+                "c": [0, 3, 5, 9, 10, 2, 1],
+            }
+        )
+        bin_codes = histogram_bin_codes(df, ["a", "b", "c"], 10)
+        for attr in df.columns:
+            finite = df[attr][np.isfinite(df[attr])]
+            counts, edges = np.histogram(finite, bins=10)
+            assert list(bin_codes[attr].counts()) == list(counts)
+            assert list(bin_codes[attr].edges) == list(edges)
+        assert bin_codes["a"].has_missing and not bin_codes["c"].has_missing
+
+    def test_cut_bin_codes(self):
+        series = pd.Series([0.5, 2.0, np.nan, 4.25, 8.0])
+        bin_codes = cut_bin_codes(series, 4)
+        expected = pd.cut(series, bins=4)
+        assert list(bin_codes.codes) == list(expected.cat.codes)
+        assert bin_codes.categories.equals(expected.cat.categories)
+
+    def test_heatmap_cells(self):
+        df = pd.DataFrame(
+            {
+                "x": [0.5, 2.0, 2.5, 4.25, 8.0, 7.5, np.nan],
+                "y": [1.0, 1.5, 9.0, 9.0, 3.0, 3.5, 2.0],
+                "color": ["a", "b", "b", "a", "c", "a", "a"],
+            }
+        )
+        cells = heatmap_cells(
+            cut_bin_codes(df["x"], 4), cut_bin_codes(df["y"], 4), df["color"], "nominal"
+        )
+        df["xBin"] = pd.cut(df["x"], bins=4)
+        df["yBin"] = pd.cut(df["y"], bins=4)
+        groups = df.groupby(["xBin", "yBin"], observed=True)["color"]
+        expected = groups.agg(lambda colors: colors.mode().iloc[0]).reset_index()
+        expected["count"] = groups.size().values
+        assert list(cells["count"]) == list(expected["count"])
+        assert list(cells["color"]) == list(expected["color"])
+        assert list(cells["xBinStart"]) == [interval.left for interval in expected["xBin"]]
+        assert list(cells["yBinEnd"]) == [interval.right for interval in expected["yBin"]]
+
+
 if __name__ == "__main__":
     TestDebugUtils().test_debug_info()